@@ -19,7 +19,7 @@ router = APIRouter(
 
 def get_index_document_port() -> IndexDocumentPort:
     """Dependency to provide the IndexDocumentPort."""
-    return index_document_port
+    return index_document_port()
 
 @router.post("/index_document")
 async def index_document(input_data: IndexDocumentsInputSchema,
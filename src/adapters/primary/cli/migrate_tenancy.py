@@ -0,0 +1,41 @@
+"""
+Tenancy migration tool.
+
+Copies the indexed documents of clients between the two Qdrant layouts: one collection per client
+({QDRANT_COLLECTION_NAME}_{client_id}) and one collection shared by all clients (QDRANT_COLLECTION_NAME),
+told apart by the client_id tenant index. Set QDRANT_SHARED_COLLECTION to match the target layout
+once the migration is done.
+
+Usage (from the src directory):
+    python -m adapters.primary.cli.migrate_tenancy --to shared
+    python -m adapters.primary.cli.migrate_tenancy --to collection --client-id client_1 --client-id client_2 --delete-source
+"""
+
+import argparse
+import logging
+import sys
+
+from infrastructure.di.container import qdrant_vectordb_repository
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--to", choices=["shared", "collection"], required=True, help="Target layout")
+    parser.add_argument("--client-id", action="append", dest="client_ids", help="Client to migrate, all clients if not given (repeatable)")
+    parser.add_argument("--delete-source", action="store_true", help="Delete the source points once all of them were copied")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    copied = qdrant_vectordb_repository().migrate_tenancy(
+        shared=args.to == "shared",
+        client_ids=args.client_ids,
+        delete_source=args.delete_source,
+    )
+    for client_id, count in sorted(copied.items()):
+        print(f"{client_id}: {count} points")
+    print(f"{sum(copied.values())} points of {len(copied)} clients copied")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from celery import Celery
+from celery.signals import worker_process_init
 import os
 import json
 import logging
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Path
 from fastapi.responses import JSONResponse
 
@@ -14,6 +16,7 @@ from core.ports.primary.index_document import IndexDocumentPort
 from core.entities import InputFile, Client, IndexDocumentStatus
 
 from infrastructure.di.container import index_document_port
+from infrastructure.frameworks.marker_module import marker_model_manager
 
 # def get_index_document_port() -> IndexDocumentPort:
 #     """Dependency to provide the IndexDocumentPort."""
@@ -25,11 +28,35 @@ app = Celery(
     backend=os.getenv("CELERY_RESULT_BACKEND")
 )
 
+# Queue consumed by the workers dedicated to OCR, which hold the Marker models in memory
+OCR_QUEUE = os.getenv("CELERY_OCR_QUEUE")
+
+
+@worker_process_init.connect
+def preload_ocr_models(**kwargs):
+    """Load the Marker models when a worker process starts, so that the first OCR job does not pay for it."""
+    if os.getenv("MARKER_PRELOAD", "").lower() in ("1", "true"):
+        marker_model_manager.acquire()
+        marker_model_manager.release()
+
+
+def get_index_document_queue(input_file: InputFile) -> Optional[str]:
+    """Return the queue of the OCR workers for OCR jobs if configured, or None for the default queue."""
+    read_file_config = input_file.read_file_config
+    if isinstance(read_file_config, dict):
+        force_ocr = read_file_config.get("force_ocr", False)
+    else:
+        force_ocr = getattr(read_file_config, "force_ocr", False)
+    if OCR_QUEUE and force_ocr:
+        return OCR_QUEUE
+    return None
+
+
 @app.task(name="index_document_task")
 def index_document_task(id: str, client: dict, input_file: dict) -> None:
     client = Client(**client)
     input_file = InputFile(**input_file)
-    status = index_document_port.index_document(client, input_file)
+    status = index_document_port().index_document(client, input_file)
     handle_callback(id, status)
     return
     
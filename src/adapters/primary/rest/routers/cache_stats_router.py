@@ -0,0 +1,32 @@
+import logging
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from infrastructure.di.container import embedding_service, answer_cache_service, hybrid_retrieve_service
+
+router = APIRouter(
+    prefix="/cache_stats",
+    tags=["cache_stats"]
+)
+
+@router.get("/get_cache_stats")
+async def get_cache_stats():
+    """
+    Retrieve the hit/miss counters of the embedding, answer and retrieval caches of this process.
+
+    Returns:
+        dict: The stats of each cache, with its hit rate and the stats of its backend.
+    """
+    try:
+        stats = {
+            "embedding": embedding_service().get_stats(),
+            "answer": answer_cache_service().get_stats(),
+            "retrieval": hybrid_retrieve_service().get_stats(),
+        }
+        return JSONResponse(content=stats, status_code=200)
+    except Exception as e:
+        logging.exception(f"Error retrieving cache stats: {e}")
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=500
+        )
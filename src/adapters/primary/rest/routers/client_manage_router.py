@@ -16,7 +16,7 @@ router = APIRouter(
 
 def get_client_manage_port() -> ClientManagePort:
     """Dependency to provide the ClientManagePort."""
-    return client_manage_port
+    return client_manage_port()
 
 @router.post("/create_client")
 async def create_client(
@@ -1,10 +1,12 @@
 
 import os
+import json
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from adapters.primary.rest.schemas import RAGInputSchema, RAGOutputSchema
+from core.entities import RagStreamEvent
 from core.ports.primary.generate_response import GenerateResponsePort
 
 from infrastructure.di.container import generate_response_port
@@ -17,7 +19,7 @@ router = APIRouter(
 
 def get_generate_response_port() -> GenerateResponsePort:
     """Dependency to provide the GenerateResponsePort."""
-    return generate_response_port
+    return generate_response_port()
 
 
 @router.post("/generate_response")
@@ -35,7 +37,7 @@ async def generate_response(
         RAGOutputSchema: The output schema containing the generated response and citations.
     """
     try:
-        rag_response = generate_response_port.generate_response(
+        rag_response = await generate_response_port.agenerate_response(
             messages=rag_input.messages,
             client=rag_input.client,
             rag_config=rag_input.rag_config
@@ -47,4 +49,43 @@ async def generate_response(
         return JSONResponse(
             content={"error": str(e)},
             status_code=500
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/stream_response")
+async def stream_response(
+    rag_input: RAGInputSchema,
+    generate_response_port: GenerateResponsePort = Depends(get_generate_response_port)
+):
+    """
+    Generate a response based on the input messages, streamed as Server-Sent Events.
+
+    Args:
+        rag_input (RAGInputSchema): The input schema containing messages and client information.
+
+    Returns:
+        StreamingResponse: A text/event-stream of searching, token, citations and done events,
+        or an error event if the generation fails.
+    """
+    async def event_stream():
+        try:
+            async for event in generate_response_port.astream_response(
+                messages=rag_input.messages,
+                client=rag_input.client,
+                rag_config=rag_input.rag_config
+            ):
+                yield format_sse(event)
+        except Exception as e:
+            logging.exception(f"Error streaming response: {e}")
+            yield format_sse(RagStreamEvent(event="error", data={"error": str(e)}))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def format_sse(event: RagStreamEvent) -> str:
+    """Format an event as a Server-Sent Events message."""
+    return f"event: {event.event}\ndata: {json.dumps(event.data, ensure_ascii=False)}\n\n"
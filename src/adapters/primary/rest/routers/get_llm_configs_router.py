@@ -16,7 +16,7 @@ router = APIRouter(
 
 def get_get_llm_configs_port() -> GetLLMConfigsPort:
     """Dependency to provide the GetLLMConfigsPort."""
-    return openai_llm_service
+    return openai_llm_service()
 
 @router.get("/get_llm_config_keys")
 async def get_llm_config_keys(
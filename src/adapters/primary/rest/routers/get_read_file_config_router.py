@@ -19,7 +19,7 @@ def get_get_read_file_config_port() -> GetReadFileConfigPort:
     Dependency to get the GetReadFileConfigPort instance.
     This can be replaced with a more complex dependency injection mechanism if needed.
     """
-    return get_read_file_config_port
+    return get_read_file_config_port()
 
 @router.get("/get_read_file_config")
 async def get_read_file_config(
@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from celery import chain
 
 
-from adapters.primary.rest.celery_tasks.index_document_task import index_document_task
+from adapters.primary.rest.celery_tasks.index_document_task import index_document_task, get_index_document_queue
 from adapters.primary.rest.schemas import IndexDocumentsInputSchema, IndexDocumentsOutputSchema, IndexDocumentsBackgroundInputSchema, IndexDocumentsBackgroundOutputSchema
 from core.ports.primary.index_document import IndexDocumentPort
 
@@ -19,7 +19,7 @@ router = APIRouter(
 
 def get_index_document_port() -> IndexDocumentPort:
     """Dependency to provide the IndexDocumentPort."""
-    return index_document_port
+    return index_document_port()
 
 @router.post("/index_document")
 async def index_document(input_data: IndexDocumentsInputSchema,
@@ -35,7 +35,7 @@ async def index_document(input_data: IndexDocumentsInputSchema,
     """
     try:
         # print(input_data.model_dump_json(indent=2))
-        statuses = index_document_port.index_documents(
+        statuses = await index_document_port.aindex_documents(
             client=input_data.client,
             input_files=input_data.input_files
         )
@@ -67,7 +67,10 @@ async def index_document_background(input_data: IndexDocumentsBackgroundInputSch
         assert len(ids) == len(input_files), "Number of IDs must match number of input files"
         
         for id, input_file in zip(ids, input_files):
-            index_document_task.delay(id, client.model_dump(), input_file.model_dump())
+            index_document_task.apply_async(
+                args=(id, client.model_dump(), input_file.model_dump()),
+                queue=get_index_document_queue(input_file)
+            )
         
         return JSONResponse(
             content={"message": "Indexing started in the background", "task_ids": ids},
@@ -0,0 +1,10 @@
+
+from .in_memory_cache_repository import InMemoryLRUCacheRepositoryImpl
+from .redis_cache_repository import RedisCacheRepositoryImpl
+from .tiered_cache_repository import TieredCacheRepositoryImpl
+
+__all__ = [
+    "InMemoryLRUCacheRepositoryImpl",
+    "RedisCacheRepositoryImpl",
+    "TieredCacheRepositoryImpl"
+]
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from core.ports.secondary.repositories import CacheRepository
+
+
+class InMemoryLRUCacheRepositoryImpl(CacheRepository):
+    """In-process cache bounded by a number of entries, evicting the least recently used entry first."""
+
+    def __init__(self, max_entries: int = 10000, default_ttl: Optional[int] = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        # key -> (value, expiration timestamp or None), ordered from least to most recently used
+        self._entries: OrderedDict[str, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the value stored under a key, or None if it is missing or expired."""
+        with self._lock:
+            return self._get(key)
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get the values stored under several keys, with None for missing keys."""
+        with self._lock:
+            return [self._get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value under a key, expiring after ttl seconds if given."""
+        with self._lock:
+            self._set(key, value, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values, expiring after ttl seconds if given."""
+        with self._lock:
+            for key, value in items.items():
+                self._set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete the value stored under a key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and size information of the cache."""
+        with self._lock:
+            return {
+                "backend": "in_memory",
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously get the value stored under a key."""
+        return self.get(key)
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Asynchronously get the values stored under several keys."""
+        return self.get_many(keys)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Asynchronously store a value under a key."""
+        self.set(key, value, ttl)
+
+    async def aset_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Asynchronously store several values."""
+        self.set_many(items, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete the value stored under a key."""
+        self.delete(key)
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Get a value and mark it as most recently used. Must be called with the lock held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _set(self, key: str, value: Any, ttl: Optional[int]) -> None:
+        """Store a value and evict the least recently used entries. Must be called with the lock held."""
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,138 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from core.ports.secondary.repositories import CacheRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheRepositoryImpl(CacheRepository):
+    """
+    Redis cache shared by all processes. Values are stored as JSON under a key prefix.
+
+    Size is bounded by the TTL of the entries and by the maxmemory policy of the Redis server.
+    Redis errors are logged and treated as cache misses so the cache never breaks the caller.
+    """
+
+    def __init__(self, redis_url: str, prefix: str = "cache:", default_ttl: Optional[int] = None):
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.redis_client = redis.Redis.from_url(redis_url)
+        self.async_redis_client = aioredis.Redis.from_url(redis_url)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the value stored under a key, or None if it is missing or expired."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get the values stored under several keys, with None for missing keys."""
+        if not keys:
+            return []
+        try:
+            raw_values = self.redis_client.mget([self.prefix + key for key in keys])
+        except redis.RedisError as e:
+            logger.warning(f"Error reading from Redis cache: {e}")
+            self._count(errors=1, misses=len(keys))
+            return [None] * len(keys)
+        return self._decode_values(raw_values)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value under a key, expiring after ttl seconds if given."""
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values in one round trip, expiring after ttl seconds if given."""
+        if not items:
+            return
+        ttl = ttl if ttl is not None else self.default_ttl
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipeline.set(self.prefix + key, json.dumps(value), ex=ttl)
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Error writing to Redis cache: {e}")
+            self._count(errors=1)
+
+    def delete(self, key: str) -> None:
+        """Delete the value stored under a key."""
+        try:
+            self.redis_client.delete(self.prefix + key)
+        except redis.RedisError as e:
+            logger.warning(f"Error deleting from Redis cache: {e}")
+            self._count(errors=1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters of this process."""
+        with self._lock:
+            return {
+                "backend": "redis",
+                "hits": self._hits,
+                "misses": self._misses,
+                "errors": self._errors,
+            }
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously get the value stored under a key."""
+        return (await self.aget_many([key]))[0]
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Asynchronously get the values stored under several keys."""
+        if not keys:
+            return []
+        try:
+            raw_values = await self.async_redis_client.mget([self.prefix + key for key in keys])
+        except redis.RedisError as e:
+            logger.warning(f"Error reading from Redis cache: {e}")
+            self._count(errors=1, misses=len(keys))
+            return [None] * len(keys)
+        return self._decode_values(raw_values)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Asynchronously store a value under a key."""
+        await self.aset_many({key: value}, ttl)
+
+    async def aset_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Asynchronously store several values in one round trip."""
+        if not items:
+            return
+        ttl = ttl if ttl is not None else self.default_ttl
+        try:
+            pipeline = self.async_redis_client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipeline.set(self.prefix + key, json.dumps(value), ex=ttl)
+            await pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Error writing to Redis cache: {e}")
+            self._count(errors=1)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete the value stored under a key."""
+        try:
+            await self.async_redis_client.delete(self.prefix + key)
+        except redis.RedisError as e:
+            logger.warning(f"Error deleting from Redis cache: {e}")
+            self._count(errors=1)
+
+    def _decode_values(self, raw_values: List[Optional[bytes]]) -> List[Optional[Any]]:
+        """Decode the JSON values read from Redis and count hits and misses."""
+        values = [json.loads(raw_value) if raw_value is not None else None for raw_value in raw_values]
+        hits = sum(value is not None for value in values)
+        self._count(hits=hits, misses=len(values) - hits)
+        return values
+
+    def _count(self, hits: int = 0, misses: int = 0, errors: int = 0) -> None:
+        """Update the counters."""
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            self._errors += errors
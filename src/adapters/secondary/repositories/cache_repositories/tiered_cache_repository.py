@@ -0,0 +1,98 @@
+from typing import Any, Dict, List, Optional
+
+from core.ports.secondary.repositories import CacheRepository
+
+
+class TieredCacheRepositoryImpl(CacheRepository):
+    """
+    Cache composed of tiers ordered from fastest to slowest, e.g. an in-process LRU in front of Redis.
+
+    Reads go through the tiers in order and values found in a slower tier are copied into the
+    faster ones. Writes and deletes go to every tier.
+    """
+
+    def __init__(self, tiers: List[CacheRepository]):
+        self.tiers = tiers
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the value stored under a key from the fastest tier holding it."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get the values stored under several keys from the fastest tiers holding them."""
+        values = [None] * len(keys)
+        missing = list(range(len(keys)))
+        for i, tier in enumerate(self.tiers):
+            if not missing:
+                break
+            tier_values = tier.get_many([keys[j] for j in missing])
+            found = {}
+            for j, value in zip(missing, tier_values):
+                if value is not None:
+                    values[j] = value
+                    found[keys[j]] = value
+            if found:
+                for faster_tier in self.tiers[:i]:
+                    faster_tier.set_many(found)
+            missing = [j for j in missing if values[j] is None]
+        return values
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value in every tier."""
+        for tier in self.tiers:
+            tier.set(key, value, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values in every tier."""
+        for tier in self.tiers:
+            tier.set_many(items, ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete the value stored under a key from every tier."""
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the stats of every tier."""
+        return {
+            "backend": "tiered",
+            "tiers": [tier.get_stats() for tier in self.tiers],
+        }
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously get the value stored under a key from the fastest tier holding it."""
+        return (await self.aget_many([key]))[0]
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Asynchronously get the values stored under several keys from the fastest tiers holding them."""
+        values = [None] * len(keys)
+        missing = list(range(len(keys)))
+        for i, tier in enumerate(self.tiers):
+            if not missing:
+                break
+            tier_values = await tier.aget_many([keys[j] for j in missing])
+            found = {}
+            for j, value in zip(missing, tier_values):
+                if value is not None:
+                    values[j] = value
+                    found[keys[j]] = value
+            if found:
+                for faster_tier in self.tiers[:i]:
+                    await faster_tier.aset_many(found)
+            missing = [j for j in missing if values[j] is None]
+        return values
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Asynchronously store a value in every tier."""
+        for tier in self.tiers:
+            await tier.aset(key, value, ttl)
+
+    async def aset_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Asynchronously store several values in every tier."""
+        for tier in self.tiers:
+            await tier.aset_many(items, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete the value stored under a key from every tier."""
+        for tier in self.tiers:
+            await tier.adelete(key)
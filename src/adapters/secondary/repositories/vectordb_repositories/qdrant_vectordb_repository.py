@@ -1,22 +1,85 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, TypeVar, Union
 
-from qdrant_client import QdrantClient
+import grpc
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 from qdrant_client.http.models import (
     FieldCondition,
     Filter,
+    FilterSelector,
+    Fusion,
+    FusionQuery,
+    HnswConfigDiff,
+    KeywordIndexParams,
+    KeywordIndexType,
+    MatchAny,
+    MatchValue,
+    Modifier,
+    PayloadSchemaType,
+    PointIdsList,
     PointStruct,
+    Prefetch,
     Range,
-    SearchRequest,
+    Rrf,
+    RrfQuery,
+    SetPayload,
+    SetPayloadOperation,
+    SparseVectorParams,
 )
+from qdrant_client.http.models import SparseVector as QdrantSparseVector
 from qdrant_client.models import Distance
 
 from core.ports.secondary.repositories import VectorDBRepository
 from core.ports.secondary.services.embedding_service import EmbeddingService
-from core.entities import DocumentWithVector, Client, SearchQueryWithVector
+from core.entities import Document, DocumentWithVector, Client, SearchQueryWithVector, FileManifest, UpsertReport, UpsertBatchError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Errors worth retrying: the request may succeed once Qdrant is reachable or less loaded again.
+# Every retried operation is idempotent (point ids are deterministic, deletes and payload updates target ids).
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_GRPC_CODES = {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.RESOURCE_EXHAUSTED}
+
+
+# Namespace of the point ids in the shared collection, where chunk ids are only unique per client
+TENANT_POINT_ID_NAMESPACE = uuid.UUID("d8e5aa75-5f09-4926-8b03-e2f638abbff8")
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Return whether a Qdrant error is transient, for both the REST and the gRPC transports."""
+    if isinstance(error, ResponseHandlingException):  # Connection errors and client side timeouts
+        return True
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    if isinstance(error, grpc.RpcError):
+        return error.code() in RETRYABLE_GRPC_CODES
+    return False
+
+
+def _is_already_exists_error(error: Exception) -> bool:
+    """Return whether an error reports that the collection being created already exists."""
+    if isinstance(error, grpc.RpcError) and error.code() == grpc.StatusCode.ALREADY_EXISTS:
+        return True
+    return "already exists" in str(error).lower()
+
+
+def _is_not_found_error(error: Exception) -> bool:
+    """Return whether an error reports that the collection does not exist."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    if isinstance(error, grpc.RpcError):
+        return error.code() == grpc.StatusCode.NOT_FOUND
+    return "not found" in str(error).lower()
+
 
 class QdrantVectorDBRepositoryImpl(VectorDBRepository):
     """Qdrant implementation of the VectorRepository interface."""
@@ -26,50 +89,270 @@ class QdrantVectorDBRepositoryImpl(VectorDBRepository):
         embedding_service: EmbeddingService,
         qdrant_client: QdrantClient,
         collection_name: str,
+        async_qdrant_client: Optional[AsyncQdrantClient] = None,
+        scroll_batch_size: int = 1000,
+        sparse_vector_name: str = "bm25",
+        hybrid_prefetch_multiplier: int = 4,
+        retrieved_payload_fields: Optional[List[str]] = None,
+        search_timeout: Optional[int] = None,
+        write_timeout: Optional[int] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.2,
+        retry_max_delay: float = 5.0,
+        collection_registry_ttl: float = 300.0,
+        upsert_batch_size: int = 256,
+        max_in_flight_upserts: int = 4,
+        shared_collection: bool = False,
+        payload_indexed_fields: Optional[List[str]] = None,
     ):
         self.embedding_service = embedding_service
         self.qdrant_client = qdrant_client
+        self.async_qdrant_client = async_qdrant_client
         self.collection_name = collection_name
+        self.scroll_batch_size = scroll_batch_size  # Number of points fetched per request when building file manifests
+        self.sparse_vector_name = sparse_vector_name  # Name of the sparse (BM25) vector, next to the unnamed dense vector
+        self.hybrid_prefetch_multiplier = hybrid_prefetch_multiplier  # Candidates fetched by each search before fusion, per result
+        # Payload fields returned by searches, the rest of the payload (hashes, client id...) is not transferred
+        self.retrieved_payload_fields = retrieved_payload_fields or ["id", "content", "file_name", "file_path", "page_number", "metadata"]
+        self.search_timeout = search_timeout  # Seconds allowed to searches and scrolls, None for the client default
+        self.write_timeout = write_timeout  # Seconds allowed to upserts, deletes and payload updates, None for the client default
+        self.max_retries = max_retries  # Retries of transient errors, with exponential backoff and full jitter
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.collection_registry_ttl = collection_registry_ttl  # Seconds a collection is known to exist without asking Qdrant again
+        self.upsert_batch_size = upsert_batch_size  # Number of points per upsert request
+        self.max_in_flight_upserts = max_in_flight_upserts  # Number of upsert requests sent in parallel
+        # Whether all clients share the collection collection_name, told apart by the client_id tenant index,
+        # instead of each client having its own collection {collection_name}_{client_id}
+        self.shared_collection = shared_collection
+        # Payload fields indexed as keywords in every collection, next to client_id and page_number
+        self.payload_indexed_fields = payload_indexed_fields or ["file_path", "file_name", "metadata.file_type"]
+        # Expiry time of each collection known to exist, so that inserts make no existence check round trip
+        self._known_collections: Dict[str, float] = {}
+        # Whether each collection has the sparse vector, collections created before hybrid search do not
+        self._sparse_vector_support: Dict[str, bool] = {}
+        # Collections whose payload indexes were created or checked by this process
+        self._indexed_collections: Set[str] = set()
+
+    def _get_retry_delay(self, attempt: int) -> float:
+        """Get the delay before a retry, with full jitter so that concurrent callers do not retry in lockstep."""
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+
+    def _call_with_retry(self, operation: Callable[..., T], **kwargs) -> T:
+        """Call a Qdrant client operation, retrying transient errors."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return operation(**kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable_error(e):
+                    raise
+                delay = self._get_retry_delay(attempt)
+                logger.warning(f"Qdrant {operation.__name__} failed ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+
+    async def _acall_with_retry(self, operation: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """Asynchronously call a Qdrant client operation, retrying transient errors."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await operation(**kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable_error(e):
+                    raise
+                delay = self._get_retry_delay(attempt)
+                logger.warning(f"Qdrant {operation.__name__} failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def _get_collection_id(self, client_id: str, shared: Optional[bool] = None) -> str:
+        """Get the collection holding the points of a client, in the configured layout unless shared is given."""
+        if self.shared_collection if shared is None else shared:
+            return self.collection_name
+        return f"{self.collection_name}_{client_id}"
+
+    def _is_shared_collection(self, collection_id: str) -> bool:
+        """Return whether a collection is the one shared by all clients."""
+        return collection_id == self.collection_name
+
+    def _get_point_id(self, client_id: str, document_id: str, shared: Optional[bool] = None) -> str:
+        """
+        Get the id of the point of a document.
+
+        Chunk ids are derived from file paths, which different clients may share, so points of the
+        shared collection get ids derived from the client id as well. The chunk id stays in the payload.
+        """
+        if self.shared_collection if shared is None else shared:
+            return str(uuid.uuid5(TENANT_POINT_ID_NAMESPACE, f"{client_id}:{document_id}"))
+        return str(document_id)
+
+    def _is_collection_known(self, collection_id: str) -> bool:
+        """Return whether the collection is known to exist, without any request to Qdrant."""
+        expires_at = self._known_collections.get(collection_id)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def _remember_collection(self, collection_id: str) -> None:
+        """Register the collection as existing for collection_registry_ttl seconds."""
+        self._known_collections[collection_id] = time.monotonic() + self.collection_registry_ttl
+
+    def _forget_collection(self, collection_id: str) -> None:
+        """Drop what is known about the collection, after it was deleted or found missing."""
+        self._known_collections.pop(collection_id, None)
+        self._sparse_vector_support.pop(collection_id, None)
+        self._indexed_collections.discard(collection_id)
 
     def _check_collection_exists(self, collection_id: str) -> bool:
-        """Check if the collection exists in Qdrant."""
+        """Check if the collection exists, asking Qdrant only if it is not registered as existing."""
+        if self._is_collection_known(collection_id):
+            return True
         try:
             exists = self.qdrant_client.collection_exists(collection_id)
-            return exists
         except Exception as e:
             logger.error(f"Error checking collection existence: {e}")
             return False
+        if exists:
+            self._remember_collection(collection_id)
+        return exists
 
     def _create_collection(self, collection_id: str) -> bool:
-        """Create a collection in Qdrant if it doesn't exist."""
+        """
+        Create a collection in Qdrant if it doesn't exist.
+
+        Safe to call concurrently from several processes: a collection created by another
+        worker in the meantime is kept as is, never recreated.
+        """
+        if self._check_collection_exists(collection_id):
+            self._create_payload_indexes(collection_id)
+            return True
         try:
-            if self._check_collection_exists(collection_id):
-                logger.info(
-                    f"Collection {collection_id} already exists.")
-                return True
             vector_dimensions = self.embedding_service.get_embedding_dimension()
-            self.qdrant_client.recreate_collection(
+            self.qdrant_client.create_collection(
                 collection_name=collection_id,
-                vectors_config={
-                    "size": vector_dimensions,
-                    "distance": Distance.COSINE,  # Distance metric
-                },
+                **self._build_collection_config(collection_id, vector_dimensions),
             )
+            self._sparse_vector_support[collection_id] = True
+        except Exception as e:
+            if not _is_already_exists_error(e):
+                raise Exception(f"Error creating collection: {e}")
+            logger.info(f"Collection {collection_id} already exists.")
+        self._remember_collection(collection_id)
+        self._create_payload_indexes(collection_id)
+        return True
+
+    def _create_payload_indexes(self, collection_id: str) -> None:
+        """Create, once per process, the keyword indexes of client_id and payload_indexed_fields."""
+        if collection_id in self._indexed_collections:
+            return
+        # Marked first, so that a failure is logged once instead of on every write
+        self._indexed_collections.add(collection_id)
+        for field_name, field_schema in self._build_payload_indexes(collection_id).items():
+            try:
+                self.qdrant_client.create_payload_index(
+                    collection_name=collection_id, field_name=field_name, field_schema=field_schema,
+                    timeout=self.write_timeout,
+                )
+            except Exception as e:
+                logger.error(f"Error creating the payload index of {field_name} in {collection_id}: {e}")
+
+    async def _acheck_collection_exists(self, collection_id: str) -> bool:
+        """Asynchronously check if the collection exists, asking Qdrant only if it is not registered as existing."""
+        if self._is_collection_known(collection_id):
+            return True
+        try:
+            exists = await self.async_qdrant_client.collection_exists(collection_id)
+        except Exception as e:
+            logger.error(f"Error checking collection existence: {e}")
+            return False
+        if exists:
+            self._remember_collection(collection_id)
+        return exists
+
+    async def _acreate_collection(self, collection_id: str) -> bool:
+        """Asynchronously create a collection in Qdrant if it doesn't exist, keeping one created concurrently by another worker."""
+        if await self._acheck_collection_exists(collection_id):
+            await self._acreate_payload_indexes(collection_id)
             return True
+        try:
+            vector_dimensions = await self.embedding_service.aget_embedding_dimension()
+            await self.async_qdrant_client.create_collection(
+                collection_name=collection_id,
+                **self._build_collection_config(collection_id, vector_dimensions),
+            )
+            self._sparse_vector_support[collection_id] = True
+        except Exception as e:
+            if not _is_already_exists_error(e):
+                raise Exception(f"Error creating collection: {e}")
+            logger.info(f"Collection {collection_id} already exists.")
+        self._remember_collection(collection_id)
+        await self._acreate_payload_indexes(collection_id)
+        return True
+
+    async def _acreate_payload_indexes(self, collection_id: str) -> None:
+        """Asynchronously create, once per process, the keyword indexes of client_id and payload_indexed_fields."""
+        if collection_id in self._indexed_collections:
+            return
+        # Marked first, so that a failure is logged once instead of on every write
+        self._indexed_collections.add(collection_id)
+        for field_name, field_schema in self._build_payload_indexes(collection_id).items():
+            try:
+                await self.async_qdrant_client.create_payload_index(
+                    collection_name=collection_id, field_name=field_name, field_schema=field_schema,
+                    timeout=self.write_timeout,
+                )
+            except Exception as e:
+                logger.error(f"Error creating the payload index of {field_name} in {collection_id}: {e}")
+
+    def _upsert_points(self, collection_id: str, points: List[PointStruct], wait: bool = True) -> None:
+        """Upsert points, recreating the collection once if it was deleted since it was registered."""
+        try:
+            self._call_with_retry(
+                self.qdrant_client.upsert,
+                collection_name=collection_id, points=points, wait=wait, timeout=self.write_timeout
+            )
+        except Exception as e:
+            if not _is_not_found_error(e):
+                raise
+            self._forget_collection(collection_id)
+            self._create_collection(collection_id)
+            self._call_with_retry(
+                self.qdrant_client.upsert,
+                collection_name=collection_id, points=points, wait=wait, timeout=self.write_timeout
+            )
+
+    async def _aupsert_points(self, collection_id: str, points: List[PointStruct], wait: bool = True) -> None:
+        """Asynchronously upsert points, recreating the collection once if it was deleted since it was registered."""
+        try:
+            await self._acall_with_retry(
+                self.async_qdrant_client.upsert,
+                collection_name=collection_id, points=points, wait=wait, timeout=self.write_timeout
+            )
         except Exception as e:
-            raise Exception(f"Error creating collection: {e}")
+            if not _is_not_found_error(e):
+                raise
+            self._forget_collection(collection_id)
+            await self._acreate_collection(collection_id)
+            await self._acall_with_retry(
+                self.async_qdrant_client.upsert,
+                collection_name=collection_id, points=points, wait=wait, timeout=self.write_timeout
+            )
 
     def create_collection(self, client: Client) -> bool:
-        return self._create_collection(f"{self.collection_name}_{client.id}")
+        return self._create_collection(self._get_collection_id(client.id))
     
     def delete_collection(self, client_id: str) -> bool:
-        """Delete a collection from the vector database."""
+        """Delete the collection of a client, or its points in the shared collection."""
         try:
-            collection_id = f"{self.collection_name}_{client_id}"
+            collection_id = self._get_collection_id(client_id)
             if not self._check_collection_exists(collection_id):
                 logger.info(f"Collection {collection_id} does not exist.")
                 return False
+            if self._is_shared_collection(collection_id):
+                # Other clients live in the shared collection, only the points of this one are deleted
+                self.qdrant_client.delete(
+                    collection_name=collection_id,
+                    points_selector=self._build_client_selector([client_id]),
+                    timeout=self.write_timeout,
+                )
+                return True
             self.qdrant_client.delete_collection(collection_name=collection_id)
+            self._forget_collection(collection_id)
             return True
         except Exception as e:
             raise Exception(f"Error deleting collection: {e}")
@@ -79,19 +362,16 @@ class QdrantVectorDBRepositoryImpl(VectorDBRepository):
     ) -> DocumentWithVector:
         """Save a document with its vector representation."""
         try:
-            collection_id = f"{self.collection_name}_{client.id}"
+            collection_id = self._get_collection_id(client.id)
             # Ensure the collection exists
             self._create_collection(collection_id)
 
             # Upsert the document into Qdrant
-            point = PointStruct(
-                id=document.id,
-                vector=document.vector,
-                payload=self._build_payload(document, client),
-            )
-            self.qdrant_client.upsert(
-                collection_name=collection_id, points=[point]
+            point = self._build_point(
+                document, client,
+                with_sparse_vector=bool(document.sparse_vector) and self._supports_sparse_vectors(collection_id),
             )
+            self._upsert_points(collection_id, [point])
             return document
         except Exception as e:
             # logger.error(f"Error inserting document: {e}")
@@ -101,104 +381,505 @@ class QdrantVectorDBRepositoryImpl(VectorDBRepository):
     def insert_documents(
         self, client: Client, documents: List[DocumentWithVector]
     ) -> List[DocumentWithVector]:
-        """Insert multiple documents into the vector database."""
-        try:
-            collection_id = f"{self.collection_name}_{client.id}"
-            # Ensure the collection exists
-            self._create_collection(collection_id)
+        """Insert multiple documents into the vector database, raising if any batch could not be upserted."""
+        report = self.upsert_documents(client, documents)
+        if report.errors:
+            raise Exception(f"Error inserting documents: {len(report.errors)} batches failed, first error: {report.errors[0].error}")
+        return documents
 
-            points = [
-                PointStruct(
-                    id=document.id,
-                    vector=document.vector,
-                    payload=self._build_payload(document, client),
-                )
-                for document in documents
-            ]
-            self.qdrant_client.upsert(
-                collection_name=collection_id, points=points
-            )
-            return documents
-        except Exception as e:
-            raise e
+    def upsert_documents(
+        self, client: Client, documents: Iterable[DocumentWithVector]
+    ) -> UpsertReport:
+        """
+        Upsert a stream of documents in batches of upsert_batch_size, sending up to max_in_flight_upserts batches in parallel.
+
+        Batches are sent with wait=False, so Qdrant acknowledges them once they are in its write-ahead log.
+        The last batch is held back until the others are acknowledged and sent with wait=True, so that
+        all of them are applied when this returns. Only the batches in flight are held in memory.
+        """
+        collection_id = self._get_collection_id(client.id)
+        self._create_collection(collection_id)
+        report = UpsertReport()
+        in_flight: Deque[tuple[int, List[DocumentWithVector], Future]] = deque()
+        last_batch = None
+        with ThreadPoolExecutor(max_workers=self.max_in_flight_upserts) as executor:
+            for batch in self._iter_batches(documents):
+                if last_batch is not None:
+                    if len(in_flight) >= self.max_in_flight_upserts:
+                        self._record_upsert(report, *in_flight.popleft())
+                    future = executor.submit(self._try_upsert_batch, collection_id, client, last_batch, False)
+                    in_flight.append((report.batch_count, last_batch, future))
+                    report.batch_count += 1
+                last_batch = batch
+            while in_flight:
+                self._record_upsert(report, *in_flight.popleft())
+        if last_batch is not None:
+            error = self._try_upsert_batch(collection_id, client, last_batch, True)
+            self._record_upsert_result(report, report.batch_count, last_batch, error)
+            report.batch_count += 1
+        return report
     
     def retrieve_documents(
-        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20
-    ) -> List[DocumentWithVector]:
-        """Find documents by their vector representation."""
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Find documents by their vector representation, fetching their vectors only if with_vectors is set."""
         try:
-            collection_id = f"{self.collection_name}_{client.id}"
-            response = self.qdrant_client.query_points(
+            collection_id = self._get_collection_id(client.id)
+            response = self._call_with_retry(
+                self.qdrant_client.query_points,
                 collection_name=collection_id,
                 query=search_query.vector,
                 limit=limit,
-                query_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="client_id",
-                            match={
-                                "value": client.id})]),
-                with_payload=True,
-                with_vectors=True,
+                query_filter=self._build_search_filter(client, search_query),
+                with_payload=self.retrieved_payload_fields,
+                with_vectors=with_vectors,
+                timeout=self.search_timeout,
             )
             # results = [p for p in response.points]
             results = [p for p in response.points]
-            documents = [
-                DocumentWithVector(
-                    content=p.payload["content"],
-                    vector=p.vector,
-                    file_name=p.payload["file_name"],
-                    file_path=p.payload["file_path"],
-                    page_number=p.payload["page_number"],
-                )
-                for p in results
-            ]
+            documents = [self._build_document(p, with_vectors) for p in results]
             return documents
         except Exception as e:
             raise e
 
+    def retrieve_documents_hybrid(
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20,
+        dense_weight: float = 1.0, sparse_weight: float = 1.0, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """
+        Find documents with dense and sparse search fused by RRF in one query.
+
+        Falls back to dense search for queries without sparse vector and for collections
+        created without the sparse vector.
+        """
+        collection_id = self._get_collection_id(client.id)
+        if not search_query.sparse_vector or not self._supports_sparse_vectors(collection_id):
+            return self.retrieve_documents(client, search_query, limit, with_vectors)
+        response = self._call_with_retry(
+            self.qdrant_client.query_points,
+            collection_name=collection_id,
+            prefetch=self._build_hybrid_prefetch(client, search_query, limit),
+            query=self._build_fusion_query(dense_weight, sparse_weight),
+            limit=limit,
+            with_payload=self.retrieved_payload_fields,
+            # Only the dense vector, the sparse one is of no use to callers
+            with_vectors=[""] if with_vectors else False,
+            timeout=self.search_timeout,
+        )
+        return [self._build_document(p, with_vectors) for p in response.points]
+
+    def get_file_manifest(
+        self, client: Client, file_path: str
+    ) -> Optional[FileManifest]:
+        """Get the hash and chunk ids indexed for a file, or None if the file is not indexed."""
+        collection_id = self._get_collection_id(client.id)
+        if not self._check_collection_exists(collection_id):
+            return None
+        points = []
+        offset = None
+        while True:
+            batch, offset = self._call_with_retry(
+                self.qdrant_client.scroll,
+                collection_name=collection_id,
+                scroll_filter=self._build_file_filter(client, file_path),
+                limit=self.scroll_batch_size,
+                offset=offset,
+                with_payload=["id", "file_hash"],
+                with_vectors=False,
+                timeout=self.search_timeout,
+            )
+            points.extend(batch)
+            if offset is None:
+                break
+        return self._build_file_manifest(file_path, points)
+
+    def delete_documents(
+        self, client: Client, document_ids: List[str]
+    ) -> bool:
+        """Delete documents by their ids."""
+        if not document_ids:
+            return True
+        collection_id = self._get_collection_id(client.id)
+        self._call_with_retry(
+            self.qdrant_client.delete,
+            collection_name=collection_id,
+            points_selector=PointIdsList(points=[self._get_point_id(client.id, document_id) for document_id in document_ids]),
+            timeout=self.write_timeout,
+        )
+        return True
+
+    def update_documents_payload(
+        self, client: Client, documents: List[Document]
+    ) -> bool:
+        """Update the payload of already indexed documents without touching their vectors."""
+        if not documents:
+            return True
+        collection_id = self._get_collection_id(client.id)
+        self._call_with_retry(
+            self.qdrant_client.batch_update_points,
+            collection_name=collection_id,
+            update_operations=self._build_set_payload_operations(documents, client),
+            timeout=self.write_timeout,
+        )
+        return True
+
+    def reset_file_hash(
+        self, client: Client, file_path: str
+    ) -> bool:
+        """Clear the file hash of the indexed chunks of a file, so that its next incremental indexing does not skip it."""
+        collection_id = self._get_collection_id(client.id)
+        self._call_with_retry(
+            self.qdrant_client.set_payload,
+            collection_name=collection_id,
+            payload={"file_hash": None},
+            points=self._build_file_filter(client, file_path),
+            timeout=self.write_timeout,
+        )
+        return True
+
     async def ainsert_document(
         self, client: Client, document: DocumentWithVector
     ) -> DocumentWithVector:
         """Asynchronously save a document with its vector representation."""
-        # TODO: Implement asynchronous insertion
-        raise NotImplementedError(
-            "Asynchronous insert is not implemented for QdrantVectorDBRepository."
-        )
+        await self.ainsert_documents(client, [document])
+        return document
         
     async def ainsert_documents(
         self, client: Client, documents: List[DocumentWithVector]
     ) -> List[DocumentWithVector]:
-        """Asynchronously insert multiple documents into the vector database."""
-        # TODO: Implement asynchronous insertion
-        raise NotImplementedError(
-            "Asynchronous insert is not implemented for QdrantVectorDBRepository."
-        )
+        """Asynchronously insert multiple documents into the vector database, raising if any batch could not be upserted."""
+        report = await self.aupsert_documents(client, documents)
+        if report.errors:
+            raise Exception(f"Error inserting documents: {len(report.errors)} batches failed, first error: {report.errors[0].error}")
+        return documents
+
+    async def aupsert_documents(
+        self, client: Client, documents: Union[Iterable[DocumentWithVector], AsyncIterable[DocumentWithVector]]
+    ) -> UpsertReport:
+        """Asynchronously upsert a stream of documents in batches, pipelined like upsert_documents."""
+        collection_id = self._get_collection_id(client.id)
+        await self._acreate_collection(collection_id)
+        report = UpsertReport()
+        in_flight: Deque[tuple[int, List[DocumentWithVector], asyncio.Task]] = deque()
+        last_batch = None
+        try:
+            async for batch in self._aiter_batches(documents):
+                if last_batch is not None:
+                    if len(in_flight) >= self.max_in_flight_upserts:
+                        await self._arecord_upsert(report, *in_flight.popleft())
+                    task = asyncio.create_task(self._atry_upsert_batch(collection_id, client, last_batch, False))
+                    in_flight.append((report.batch_count, last_batch, task))
+                    report.batch_count += 1
+                last_batch = batch
+            while in_flight:
+                await self._arecord_upsert(report, *in_flight.popleft())
+        finally:
+            for _, _, task in in_flight:
+                task.cancel()
+        if last_batch is not None:
+            error = await self._atry_upsert_batch(collection_id, client, last_batch, True)
+            self._record_upsert_result(report, report.batch_count, last_batch, error)
+            report.batch_count += 1
+        return report
         
     async def aretrieve_documents(
-        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20
-    ) -> List[DocumentWithVector]:
-        """Asynchronously find documents by their vector representation."""
-        # TODO: Implement asynchronous retrieval
-        raise NotImplementedError(
-            "Asynchronous retrieval is not implemented for QdrantVectorDBRepository."
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Asynchronously find documents by their vector representation, fetching their vectors only if with_vectors is set."""
+        collection_id = self._get_collection_id(client.id)
+        response = await self._acall_with_retry(
+            self.async_qdrant_client.query_points,
+            collection_name=collection_id,
+            query=search_query.vector,
+            limit=limit,
+            query_filter=self._build_search_filter(client, search_query),
+            with_payload=self.retrieved_payload_fields,
+            with_vectors=with_vectors,
+            timeout=self.search_timeout,
         )
+        documents = [self._build_document(p, with_vectors) for p in response.points]
+        return documents
         
+    async def aretrieve_documents_hybrid(
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20,
+        dense_weight: float = 1.0, sparse_weight: float = 1.0, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Asynchronously find documents with dense and sparse search fused by RRF in one query."""
+        collection_id = self._get_collection_id(client.id)
+        if not search_query.sparse_vector or not await self._asupports_sparse_vectors(collection_id):
+            return await self.aretrieve_documents(client, search_query, limit, with_vectors)
+        response = await self._acall_with_retry(
+            self.async_qdrant_client.query_points,
+            collection_name=collection_id,
+            prefetch=self._build_hybrid_prefetch(client, search_query, limit),
+            query=self._build_fusion_query(dense_weight, sparse_weight),
+            limit=limit,
+            with_payload=self.retrieved_payload_fields,
+            # Only the dense vector, the sparse one is of no use to callers
+            with_vectors=[""] if with_vectors else False,
+            timeout=self.search_timeout,
+        )
+        return [self._build_document(p, with_vectors) for p in response.points]
+
+    async def aget_file_manifest(
+        self, client: Client, file_path: str
+    ) -> Optional[FileManifest]:
+        """Asynchronously get the hash and chunk ids indexed for a file, or None if the file is not indexed."""
+        collection_id = self._get_collection_id(client.id)
+        if not await self._acheck_collection_exists(collection_id):
+            return None
+        points = []
+        offset = None
+        while True:
+            batch, offset = await self._acall_with_retry(
+                self.async_qdrant_client.scroll,
+                collection_name=collection_id,
+                scroll_filter=self._build_file_filter(client, file_path),
+                limit=self.scroll_batch_size,
+                offset=offset,
+                with_payload=["id", "file_hash"],
+                with_vectors=False,
+                timeout=self.search_timeout,
+            )
+            points.extend(batch)
+            if offset is None:
+                break
+        return self._build_file_manifest(file_path, points)
+
+    async def adelete_documents(
+        self, client: Client, document_ids: List[str]
+    ) -> bool:
+        """Asynchronously delete documents by their ids."""
+        if not document_ids:
+            return True
+        collection_id = self._get_collection_id(client.id)
+        await self._acall_with_retry(
+            self.async_qdrant_client.delete,
+            collection_name=collection_id,
+            points_selector=PointIdsList(points=[self._get_point_id(client.id, document_id) for document_id in document_ids]),
+            timeout=self.write_timeout,
+        )
+        return True
+
+    async def aupdate_documents_payload(
+        self, client: Client, documents: List[Document]
+    ) -> bool:
+        """Asynchronously update the payload of already indexed documents without touching their vectors."""
+        if not documents:
+            return True
+        collection_id = self._get_collection_id(client.id)
+        await self._acall_with_retry(
+            self.async_qdrant_client.batch_update_points,
+            collection_name=collection_id,
+            update_operations=self._build_set_payload_operations(documents, client),
+            timeout=self.write_timeout,
+        )
+        return True
+
+    async def areset_file_hash(
+        self, client: Client, file_path: str
+    ) -> bool:
+        """Asynchronously clear the file hash of the indexed chunks of a file, so that its next incremental indexing does not skip it."""
+        collection_id = self._get_collection_id(client.id)
+        await self._acall_with_retry(
+            self.async_qdrant_client.set_payload,
+            collection_name=collection_id,
+            payload={"file_hash": None},
+            points=self._build_file_filter(client, file_path),
+            timeout=self.write_timeout,
+        )
+        return True
+
     async def acreate_collection(self, client: Client) -> bool:
         """Asynchronously create a collection in the vector database."""
-        # TODO: Implement asynchronous collection creation
-        raise NotImplementedError(
-            "Asynchronous collection creation is not implemented for QdrantVectorDBRepository."
-        )
+        return await self._acreate_collection(self._get_collection_id(client.id))
         
     async def adelete_collection(self, client_id: str) -> bool:
-        """Asynchronously delete a collection from the vector database."""
-        # TODO: Implement asynchronous collection deletion
-        raise NotImplementedError(
-            "Asynchronous collection deletion is not implemented for QdrantVectorDBRepository."
-        )
+        """Asynchronously delete the collection of a client, or its points in the shared collection."""
+        try:
+            collection_id = self._get_collection_id(client_id)
+            if not await self._acheck_collection_exists(collection_id):
+                logger.info(f"Collection {collection_id} does not exist.")
+                return False
+            if self._is_shared_collection(collection_id):
+                # Other clients live in the shared collection, only the points of this one are deleted
+                await self.async_qdrant_client.delete(
+                    collection_name=collection_id,
+                    points_selector=self._build_client_selector([client_id]),
+                    timeout=self.write_timeout,
+                )
+                return True
+            await self.async_qdrant_client.delete_collection(collection_name=collection_id)
+            self._forget_collection(collection_id)
+            return True
+        except Exception as e:
+            raise Exception(f"Error deleting collection: {e}")
     
-    def _build_payload(self, document: DocumentWithVector,
+    def migrate_tenancy(
+        self, shared: bool, client_ids: Optional[List[str]] = None, delete_source: bool = False
+    ) -> Dict[str, int]:
+        """
+        Copy the points of clients, with their vectors and payloads, from one tenancy layout to the other.
+
+        Point ids are deterministic in both layouts, so an interrupted migration can be run again.
+
+        Args:
+            shared (bool): Whether to copy into the shared collection, else into one collection per client.
+            client_ids (Optional[List[str]]): The clients to migrate, all clients found in the source layout if None.
+            delete_source (bool): Whether to delete the source points once all of them were copied.
+
+        Returns:
+            Dict[str, int]: The number of points copied per client.
+        """
+        copied: Dict[str, int] = {}
+        if shared:
+            for client_id in client_ids or self._list_client_collections():
+                source_id = self._get_collection_id(client_id, shared=False)
+                copied[client_id] = 0
+                for points in self._scroll_points(source_id):
+                    self._copy_points(points, shared=True, client_id=client_id)
+                    copied[client_id] += len(points)
+                logger.info(f"Copied {copied[client_id]} points from {source_id} to {self.collection_name}")
+        else:
+            scroll_filter = self._build_client_selector(client_ids).filter if client_ids else None
+            for points in self._scroll_points(self.collection_name, scroll_filter):
+                for client_id, count in self._copy_points(points, shared=False).items():
+                    copied[client_id] = copied.get(client_id, 0) + count
+            logger.info(f"Copied {sum(copied.values())} points of {len(copied)} clients from {self.collection_name}")
+        if delete_source:
+            self._delete_migrated_points(shared, client_ids, list(copied))
+        return copied
+
+    def _list_client_collections(self) -> List[str]:
+        """List the ids of the clients having their own collection."""
+        prefix = f"{self.collection_name}_"
+        collections = self.qdrant_client.get_collections().collections
+        return [collection.name[len(prefix):] for collection in collections if collection.name.startswith(prefix)]
+
+    def _scroll_points(self, collection_id: str, scroll_filter: Optional[Filter] = None) -> Iterator[list]:
+        """Scroll all the points of a collection, with their vectors and payloads, in pages of scroll_batch_size."""
+        offset = None
+        while True:
+            points, offset = self._call_with_retry(
+                self.qdrant_client.scroll,
+                collection_name=collection_id,
+                scroll_filter=scroll_filter,
+                limit=self.scroll_batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+                timeout=self.search_timeout,
+            )
+            if points:
+                yield points
+            if offset is None:
+                break
+
+    def _copy_points(self, points: list, shared: bool, client_id: Optional[str] = None) -> Dict[str, int]:
+        """Upsert scrolled points into the collections of their clients in a layout, returning the count per client."""
+        points_by_client: Dict[str, List[PointStruct]] = {}
+        for point in points:
+            payload = dict(point.payload or {})
+            payload["client_id"] = point_client_id = client_id or payload.get("client_id")
+            payload["id"] = document_id = payload.get("id") or str(point.id)
+            points_by_client.setdefault(point_client_id, []).append(PointStruct(
+                id=self._get_point_id(point_client_id, document_id, shared=shared),
+                vector=point.vector,
+                payload=payload,
+            ))
+        for point_client_id, client_points in points_by_client.items():
+            target_id = self._get_collection_id(point_client_id, shared=shared)
+            self._create_collection(target_id)
+            self._upsert_points(target_id, client_points)
+        return {point_client_id: len(client_points) for point_client_id, client_points in points_by_client.items()}
+
+    def _delete_migrated_points(self, shared: bool, client_ids: Optional[List[str]], migrated_client_ids: List[str]) -> None:
+        """Delete the source points of a migration to the shared layout if shared is set, else to the per client layout."""
+        if shared:
+            for client_id in migrated_client_ids:
+                source_id = self._get_collection_id(client_id, shared=False)
+                self.qdrant_client.delete_collection(collection_name=source_id)
+                self._forget_collection(source_id)
+        elif client_ids:
+            self._call_with_retry(
+                self.qdrant_client.delete,
+                collection_name=self.collection_name,
+                points_selector=self._build_client_selector(client_ids),
+                timeout=self.write_timeout,
+            )
+        else:
+            self.qdrant_client.delete_collection(collection_name=self.collection_name)
+            self._forget_collection(self.collection_name)
+
+    def _iter_batches(self, documents: Iterable[DocumentWithVector]) -> Iterator[List[DocumentWithVector]]:
+        """Split a stream of documents into batches of upsert_batch_size."""
+        batch = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) == self.upsert_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _aiter_batches(
+        self, documents: Union[Iterable[DocumentWithVector], AsyncIterable[DocumentWithVector]]
+    ) -> AsyncIterator[List[DocumentWithVector]]:
+        """Split a sync or async stream of documents into batches of upsert_batch_size."""
+        if not hasattr(documents, "__aiter__"):
+            for batch in self._iter_batches(documents):
+                yield batch
+            return
+        batch = []
+        async for document in documents:
+            batch.append(document)
+            if len(batch) == self.upsert_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _try_upsert_batch(self, collection_id: str, client: Client, documents: List[DocumentWithVector], wait: bool) -> Optional[str]:
+        """Upsert a batch of documents and return the error if it failed after retries."""
+        try:
+            with_sparse_vector = any(document.sparse_vector for document in documents) and self._supports_sparse_vectors(collection_id)
+            self._upsert_points(collection_id, [self._build_point(document, client, with_sparse_vector) for document in documents], wait=wait)
+            return None
+        except Exception as e:
+            logger.error(f"Error upserting {len(documents)} documents into {collection_id}: {e}")
+            return str(e)
+
+    async def _atry_upsert_batch(self, collection_id: str, client: Client, documents: List[DocumentWithVector], wait: bool) -> Optional[str]:
+        """Asynchronously upsert a batch of documents and return the error if it failed after retries."""
+        try:
+            with_sparse_vector = any(document.sparse_vector for document in documents) and await self._asupports_sparse_vectors(collection_id)
+            await self._aupsert_points(collection_id, [self._build_point(document, client, with_sparse_vector) for document in documents], wait=wait)
+            return None
+        except Exception as e:
+            logger.error(f"Error upserting {len(documents)} documents into {collection_id}: {e}")
+            return str(e)
+
+    def _record_upsert(self, report: UpsertReport, batch_index: int, documents: List[DocumentWithVector], future: Future) -> None:
+        """Wait for an upsert batch and record its outcome in the report."""
+        self._record_upsert_result(report, batch_index, documents, future.result())
+
+    async def _arecord_upsert(self, report: UpsertReport, batch_index: int, documents: List[DocumentWithVector], task: asyncio.Task) -> None:
+        """Asynchronously wait for an upsert batch and record its outcome in the report."""
+        self._record_upsert_result(report, batch_index, documents, await task)
+
+    def _record_upsert_result(self, report: UpsertReport, batch_index: int, documents: List[DocumentWithVector], error: Optional[str]) -> None:
+        """Record the outcome of an upsert batch in the report."""
+        if error is None:
+            report.upserted_documents += len(documents)
+            return
+        report.failed_documents += len(documents)
+        report.errors.append(UpsertBatchError(
+            batch_index=batch_index,
+            document_ids=[str(document.id) for document in documents],
+            error=error,
+        ))
+
+    def _build_payload(self, document: Document,
                        client: Client) -> Dict[str, Any]:
         """Build the payload for Qdrant."""
         return {
@@ -206,7 +887,165 @@ class QdrantVectorDBRepositoryImpl(VectorDBRepository):
             "content": document.content,
             "file_name": document.file_name,
             "file_path": document.file_path,
+            "file_hash": document.file_hash,
             "page_number": document.page_number,
-            # "metadata": document.metadata,
+            "metadata": document.metadata,
             "client_id": client.id,
         }
+
+    def _build_collection_config(self, collection_id: str, vector_dimensions: int) -> Dict[str, Any]:
+        """Build the vector and index settings of a new collection."""
+        config = dict(
+            vectors_config={
+                "size": vector_dimensions,
+                "distance": Distance.COSINE,  # Distance metric
+            },
+            sparse_vectors_config=self._build_sparse_vectors_config(),
+        )
+        if self._is_shared_collection(collection_id):
+            # Searches always filter on one client: no graph over the whole collection,
+            # one graph per client built from the client_id tenant index instead
+            config["hnsw_config"] = HnswConfigDiff(m=0, payload_m=16)
+        return config
+
+    def _build_payload_indexes(self, collection_id: str) -> Dict[str, Union[KeywordIndexParams, PayloadSchemaType]]:
+        """Build the payload indexes of a collection, client_id being the tenant key of the shared collection."""
+        indexes = {
+            "client_id": KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=self._is_shared_collection(collection_id)),
+            "page_number": PayloadSchemaType.INTEGER,  # Page range filters
+        }
+        for field_name in self.payload_indexed_fields:
+            indexes[field_name] = KeywordIndexParams(type=KeywordIndexType.KEYWORD)
+        return indexes
+
+    def _build_sparse_vectors_config(self) -> Dict[str, SparseVectorParams]:
+        """Build the config of the sparse vector, whose IDF is computed by Qdrant from the collection statistics."""
+        return {self.sparse_vector_name: SparseVectorParams(modifier=Modifier.IDF)}
+
+    def _supports_sparse_vectors(self, collection_id: str) -> bool:
+        """Check, once per collection, whether the collection has the sparse vector."""
+        if collection_id not in self._sparse_vector_support:
+            collection = self.qdrant_client.get_collection(collection_id)
+            self._sparse_vector_support[collection_id] = self.sparse_vector_name in (collection.config.params.sparse_vectors or {})
+        return self._sparse_vector_support[collection_id]
+
+    async def _asupports_sparse_vectors(self, collection_id: str) -> bool:
+        """Asynchronously check, once per collection, whether the collection has the sparse vector."""
+        if collection_id not in self._sparse_vector_support:
+            collection = await self.async_qdrant_client.get_collection(collection_id)
+            self._sparse_vector_support[collection_id] = self.sparse_vector_name in (collection.config.params.sparse_vectors or {})
+        return self._sparse_vector_support[collection_id]
+
+    def _build_point(self, document: DocumentWithVector, client: Client,
+                     with_sparse_vector: bool = False) -> PointStruct:
+        """Build the Qdrant point of a document, with its sparse vector if the collection has one."""
+        vector = document.vector
+        if with_sparse_vector and document.sparse_vector:
+            vector = {
+                "": document.vector,
+                self.sparse_vector_name: QdrantSparseVector(
+                    indices=document.sparse_vector.indices,
+                    values=document.sparse_vector.values,
+                ),
+            }
+        return PointStruct(
+            id=self._get_point_id(client.id, document.id),
+            vector=vector,
+            payload=self._build_payload(document, client),
+        )
+
+    def _build_hybrid_prefetch(self, client: Client, search_query: SearchQueryWithVector,
+                               limit: int) -> List[Prefetch]:
+        """Build the dense and sparse searches whose results are fused."""
+        query_filter = self._build_search_filter(client, search_query)
+        prefetch_limit = limit * self.hybrid_prefetch_multiplier
+        return [
+            Prefetch(query=search_query.vector, filter=query_filter, limit=prefetch_limit),
+            Prefetch(
+                query=QdrantSparseVector(
+                    indices=search_query.sparse_vector.indices,
+                    values=search_query.sparse_vector.values,
+                ),
+                using=self.sparse_vector_name,
+                filter=query_filter,
+                limit=prefetch_limit,
+            ),
+        ]
+
+    def _build_fusion_query(self, dense_weight: float, sparse_weight: float) -> Union[FusionQuery, RrfQuery]:
+        """Build the RRF fusion, weighted only when needed since weighted RRF requires a recent Qdrant server."""
+        if dense_weight == sparse_weight:
+            return FusionQuery(fusion=Fusion.RRF)
+        return RrfQuery(rrf=Rrf(weights=[dense_weight, sparse_weight]))
+
+    def _get_dense_vector(self, point) -> List[float]:
+        """Get the dense vector of a point, which is named "" in collections having a sparse vector."""
+        if isinstance(point.vector, dict):
+            return point.vector.get("")
+        return point.vector
+
+    def _build_document(self, point, with_vectors: bool = False) -> Union[Document, DocumentWithVector]:
+        """Build a document from the payload of a point, with its dense vector if it was fetched."""
+        fields = dict(
+            id=str((point.payload or {}).get("id") or point.id),
+            content=point.payload["content"],
+            file_name=point.payload["file_name"],
+            file_path=point.payload["file_path"],
+            page_number=point.payload["page_number"],
+            metadata=point.payload.get("metadata"),
+        )
+        if with_vectors:
+            return DocumentWithVector(**fields, vector=self._get_dense_vector(point))
+        return Document(**fields)
+
+    def _build_search_filter(self, client: Client, search_query: SearchQueryWithVector) -> Filter:
+        """Build the filter of a search: the points of the client matching the filters of the query, on indexed fields."""
+        conditions = [FieldCondition(key="client_id", match=MatchValue(value=client.id))]
+        filters = search_query.filters
+        if filters is not None:
+            if filters.file_names:
+                conditions.append(FieldCondition(key="file_name", match=MatchAny(any=filters.file_names)))
+            if filters.file_types:
+                file_types = [file_type.lower().lstrip(".") for file_type in filters.file_types]
+                conditions.append(FieldCondition(key="metadata.file_type", match=MatchAny(any=file_types)))
+            if filters.page_from is not None or filters.page_to is not None:
+                conditions.append(FieldCondition(key="page_number", range=Range(gte=filters.page_from, lte=filters.page_to)))
+        return Filter(must=conditions)
+
+    def _build_client_selector(self, client_ids: List[str]) -> FilterSelector:
+        """Build the selector of the points of some clients."""
+        return FilterSelector(filter=Filter(must=[FieldCondition(key="client_id", match=MatchAny(any=client_ids))]))
+
+    def _build_file_filter(self, client: Client, file_path: str) -> Filter:
+        """Build the filter matching the points of a file."""
+        return Filter(
+            must=[
+                FieldCondition(key="client_id", match=MatchValue(value=client.id)),
+                FieldCondition(key="file_path", match=MatchValue(value=file_path)),
+            ]
+        )
+
+    def _build_file_manifest(self, file_path: str, points: list) -> Optional[FileManifest]:
+        """Build the manifest of a file from its scrolled points."""
+        if not points:
+            return None
+        file_hashes = {(p.payload or {}).get("file_hash") for p in points}
+        return FileManifest(
+            file_path=file_path,
+            # Points indexed with different file versions (e.g. an interrupted re-index) never match a file hash
+            file_hash=file_hashes.pop() if len(file_hashes) == 1 else None,
+            document_ids=[str((p.payload or {}).get("id") or p.id) for p in points],
+        )
+
+    def _build_set_payload_operations(self, documents: List[Document],
+                                      client: Client) -> List[SetPayloadOperation]:
+        """Build one payload update operation per document."""
+        return [
+            SetPayloadOperation(
+                set_payload=SetPayload(
+                    payload=self._build_payload(document, client),
+                    points=[self._get_point_id(client.id, document.id)],
+                )
+            )
+            for document in documents
+        ]
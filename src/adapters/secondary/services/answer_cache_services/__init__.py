@@ -0,0 +1,5 @@
+from .semantic_answer_cache_service import SemanticAnswerCacheServiceImpl
+
+__all__ = [
+    "SemanticAnswerCacheServiceImpl"
+]
@@ -0,0 +1,194 @@
+import base64
+import hashlib
+import json
+import re
+import threading
+import unicodedata
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.entities import Client, Message, RagConfig, RagResponse
+from core.ports.secondary.repositories import CacheRepository
+from core.ports.secondary.services import AnswerCacheService, CollectionVersionService, EmbeddingService
+from infrastructure.utils.vector_utils import normalize_rows
+
+
+class SemanticAnswerCacheServiceImpl(AnswerCacheService):
+    """
+    Answer cache looked up by exact match of the conversation tail, then optionally by embedding similarity.
+
+    Answers are keyed on the client, the version of its collection, the RAG configuration with the
+    system messages, and the normalized last messages of the conversation. Indexing documents gives
+    the collection a new version, so the answers cached before are no longer found and expire. The
+    version is read once by the lookup and given back to set_answer, so an answer generated while the
+    collection is re-indexed is cached under the version it was retrieved from.
+
+    If similarity_threshold is set, each scope also keeps the vectors of its most recent conversation
+    tails, the answer of the closest one is returned if its cosine similarity reaches the threshold.
+    Questions differing only by an entity embed very closely, so the threshold is opt-in. This list is
+    read, updated and written back, so concurrent writers may drop each other's last entries, which
+    only costs misses.
+    """
+
+    def __init__(
+        self,
+        cache_repository: CacheRepository,
+        embedding_service: EmbeddingService,
+        collection_version_service: CollectionVersionService,
+        ttl: Optional[int] = 24 * 3600,
+        similarity_threshold: Optional[float] = None,
+        tail_messages: int = 3,
+        max_similar_entries: int = 256,
+    ):
+        self.cache_repository = cache_repository
+        self.embedding_service = embedding_service
+        self.collection_version_service = collection_version_service
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold  # None for exact matches only
+        self.tail_messages = tail_messages  # Number of last user and assistant messages the answer depends on
+        self.max_similar_entries = max_similar_entries  # Conversation tails compared by similarity per scope
+        self._lock = threading.Lock()
+        self._exact_hits = 0
+        self._similar_hits = 0
+        self._misses = 0
+
+    def get_answer(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Tuple[Optional[RagResponse], str]:
+        """Get the answer cached for the same or a similar conversation tail, or None on a miss, and the collection version."""
+        version = self.collection_version_service.get_version(client.id)
+        tail = self._get_tail(messages)
+        if tail is None:
+            return None, version
+        scope = self._build_scope(messages, client, rag_config, version)
+        value = self.cache_repository.get(self._build_answer_key(scope, self._hash(tail)))
+        if value is not None:
+            return self._count_hit(value, similar=False), version
+        entries = self.cache_repository.get(self._build_index_key(scope)) if self.similarity_threshold is not None else None
+        if not entries:
+            return self._count_hit(None, similar=True), version
+        tail_hash = self._find_similar(self.embedding_service.create_embedding(tail), entries)
+        value = self.cache_repository.get(self._build_answer_key(scope, tail_hash)) if tail_hash else None
+        return self._count_hit(value, similar=True), version
+
+    def set_answer(self, messages: list[Message], client: Client, rag_config: RagConfig, rag_response: RagResponse, version: str) -> None:
+        """Cache a successful answer and add the conversation tail to the ones compared by similarity."""
+        tail = self._get_tail(messages)
+        if tail is None or rag_response.flag or not rag_response.answer:
+            return
+        scope = self._build_scope(messages, client, rag_config, version)
+        tail_hash = self._hash(tail)
+        items = {self._build_answer_key(scope, tail_hash): rag_response.model_dump(mode="json")}
+        if self.similarity_threshold is not None:
+            index_key = self._build_index_key(scope)
+            entries = self.cache_repository.get(index_key) or []
+            items[index_key] = self._add_entry(entries, tail_hash, self.embedding_service.create_embedding(tail))
+        self.cache_repository.set_many(items, self.ttl)
+
+    async def aget_answer(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Tuple[Optional[RagResponse], str]:
+        """Asynchronously get the answer cached for the same or a similar conversation tail, or None on a miss, and the collection version."""
+        version = await self.collection_version_service.aget_version(client.id)
+        tail = self._get_tail(messages)
+        if tail is None:
+            return None, version
+        scope = self._build_scope(messages, client, rag_config, version)
+        value = await self.cache_repository.aget(self._build_answer_key(scope, self._hash(tail)))
+        if value is not None:
+            return self._count_hit(value, similar=False), version
+        entries = await self.cache_repository.aget(self._build_index_key(scope)) if self.similarity_threshold is not None else None
+        if not entries:
+            return self._count_hit(None, similar=True), version
+        tail_hash = self._find_similar(await self.embedding_service.acreate_embedding(tail), entries)
+        value = await self.cache_repository.aget(self._build_answer_key(scope, tail_hash)) if tail_hash else None
+        return self._count_hit(value, similar=True), version
+
+    async def aset_answer(self, messages: list[Message], client: Client, rag_config: RagConfig, rag_response: RagResponse, version: str) -> None:
+        """Asynchronously cache a successful answer and add the conversation tail to the ones compared by similarity."""
+        tail = self._get_tail(messages)
+        if tail is None or rag_response.flag or not rag_response.answer:
+            return
+        scope = self._build_scope(messages, client, rag_config, version)
+        tail_hash = self._hash(tail)
+        items = {self._build_answer_key(scope, tail_hash): rag_response.model_dump(mode="json")}
+        if self.similarity_threshold is not None:
+            index_key = self._build_index_key(scope)
+            entries = await self.cache_repository.aget(index_key) or []
+            items[index_key] = self._add_entry(entries, tail_hash, await self.embedding_service.acreate_embedding(tail))
+        await self.cache_repository.aset_many(items, self.ttl)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters of the answer cache and the stats of its backend."""
+        with self._lock:
+            exact_hits, similar_hits, misses = self._exact_hits, self._similar_hits, self._misses
+        lookups = exact_hits + similar_hits + misses
+        return {
+            "exact_hits": exact_hits,
+            "similar_hits": similar_hits,
+            "misses": misses,
+            "hit_rate": (exact_hits + similar_hits) / lookups if lookups else 0.0,
+            "backend": self.cache_repository.get_stats(),
+        }
+
+    def _get_tail(self, messages: list[Message]) -> Optional[str]:
+        """
+        Get the normalized text of the last user and assistant messages, or None if the conversation
+        does not end with a user question, or holds tool calls, which are not cached.
+        """
+        if not messages or messages[-1].role != "user":
+            return None
+        tail = []
+        for message in reversed(messages):
+            if len(tail) == self.tail_messages or message.role == "system":
+                break
+            if message.role not in ("user", "assistant") or message.tool_calls or not isinstance(message.content, str):
+                return None
+            tail.append(f"{message.role}: {self._normalize_text(message.content)}")
+        return "\n".join(reversed(tail))
+
+    def _build_scope(self, messages: list[Message], client: Client, rag_config: RagConfig, version: str) -> str:
+        """Build the key prefix of the answers sharing a client, a collection version, a configuration and system messages."""
+        configuration = {
+            "rag_config": rag_config.model_dump(mode="json", exclude={"use_answer_cache": True, "llm_config": {"api_key"}}),
+            "system": [message.content for message in messages if message.role == "system"],
+        }
+        return f"answer:{client.id}:{version}:{self._hash(json.dumps(configuration, sort_keys=True, default=str))[:16]}"
+
+    def _build_answer_key(self, scope: str, tail_hash: str) -> str:
+        """Build the key of the answer to a conversation tail."""
+        return f"{scope}:{tail_hash}"
+
+    def _build_index_key(self, scope: str) -> str:
+        """Build the key of the conversation tails compared by similarity."""
+        return f"{scope}:index"
+
+    def _find_similar(self, vector: List[float], entries: List[List[str]]) -> Optional[str]:
+        """Return the hash of the conversation tail closest to the vector, if it is similar enough."""
+        vectors = normalize_rows(np.stack([np.frombuffer(base64.b64decode(encoded), dtype=np.float32) for _, encoded in entries]))
+        similarities = vectors @ normalize_rows(np.asarray(vector, dtype=np.float32))
+        best = int(np.argmax(similarities))
+        return entries[best][0] if similarities[best] >= self.similarity_threshold else None
+
+    def _add_entry(self, entries: List[List[str]], tail_hash: str, vector: List[float]) -> List[List[str]]:
+        """Put a conversation tail first in the entries, keeping the max_similar_entries most recent ones."""
+        encoded = base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+        entries = [[tail_hash, encoded]] + [entry for entry in entries if entry[0] != tail_hash]
+        return entries[:self.max_similar_entries]
+
+    def _count_hit(self, value: Optional[Dict[str, Any]], similar: bool) -> Optional[RagResponse]:
+        """Count a lookup and decode the cached answer."""
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            elif similar:
+                self._similar_hits += 1
+            else:
+                self._exact_hits += 1
+        return RagResponse(**value) if value is not None else None
+
+    def _normalize_text(self, text: str) -> str:
+        """Normalize unicode, case, whitespace and final punctuation, which do not change the question."""
+        return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text).casefold()).strip().rstrip("?!. ")
+
+    def _hash(self, text: str) -> str:
+        """Hash a text for use in a key."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -1,8 +1,9 @@
 
+import hashlib
 import re
 import uuid
 from pydantic import BaseModel
-from typing import Union, List
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, Union, List
 
 
 from core.ports.secondary.services import ChunkingService, MarkdownChunkingService
@@ -15,6 +16,17 @@ class MarkdownSection(BaseModel):
     page_number: int = 0
 
 
+class ChunkingContext(BaseModel):
+    """What chunking a file has seen so far, carried from one page to the next."""
+    last_header: Optional[str] = None
+    last_subheader: Optional[str] = None
+    occurrences: Dict[bytes, int] = {}  # Number of chunks seen per content hash, telling apart identical chunks
+
+
+# Namespace of the deterministic chunk ids, so that re-chunking an unchanged file yields the same ids
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c2a5e-3d0b-4c1e-9a57-2b8f0e4d7c13")
+
+
 class MarkdownChunkingServiceImpl(MarkdownChunkingService):
     """Chunking service for Markdown files."""
     def __init__(self):
@@ -22,38 +34,43 @@ class MarkdownChunkingServiceImpl(MarkdownChunkingService):
     
     def chunk(self, file_content: FileContent) -> list[Document]:
         """Chunk the file content into smaller documents."""
-        # Implement the logic to chunk the Markdown content
-        # For example, split by headings or paragraphs
-        # This is a placeholder implementation
-        documents = []
-        all_markdown_sections = []
-        for page_content in file_content.page_contents:
-            # md_text = page_content.content
-            markdown_sections = self._structural_chunking(page_content)
-            all_markdown_sections.extend(markdown_sections)
-        
-        last_header = None
-        last_subheader = None
-        for section in all_markdown_sections:
-            if not section.content.strip():
-                continue
-            if not section.header:
-                section.header = last_header
-            if not section.subheader:
-                section.subheader = last_subheader
-            if last_subheader:
-                section.content = last_subheader + '\n' + section.content.strip()
-            last_header = section.header
-            last_subheader = section.subheader
-            document = self._markdown_to_document(section, file_content)
-            documents.append(document)
-        return documents
+        return list(self.iter_chunks(file_content))
 
     async def achunk(self, file_content: FileContent) -> list[Document]:
         """Asynchronously chunk the file content into smaller documents."""
         # For now, we will just call the synchronous method
         # TODO: Implement asynchronous chunking logic if needed
         return self.chunk(file_content)
+
+    def iter_chunks(self, file_content: FileContent, pages: Optional[Iterable[PageContent]] = None) -> Iterator[Document]:
+        """Yield the documents of the file page by page, carrying the headings over from one page to the next."""
+        context = ChunkingContext()
+        for page_content in file_content.page_contents if pages is None else pages:
+            yield from self._chunk_page(page_content, file_content, context)
+
+    async def aiter_chunks(self, file_content: FileContent, pages: AsyncIterable[PageContent]) -> AsyncIterator[Document]:
+        """Asynchronously yield the documents of the file as its pages come in."""
+        context = ChunkingContext()
+        async for page_content in pages:
+            for document in self._chunk_page(page_content, file_content, context):
+                yield document
+
+    def _chunk_page(self, page_content: PageContent, file_content: FileContent, context: "ChunkingContext") -> Iterator[Document]:
+        """Chunk one page, updating the headings and chunk occurrences seen so far in the file."""
+        for section in self._structural_chunking(page_content):
+            if not section.content.strip():
+                continue
+            if not section.header:
+                section.header = context.last_header
+            if not section.subheader:
+                section.subheader = context.last_subheader
+            if context.last_subheader:
+                section.content = context.last_subheader + '\n' + section.content.strip()
+            context.last_header = section.header
+            context.last_subheader = section.subheader
+            content_key = hashlib.sha256(section.content.strip().encode("utf-8")).digest()
+            context.occurrences[content_key] = context.occurrences.get(content_key, 0) + 1
+            yield self._markdown_to_document(section, file_content, context.occurrences[content_key])
     
     def _extract_heading_pattern(self, md_text: str):
         """Extract headings from Markdown text."""
@@ -66,7 +83,7 @@ class MarkdownChunkingServiceImpl(MarkdownChunkingService):
         md_text = page_content.content
         heading_pattern, subheading_pattern = self._extract_heading_pattern(md_text)
         sections = []
-        current_section = MarkdownSection(content="")
+        current_section = MarkdownSection(content="", page_number=page_content.page_number)
         
         for line in md_text.split('\n'):
             line = line.strip()
@@ -87,13 +104,24 @@ class MarkdownChunkingServiceImpl(MarkdownChunkingService):
             sections.append(current_section)
         return sections
     
-    def _markdown_to_document(self, section: MarkdownSection, file_content: FileContent) -> Document:
+    def _get_chunk_id(self, file_content: FileContent, content: str, occurrence: int) -> str:
+        """
+        Derive the id of a chunk from the file identity and the hash of the chunk content.
+
+        The occurrence number tells apart identical chunks within the same file.
+        """
+        file_identity = file_content.file_path or file_content.file_name
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{file_identity}:{content_hash}:{occurrence}"))
+
+    def _markdown_to_document(self, section: MarkdownSection, file_content: FileContent, occurrence: int = 1) -> Document:
         """Convert a Markdown section to a Document."""
-        document_id = str(uuid.uuid4())
+        document_id = self._get_chunk_id(file_content, section.content.strip(), occurrence)
         return Document(
             id=document_id,
             content=section.content.strip(),
             file_name=file_content.file_name,
             file_path=file_content.file_path,
-            page_number=section.page_number
+            page_number=section.page_number,
+            metadata=dict(file_content.metadata) or None,
         )
\ No newline at end of file
@@ -25,7 +25,10 @@ class ClientManagingServiceImpl(ClientManagingService):
 
     async def acreate_client(self, client: Client) -> Client:
         """Asynchronously create a new client."""
-        return await self.vector_db_repository.acreate_collection(client)
+        if await self.vector_db_repository.acreate_collection(client):
+            return client
+        else:
+            raise Exception(f"Failed to create client collection for {client.id}")
 
     async def adelete_client(self, client_id: str) -> None:
         """Asynchronously delete a client by its ID."""
@@ -0,0 +1,5 @@
+from .cache_collection_version_service import CacheCollectionVersionServiceImpl
+
+__all__ = [
+    "CacheCollectionVersionServiceImpl"
+]
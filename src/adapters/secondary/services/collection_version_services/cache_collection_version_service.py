@@ -0,0 +1,43 @@
+import uuid
+
+from core.ports.secondary.repositories import CacheRepository
+from core.ports.secondary.services import CollectionVersionService
+
+
+class CacheCollectionVersionServiceImpl(CollectionVersionService):
+    """
+    Collection versions kept in a cache shared by the processes which index and answer, e.g. Redis.
+
+    A version is a random token rather than a counter, so that a version lost from the cache is
+    replaced by a new one instead of starting over at a value already used.
+    """
+
+    def __init__(self, cache_repository: CacheRepository, prefix: str = "collection_version:"):
+        self.cache_repository = cache_repository
+        self.prefix = prefix
+
+    def get_version(self, client_id: str) -> str:
+        """Get the current version of the documents of a client, creating it if there is none."""
+        version = self.cache_repository.get(self.prefix + client_id)
+        if version is None:
+            version = self.bump_version(client_id)
+        return version
+
+    def bump_version(self, client_id: str) -> str:
+        """Give the documents of a client a new version, invalidating what was cached for the previous one."""
+        version = uuid.uuid4().hex
+        self.cache_repository.set(self.prefix + client_id, version)
+        return version
+
+    async def aget_version(self, client_id: str) -> str:
+        """Asynchronously get the current version of the documents of a client, creating it if there is none."""
+        version = await self.cache_repository.aget(self.prefix + client_id)
+        if version is None:
+            version = await self.abump_version(client_id)
+        return version
+
+    async def abump_version(self, client_id: str) -> str:
+        """Asynchronously give the documents of a client a new version."""
+        version = uuid.uuid4().hex
+        await self.cache_repository.aset(self.prefix + client_id, version)
+        return version
@@ -0,0 +1,5 @@
+from .token_budget_context_packing_service import TokenBudgetContextPackingServiceImpl
+
+__all__ = [
+    "TokenBudgetContextPackingServiceImpl"
+]
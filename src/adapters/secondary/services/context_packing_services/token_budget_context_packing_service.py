@@ -0,0 +1,134 @@
+import json
+from typing import Any, Optional, Set, Tuple
+
+from core.entities import Document, Message, ToolCallResponse
+from core.ports.secondary.services import ContextPackingService
+
+from infrastructure.utils.tokenizer import count_tokens, truncate_to_tokens
+
+NO_DOCUMENTS = "No documents found."
+ALREADY_SENT = "No new documents: the matching documents were already provided in earlier search results."
+BUDGET_EXHAUSTED = "The context budget is exhausted: answer with the documents already provided."
+
+
+class TokenBudgetContextPackingServiceImpl(ContextPackingService):
+    """
+    Packs retrieved documents into the prompt within a token budget.
+
+    Documents already sent are skipped, chunks of the same page are merged into one block under
+    a single source line, and blocks are taken by rank across the calls of a turn, so that each
+    call gets its best documents in before the budget runs out. A block which does not fit is
+    truncated if enough of the budget is left, dropped otherwise.
+    """
+
+    def __init__(self, min_block_tokens: int = 64, message_overhead_tokens: int = 4):
+        self.min_block_tokens = min_block_tokens  # Smallest truncated block worth sending
+        self.message_overhead_tokens = message_overhead_tokens  # Tokens of the role and separators of each message
+
+    def count_message_tokens(self, messages: list[Message], model_name: str) -> int:
+        """Count the tokens of a message history as sent to the LLM."""
+        return sum(
+            self.message_overhead_tokens + count_tokens(self._get_message_text(message), model_name)
+            for message in messages
+        )
+
+    def pack(
+        self, results: list[list[Document]], sent_ids: Set[str], token_budget: int, model_name: str
+    ) -> Tuple[list[str], list[Document]]:
+        """Render the documents retrieved by each tool call of a turn into one context per call, within token_budget tokens."""
+        seen_ids = set(sent_ids)
+        blocks_per_call = [self._merge_page_chunks(self._filter_new_documents(documents, seen_ids)) for documents in results]
+
+        contexts = [[] for _ in results]
+        packed = []
+        remaining = token_budget
+        for rank in range(max((len(blocks) for blocks in blocks_per_call), default=0)):
+            for call_index, blocks in enumerate(blocks_per_call):
+                if rank >= len(blocks):
+                    continue
+                documents, text = blocks[rank]
+                tokens = count_tokens(text, model_name)
+                if tokens > remaining:
+                    if remaining < self.min_block_tokens:
+                        continue
+                    text = truncate_to_tokens(text, remaining, model_name)
+                    tokens = remaining
+                contexts[call_index].append(text)
+                remaining -= tokens
+                packed.extend(documents)
+                sent_ids.update(self._get_document_key(document) for document in documents)
+        return [
+            "\n\n".join(context) or self._get_empty_context_message(documents, blocks)
+            for context, documents, blocks in zip(contexts, results, blocks_per_call)
+        ], packed
+
+    def _filter_new_documents(self, documents: list[Document], seen_ids: Set[str]) -> list[Document]:
+        """Keep the documents not sent yet nor returned by an earlier call of the turn."""
+        new_documents = []
+        for document in documents:
+            key = self._get_document_key(document)
+            if key not in seen_ids:
+                seen_ids.add(key)
+                new_documents.append(document)
+        return new_documents
+
+    def _merge_page_chunks(self, documents: list[Document]) -> list[Tuple[list[Document], str]]:
+        """
+        Group the chunks of each page into one block, ranked as its best chunk.
+
+        Chunks of a section repeat its headers, the leading lines a chunk shares with the previous
+        chunk of its block are dropped.
+        """
+        blocks: dict[Tuple[Optional[str], Optional[int]], list[Document]] = {}
+        for document in documents:
+            blocks.setdefault((document.file_path or document.file_name, document.page_number), []).append(document)
+        merged = []
+        for block_documents in blocks.values():
+            contents = [block_documents[0].content]
+            for previous, document in zip(block_documents, block_documents[1:]):
+                contents.append(self._strip_shared_lines(previous.content, document.content))
+            merged.append((block_documents, f"{self._format_source(block_documents[0])}\n" + "\n\n".join(contents)))
+        return merged
+
+    def _strip_shared_lines(self, previous: str, content: str) -> str:
+        """Drop the leading lines of content which are the same as those of previous."""
+        previous_lines = previous.splitlines()
+        lines = content.splitlines()
+        shared = 0
+        while shared < min(len(previous_lines), len(lines) - 1) and previous_lines[shared] == lines[shared]:
+            shared += 1
+        return "\n".join(lines[shared:])
+
+    def _format_source(self, document: Document) -> str:
+        """Format the source line of a block, which lets the model cite or filter on the file."""
+        # Pages are numbered from 1, readers of formats without pages such as docx or txt set page 0
+        if document.page_number is not None and document.page_number > 0:
+            return f"[{document.file_name}, page {document.page_number}]"
+        return f"[{document.file_name}]"
+
+    def _get_empty_context_message(self, documents: list[Document], blocks: list) -> str:
+        """Explain to the model why a call gets no documents."""
+        if not documents:
+            return NO_DOCUMENTS
+        if not blocks:
+            return ALREADY_SENT
+        return BUDGET_EXHAUSTED
+
+    def _get_document_key(self, document: Document) -> str:
+        """Identify a document across calls and turns."""
+        return document.id or document.content
+
+    def _get_message_text(self, message: Message) -> str:
+        """Get the text of a message as sent to the LLM, tool call arguments included."""
+        text = self._to_text(message.content.tool_response if isinstance(message.content, ToolCallResponse) else message.content)
+        for tool_call in message.tool_calls or []:
+            text += getattr(tool_call, "name", "") + self._to_text(getattr(tool_call, "arguments", None))
+        return text
+
+    def _to_text(self, value: Any) -> str:
+        """Render a message content as text."""
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, ensure_ascii=False, default=str)
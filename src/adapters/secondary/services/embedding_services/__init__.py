@@ -1,6 +1,9 @@
-
 from .openai_embedding_service import OpenAIEmbeddingServiceImpl
+from .cached_embedding_service import CachedEmbeddingServiceImpl
+from .bm25_sparse_embedding_service import BM25SparseEmbeddingServiceImpl
 
 __all__ = [
-    "OpenAIEmbeddingServiceImpl"
-]
\ No newline at end of file
+    "OpenAIEmbeddingServiceImpl",
+    "CachedEmbeddingServiceImpl",
+    "BM25SparseEmbeddingServiceImpl"
+]
@@ -0,0 +1,92 @@
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+from typing import List
+
+from core.entities import SparseVector
+from core.ports.secondary.services import SparseEmbeddingService
+
+# Runs of Chinese, Japanese and Korean characters, which are not separated by spaces
+CJK_PATTERN = re.compile(r"[぀-ヿ㐀-䶿一-鿿豈-﫿ｦ-ﾟ가-힯]+")
+# Words, keeping compound terms such as part numbers (ab-1234), versions (1.2.3) or paths together
+WORD_PATTERN = re.compile(r"[^\W_]+(?:[-_./:#][^\W_]+)*")
+SEPARATOR_PATTERN = re.compile(r"[-_./:#]")
+
+
+class BM25SparseEmbeddingServiceImpl(SparseEmbeddingService):
+    """
+    Local BM25 sparse embeddings, computed without any model or network call.
+
+    Documents get the BM25 term frequency saturation and length normalization, while the IDF
+    part is applied by the vector database (Qdrant IDF modifier) from its own statistics.
+    Terms are hashed to 32-bit ids, so no vocabulary has to be stored.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_doc_length: float = 256):
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_length = avg_doc_length  # Average number of terms of a chunk, used for length normalization
+
+    def create_sparse_embeddings(self, texts: List[str]) -> List[SparseVector]:
+        """Create BM25 weighted sparse vectors for a list of documents."""
+        return [self._embed_document(text) for text in texts]
+
+    def create_query_sparse_embedding(self, text: str) -> SparseVector:
+        """Create the sparse vector of a query, with a weight of 1 per distinct term."""
+        return self._build_sparse_vector({term: 1.0 for term in self.tokenize(text)})
+
+    async def acreate_sparse_embeddings(self, texts: List[str]) -> List[SparseVector]:
+        """Asynchronously create BM25 weighted sparse vectors for a list of documents."""
+        return self.create_sparse_embeddings(texts)
+
+    async def acreate_query_sparse_embedding(self, text: str) -> SparseVector:
+        """Asynchronously create the sparse vector of a query."""
+        return self.create_query_sparse_embedding(text)
+
+    def get_model_name(self) -> str:
+        """Return the name of the sparse embedding model."""
+        return "bm25"
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Split a text into terms.
+
+        Text is NFKC normalized and lowercased. Compound terms are kept whole and also split into
+        their parts, and CJK runs are split into overlapping character bigrams.
+        """
+        text = unicodedata.normalize("NFKC", text or "").lower()
+        terms = []
+        for run in CJK_PATTERN.findall(text):
+            if len(run) == 1:
+                terms.append(run)
+            else:
+                terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        for word in WORD_PATTERN.findall(CJK_PATTERN.sub(" ", text)):
+            terms.append(word)
+            if SEPARATOR_PATTERN.search(word):
+                terms.extend(part for part in SEPARATOR_PATTERN.split(word) if part)
+        return terms
+
+    def _embed_document(self, text: str) -> SparseVector:
+        """Weight the terms of a document with the BM25 term frequency saturation."""
+        terms = self.tokenize(text)
+        length_norm = 1 - self.b + self.b * len(terms) / self.avg_doc_length
+        weights = {
+            term: tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+            for term, tf in Counter(terms).items()
+        }
+        return self._build_sparse_vector(weights)
+
+    def _build_sparse_vector(self, weights: dict[str, float]) -> SparseVector:
+        """Hash the terms to ids, summing the weights of colliding terms."""
+        values = {}
+        for term, weight in weights.items():
+            index = self._hash_term(term)
+            values[index] = values.get(index, 0.0) + weight
+        indices = sorted(values)
+        return SparseVector(indices=indices, values=[values[index] for index in indices])
+
+    def _hash_term(self, term: str) -> int:
+        """Hash a term to a stable unsigned 32-bit id."""
+        return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=4).digest(), "little")
@@ -0,0 +1,126 @@
+import base64
+import hashlib
+import re
+import threading
+import unicodedata
+from array import array
+from typing import Any, Dict, List, Optional
+
+from core.ports.secondary.repositories import CacheRepository
+from core.ports.secondary.services import EmbeddingService
+
+
+class CachedEmbeddingServiceImpl(EmbeddingService):
+    """
+    Embedding service decorator caching the vectors of the wrapped service.
+
+    Vectors are keyed on the model name and a hash of the normalized text, so identical content
+    is only embedded once across indexing and querying, whatever the client or file it comes from.
+    They are stored as float32, which is plenty for cosine similarity, and returned as float32 values
+    on misses too, so a text gets the same vector whether it was cached or not.
+    """
+
+    def __init__(self, embedding_service: EmbeddingService, cache_repository: CacheRepository, ttl: Optional[int] = None):
+        self.embedding_service = embedding_service
+        self.cache_repository = cache_repository
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def create_embedding(self, text: str) -> List[float]:
+        """Create an embedding for the given text, reusing the cached vector if any."""
+        return self.create_embeddings([text])[0]
+
+    async def acreate_embedding(self, text: str) -> List[float]:
+        """Asynchronously create an embedding for the given text, reusing the cached vector if any."""
+        return (await self.acreate_embeddings([text]))[0]
+
+    def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Create embeddings for the given texts, only sending the texts missing from the cache to the wrapped service."""
+        keys = [self._build_key(text) for text in texts]
+        cached_values = self.cache_repository.get_many(list(dict.fromkeys(keys)))
+        vectors = self._decode_cached_vectors(keys, cached_values)
+        missing_texts = self._get_missing_texts(texts, keys, vectors)
+        if missing_texts:
+            missing_vectors = self.embedding_service.create_embeddings(list(missing_texts.values()))
+            self.cache_repository.set_many(self._encode_vectors(missing_texts, missing_vectors), self.ttl)
+            vectors.update(zip(missing_texts, self._round_vectors(missing_vectors)))
+        return [vectors[key] for key in keys]
+
+    async def acreate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously create embeddings for the given texts, only sending the texts missing from the cache to the wrapped service."""
+        keys = [self._build_key(text) for text in texts]
+        cached_values = await self.cache_repository.aget_many(list(dict.fromkeys(keys)))
+        vectors = self._decode_cached_vectors(keys, cached_values)
+        missing_texts = self._get_missing_texts(texts, keys, vectors)
+        if missing_texts:
+            missing_vectors = await self.embedding_service.acreate_embeddings(list(missing_texts.values()))
+            await self.cache_repository.aset_many(self._encode_vectors(missing_texts, missing_vectors), self.ttl)
+            vectors.update(zip(missing_texts, self._round_vectors(missing_vectors)))
+        return [vectors[key] for key in keys]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters of the embedding cache and the stats of its backend."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "backend": self.cache_repository.get_stats(),
+        }
+
+    def get_model_name(self) -> str:
+        """Return the name of the embedding model."""
+        return self.embedding_service.get_model_name()
+
+    def get_embedding_dimension(self) -> int:
+        """Return the dimension of the embedding vectors."""
+        return self.embedding_service.get_embedding_dimension()
+
+    async def aget_model_name(self) -> str:
+        """Asynchronously return the name of the embedding model."""
+        return await self.embedding_service.aget_model_name()
+
+    async def aget_embedding_dimension(self) -> int:
+        """Asynchronously return the dimension of the embedding vectors."""
+        return await self.embedding_service.aget_embedding_dimension()
+
+    def _build_key(self, text: str) -> str:
+        """Build the cache key of a text from the model name and the hash of the normalized text."""
+        normalized_text = re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text or "")).strip()
+        text_hash = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+        return f"embedding:{self.embedding_service.get_model_name()}:{text_hash}"
+
+    def _decode_cached_vectors(self, keys: List[str], cached_values: List[Optional[str]]) -> Dict[str, List[float]]:
+        """Decode the cached vectors and count hits and misses over all the requested texts."""
+        vectors = {
+            key: array("f", base64.b64decode(value)).tolist()
+            for key, value in zip(dict.fromkeys(keys), cached_values)
+            if value is not None
+        }
+        hits = sum(key in vectors for key in keys)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(keys) - hits
+        return vectors
+
+    def _get_missing_texts(self, texts: List[str], keys: List[str], vectors: Dict[str, List[float]]) -> Dict[str, str]:
+        """Return the distinct texts missing from the cache, keyed by their cache key."""
+        missing_texts = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in missing_texts:
+                missing_texts[key] = text
+        return missing_texts
+
+    def _round_vectors(self, vectors: List[List[float]]) -> List[List[float]]:
+        """Round vectors to the float32 values they are cached as."""
+        return [array("f", vector).tolist() for vector in vectors]
+
+    def _encode_vectors(self, missing_texts: Dict[str, str], vectors: List[List[float]]) -> Dict[str, str]:
+        """Encode vectors as base64 float32 strings, which are about 4 times smaller than JSON lists."""
+        return {
+            key: base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+            for key, vector in zip(missing_texts, vectors)
+        }
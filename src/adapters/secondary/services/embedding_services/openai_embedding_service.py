@@ -1,15 +1,28 @@
+import asyncio
 from typing import List
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from core.ports.secondary.services import EmbeddingService
+from infrastructure.utils.tokenizer import count_tokens, truncate_to_tokens
 
 class OpenAIEmbeddingServiceImpl(EmbeddingService):
-    def __init__(self, model_name: str = "text-embedding-3-small", base_url: str = None, api_key: str = None):
+    def __init__(self, model_name: str = "text-embedding-3-small", base_url: str = None, api_key: str = None,
+                 max_inputs_per_request: int = 2048, max_tokens_per_request: int = 300000, max_tokens_per_input: int = 8191,
+                 max_concurrent_requests: int = 8):
         self._model_name = model_name
         self.client = OpenAI(
             api_key=api_key,
             base_url=base_url
         )
+        self.async_client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url
+        )
+        # Provider limits of the embeddings endpoint
+        self.max_inputs_per_request = max_inputs_per_request
+        self.max_tokens_per_request = max_tokens_per_request
+        self.max_tokens_per_input = max_tokens_per_input
+        self.max_concurrent_requests = max_concurrent_requests
 
         # Model dimensions map
         self._dimension_map = {
@@ -25,28 +38,79 @@ class OpenAIEmbeddingServiceImpl(EmbeddingService):
             input=text
         )
         return response.data[0].embedding
-    
+
     async def acreate_embedding(self, text: str) -> list[float]:
-        """Create an embedding for the given text using OpenAI API."""
-        response = self.client.embeddings.create(
+        """Asynchronously create an embedding for the given text using OpenAI API."""
+        response = await self.async_client.embeddings.create(
             model=self._model_name,
             input=text
         )
         return response.data[0].embedding
 
+    def create_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Create embeddings for the given texts using as few OpenAI API requests as the provider limits allow."""
+        embeddings = []
+        for batch in self._pack_batches(texts):
+            response = self.client.embeddings.create(
+                model=self._model_name,
+                input=batch
+            )
+            embeddings.extend(data.embedding for data in sorted(response.data, key=lambda data: data.index))
+        return embeddings
+
+    async def acreate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Asynchronously create embeddings for the given texts, sending the request batches concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                response = await self.async_client.embeddings.create(
+                    model=self._model_name,
+                    input=batch
+                )
+            return [data.embedding for data in sorted(response.data, key=lambda data: data.index)]
+
+        batch_embeddings = await asyncio.gather(*(embed_batch(batch) for batch in self._pack_batches(texts)))
+        return [embedding for embeddings in batch_embeddings for embedding in embeddings]
+
+    def _pack_batches(self, texts: list[str]) -> list[list[str]]:
+        """
+        Pack texts into request batches respecting the per-request input and token limits.
+
+        Texts longer than the per-input token limit are truncated, and empty texts are replaced
+        by a single space since the API rejects empty inputs.
+        """
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for text in texts:
+            text = text if text and text.strip() else " "
+            num_tokens = count_tokens(text, self._model_name)
+            if num_tokens > self.max_tokens_per_input:
+                text = truncate_to_tokens(text, self.max_tokens_per_input, self._model_name)
+                num_tokens = self.max_tokens_per_input
+            if batch and (len(batch) >= self.max_inputs_per_request or batch_tokens + num_tokens > self.max_tokens_per_request):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += num_tokens
+        if batch:
+            batches.append(batch)
+        return batches
 
     def get_model_name(self) -> str:
         """Return the name of the embedding model."""
         return self._model_name
-    
-    def get_embedding_dimension(self) -> int:   
+
+    def get_embedding_dimension(self) -> int:
         """Return the dimension of the embedding vectors."""
         return self._dimension_map.get(self._model_name, 1536)
-    
+
     async def aget_model_name(self) -> str:
         """Asynchronously return the name of the embedding model."""
         return self._model_name
-    
+
     async def aget_embedding_dimension(self) -> int:
         """Asynchronously return the dimension of the embedding vectors."""
-        return self._dimension_map.get(self._model_name, 1536)
\ No newline at end of file
+        return self._dimension_map.get(self._model_name, 1536)
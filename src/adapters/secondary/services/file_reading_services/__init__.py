@@ -1,12 +1,24 @@
 
+# The readers depend on heavy libraries (Marker, MarkItDown, LangChain...), so they are
+# only imported when first accessed.
+import importlib
+
+_MODULES = {
+    "CSVFileReadingServiceImpl": ".csv_file_reading_service",
+    "DocxFileReadingServiceImpl": ".docx_file_reading_service",
+    "PdfFileReadingServiceImpl": ".pdf_file_reading_service",
+    "TxtFileReadingServiceImpl": ".txt_file_reading_service",
+    "XlsxFileReadingServiceImpl": ".xlsx_file_reading_service",
+    "MdFileReadingServiceImpl": ".md_file_reading_service",
+    "PptxFileReadingServiceImpl": ".pptx_file_reading_service",
+}
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .csv_file_reading_service import CSVFileReadingServiceImpl
-from .docx_file_reading_service import DocxFileReadingServiceImpl
-from .pdf_file_reading_service import PdfFileReadingServiceImpl
-from .txt_file_reading_service import TxtFileReadingServiceImpl
-from .xlsx_file_reading_service import XlsxFileReadingServiceImpl
-from .md_file_reading_service import MdFileReadingServiceImpl
-from .pptx_file_reading_service import PptxFileReadingServiceImpl
 
 __all__ = [
     "CSVFileReadingServiceImpl",
@@ -16,4 +28,4 @@ __all__ = [
     "XlsxFileReadingServiceImpl",
     "MdFileReadingServiceImpl",
     "PptxFileReadingServiceImpl"
-]
\ No newline at end of file
+]
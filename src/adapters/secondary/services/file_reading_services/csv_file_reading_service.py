@@ -1,8 +1,13 @@
+import asyncio
 import pathlib
+from itertools import islice
+from typing import AsyncIterator, Iterator
+
 from langchain_community.document_loaders.csv_loader import CSVLoader
 
 from core.ports.secondary.services import CsvFileReadingService
 from core.entities import InputFile, FileContent, PageContent, CsvReadFileConfig
+from infrastructure.utils.iter_utils import aiter_in_thread
 
 class CSVFileReadingServiceImpl(CsvFileReadingService):
     """Service implementation for reading CSV files."""
@@ -11,15 +16,7 @@ class CSVFileReadingServiceImpl(CsvFileReadingService):
 
     def read_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
         """Read the content of a CSV file."""
-        path = pathlib.Path(input_file.local_file_path)
-        loader = CSVLoader(file_path=path, autodetect_encoding=True)
-        data = loader.load()
-        content = "\n\n".join([doc.page_content for doc in data])
-        page_content = PageContent(
-            content=content,
-            page_number=0
-        )
-        page_contents = [page_content]
+        page_contents = list(self.iter_pages(input_file, read_file_config))
         file_content = FileContent(
             file_name=input_file.file_name,
             file_path=input_file.local_file_path,
@@ -28,7 +25,23 @@ class CSVFileReadingServiceImpl(CsvFileReadingService):
         )
         return file_content
     
-    async def aread_file(self, input_file, read_file_config, **kwargs):
-        """Asynchronously read the content of a CSV file."""
-        # TODO: Implement asynchronous reading of CSV files
-        pass
+    async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
+        """Asynchronously read the content of a CSV file without blocking the event loop."""
+        return await asyncio.to_thread(self.read_file, input_file, read_file_config, **kwargs)
+
+    def iter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> Iterator[PageContent]:
+        """Yield the rows of a CSV file in pages of rows_per_page rows, loading the rows lazily."""
+        read_file_config = CsvReadFileConfig(**read_file_config) if read_file_config else CsvReadFileConfig()
+        path = pathlib.Path(input_file.local_file_path)
+        loader = CSVLoader(file_path=path, autodetect_encoding=True)
+        rows = loader.lazy_load()
+        while page_rows := list(islice(rows, read_file_config.rows_per_page)):
+            yield PageContent(
+                content="\n\n".join([doc.page_content for doc in page_rows]),
+                page_number=0
+            )
+
+    async def aiter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> AsyncIterator[PageContent]:
+        """Asynchronously yield the rows of a CSV file in pages without blocking the event loop."""
+        async for page_content in aiter_in_thread(self.iter_pages(input_file, read_file_config, **kwargs)):
+            yield page_content
@@ -1,3 +1,4 @@
+import asyncio
 import pathlib
 from infrastructure.frameworks.markitdown_module import MarkitdownModule
 from core.ports.secondary.services import DocxFileReadingService
@@ -5,8 +6,8 @@ from core.entities import InputFile, FileContent, PageContent, DocxReadFileConfi
 
 class DocxFileReadingServiceImpl(DocxFileReadingService):
     """Service implementation for reading DOCX files."""
-    def __init__(self, markitdown_module: MarkitdownModule = MarkitdownModule()):
-        self.md = markitdown_module
+    def __init__(self, markitdown_module: MarkitdownModule = None):
+        self.md = markitdown_module or MarkitdownModule()
 
     def read_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
         """Read the content of a DOCX file."""
@@ -24,6 +25,6 @@ class DocxFileReadingServiceImpl(DocxFileReadingService):
         )
         return file_content
 
-    async def aread_file(self, input_file, read_file_config, **kwargs):
-        # TODO: Implement asynchronous reading of DOCX files
-        pass
+    async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
+        """Asynchronously read the content of a DOCX file without blocking the event loop."""
+        return await asyncio.to_thread(self.read_file, input_file, read_file_config, **kwargs)
@@ -1,5 +1,9 @@
+import asyncio
+from typing import AsyncIterator, Iterator
+
 from core.ports.secondary.services import MdFileReadingService
 from core.entities import InputFile, FileContent, PageContent, MdReadFileConfig
+from infrastructure.utils.iter_utils import aiter_in_thread, iter_text_blocks
 
 class MdFileReadingServiceImpl(MdFileReadingService):
     """Service implementation for reading MD files."""
@@ -8,13 +12,7 @@ class MdFileReadingServiceImpl(MdFileReadingService):
 
     def read_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
         """Read the content of a Markdown file."""
-        with open(input_file.local_file_path, "r", encoding="utf-8") as file:
-            content = file.read()
-        page_content = PageContent(
-            content=content,
-            page_number=0
-        )
-        page_contents = [page_content]
+        page_contents = list(self.iter_pages(input_file, read_file_config))
         file_content = FileContent(
             file_name=input_file.file_name,
             file_path=input_file.local_file_path,
@@ -23,6 +21,20 @@ class MdFileReadingServiceImpl(MdFileReadingService):
         )
         return file_content
 
-    async def aread_file(self, input_file, read_file_config, **kwargs):
-        # TODO: Implement asynchronous reading of MD files
-        pass
+    async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
+        """Asynchronously read the content of a Markdown file without blocking the event loop."""
+        return await asyncio.to_thread(self.read_file, input_file, read_file_config, **kwargs)
+
+    def iter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> Iterator[PageContent]:
+        """Yield the content of a Markdown file in blocks of whole lines, so that only one block is held in memory."""
+        read_file_config = MdReadFileConfig(**read_file_config) if read_file_config else MdReadFileConfig()
+        for content in iter_text_blocks(input_file.local_file_path, read_file_config.page_chars):
+            yield PageContent(
+                content=content,
+                page_number=0
+            )
+
+    async def aiter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> AsyncIterator[PageContent]:
+        """Asynchronously yield the content of a Markdown file in blocks of whole lines without blocking the event loop."""
+        async for page_content in aiter_in_thread(self.iter_pages(input_file, read_file_config, **kwargs)):
+            yield page_content
@@ -1,36 +1,100 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import AsyncIterator, Iterator, Optional, Union
+
+import pymupdf
 import pymupdf4llm
-from typing import Union
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+from retry.api import retry_call
 from core.ports.secondary.services import PdfFileReadingService, LLMService
 from core.entities import InputFile, FileContent, PageContent, PdfReadFileConfig, Message, LLMConfig, LLMCompletion
 
 from infrastructure.frameworks.marker_module import MarkerModule
 # from core.ports.secondary.services.common.llm_service import LLMService
-from infrastructure.utils.utils import pdf_to_base64_images, extract_markdown_text
+from infrastructure.utils.utils import iter_pdf_base64_images, extract_markdown_text
+from infrastructure.utils.iter_utils import aiter_in_thread
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying with backoff instead of failing the whole file
+RETRYABLE_LLM_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+def _convert_page_range_pymupdf(path: str, pages: list[int]) -> list[tuple[int, str]]:
+    """Convert a range of pages of a PDF to markdown. Defined at module level so it can run in a worker process."""
+    page_chunks = pymupdf4llm.to_markdown(path, pages=pages, page_chunks=True)
+    return [(page_number, page.get("text", "")) for page_number, page in zip(pages, page_chunks)]
+
 
 class PdfFileReadingServiceImpl(PdfFileReadingService):
     """Service implementation for reading PDF files."""
-    def __init__(self, llm_service: LLMService, marker: MarkerModule = MarkerModule()):
-        self.marker = marker
+    def __init__(self, llm_service: LLMService, marker: MarkerModule = None):
+        self.marker = marker or MarkerModule()
         self.llm_service = llm_service
 
-    def _convert_to_markdown_pymupdf(self, path: str) -> Union[list[PageContent], None]:
+    def _convert_to_markdown_pymupdf(self, path: str, num_workers: Optional[int] = None, pages_per_shard: int = 20) -> Union[list[PageContent], None]:
         """Convert PDF to markdown using Pymupdf."""
         try:
-            pages = pymupdf4llm.to_markdown(path, page_chunks=True)
-            page_contents = []
-            for i, page in enumerate(pages):
-                md_text = page.get("text", "")
-                if not md_text:
-                    continue
-                page_content = PageContent(
-                    content=md_text,
-                    page_number=i,
-                )
-                page_contents.append(page_content)
-            return page_contents
+            return list(self._iter_pages_pymupdf(path, num_workers=num_workers, pages_per_shard=pages_per_shard))
         except Exception as e:
-            print(f"Error converting PDF to markdown by Pymupdf: {e}")
+            logger.exception(f"Error converting PDF to markdown by Pymupdf: {e}")
             return None
+
+    def _iter_pages_pymupdf(self, path: str, num_workers: Optional[int] = None, pages_per_shard: int = 20) -> Iterator[PageContent]:
+        """
+        Convert PDF to markdown using Pymupdf, yielding the non-empty pages in document order.
+
+        Pages are converted by ranges of pages_per_shard, in parallel by a process pool for PDFs
+        longer than one range, so that only a few ranges are held in memory at once.
+        """
+        with pymupdf.open(path) as pdf:
+            page_count = pdf.page_count
+        shards = [list(range(start, min(start + pages_per_shard, page_count))) for start in range(0, page_count, pages_per_shard)]
+        num_workers = min(num_workers or os.cpu_count() or 1, len(shards))
+        if num_workers > 1:
+            pages = self._iter_shards_in_processes(path, shards, num_workers)
+        else:
+            pages = (page for shard in shards for page in _convert_page_range_pymupdf(path, shard))
+        for i, md_text in pages:
+            if not md_text:
+                continue
+            yield PageContent(
+                content=md_text,
+                page_number=i + 1,  # pymupdf counts pages from 0, page numbers start with 1
+            )
+
+    def _iter_shards_in_processes(self, path: str, shards: list[list[int]], num_workers: int) -> Iterator[tuple[int, str]]:
+        """
+        Convert page ranges in a process pool and yield their pages in document order, with at most
+        two ranges per worker pending. Falls back to the current process if no pool can be started.
+        """
+        done = 0
+        try:
+            # Spawned rather than forked: the pool is started from a thread of a multi-threaded process,
+            # where a fork may copy locks held by other threads and deadlock
+            with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                in_flight = deque()
+                for pages in shards:
+                    in_flight.append(executor.submit(_convert_page_range_pymupdf, path, pages))
+                    if len(in_flight) >= 2 * num_workers:
+                        shard_pages = in_flight.popleft().result()
+                        done += 1
+                        yield from shard_pages
+                while in_flight:
+                    shard_pages = in_flight.popleft().result()
+                    done += 1
+                    yield from shard_pages
+        except (AssertionError, OSError, BrokenProcessPool) as e:
+            # Daemonic processes, such as Celery prefork workers, are not allowed to start child processes,
+            # and a worker may crash, e.g. killed for its memory
+            logger.warning(f"Could not convert PDF pages in parallel, converting them in a single process: {e}")
+            for pages in shards[done:]:
+                yield from _convert_page_range_pymupdf(path, pages)
         
     def _convert_to_markdown_marker(self, path: str) -> Union[list[PageContent], None]:
         """Convert PDF to markdown using MarkerModule."""
@@ -45,21 +109,33 @@ class PdfFileReadingServiceImpl(PdfFileReadingService):
             print(f"Error converting PDF to markdown by MarkerModule: {e}")
             return None
 
-    def _convert_to_markdown_llm(self, path: str, pages_per_chunk=5) -> Union[list[PageContent], None]:
-        """Convert PDF to markdown using LLM."""
-        llm_config = LLMConfig(model="gpt-4.1-mini", temperature=0.01)
-        b64_images = pdf_to_base64_images(path)
+    def _chat_with_retry(self, llm_config: LLMConfig, messages: list[Message], max_retries: int) -> LLMCompletion:
+        """Chat with the LLM, retrying rate limit and transient errors with exponential backoff and jitter."""
+        return retry_call(
+            self.llm_service.chat,
+            fkwargs={"llm_config": llm_config, "messages": messages},
+            exceptions=RETRYABLE_LLM_ERRORS,
+            tries=max_retries + 1,
+            delay=1,
+            max_delay=30,
+            backoff=2,
+            jitter=(0, 1),
+            logger=logger,
+        )
 
-        image_messages = [{"type": "image_url", "image_url": {"url": url}} for url in b64_images]
+    def _convert_to_markdown_llm(self, path: str, pages_per_chunk=5, llm_concurrency: int = 4, llm_max_retries: int = 5,
+                                 image_format: str = "jpeg", image_quality: int = 80, image_width: int = 1000) -> Union[list[PageContent], None]:
+        """
+        Convert PDF to markdown using LLM, sending at most llm_concurrency page batches at a time.
 
-        i = 0
-        extracted_text = ''
-        while i < len(image_messages):
-            chunk = image_messages[i:i + pages_per_chunk]
-            if not chunk:
-                break
-            i += pages_per_chunk
-        
+        Pages are rendered lazily: a batch is sent as soon as its pages are rendered, and rendering
+        pauses while llm_concurrency batches are in flight, so memory does not grow with page count.
+        """
+        llm_config = LLMConfig(model="gpt-4.1-mini", temperature=0.01)
+        b64_images = iter_pdf_base64_images(path, width=image_width, image_format=image_format, quality=image_quality)
+        image_messages = ({"type": "image_url", "image_url": {"url": url}} for url in b64_images)
+
+        def extract_chunk(chunk: list[dict]) -> str:
             system_message = Message(
                 role="system",
                 content="You are a helpful assistant"
@@ -72,22 +148,38 @@ class PdfFileReadingServiceImpl(PdfFileReadingService):
                 ]
             )
 
-            response = self.llm_service.chat(
+            response = self._chat_with_retry(
                 llm_config=llm_config,  # Example LLM config
-                messages=[system_message, user_message]
+                messages=[system_message, user_message],
+                max_retries=llm_max_retries
             )
             if response and isinstance(response, LLMCompletion):
-                extracted_text += extract_markdown_text(response.text)
-                
-        return [PageContent(content=extracted_text, page_number=1)]
+                return extract_markdown_text(response.text)
+            return ''
+
+        extracted_texts = []
+        with ThreadPoolExecutor(max_workers=llm_concurrency) as executor:
+            # Futures are collected in submission order, which preserves the order of the page batches
+            in_flight = deque()
+            while chunk := list(islice(image_messages, pages_per_chunk)):
+                in_flight.append(executor.submit(extract_chunk, chunk))
+                if len(in_flight) >= llm_concurrency:
+                    extracted_texts.append(in_flight.popleft().result())
+            extracted_texts.extend(future.result() for future in in_flight)
+
+        return [
+            PageContent(content=extracted_text, page_number=i * pages_per_chunk + 1)
+            for i, extracted_text in enumerate(extracted_texts)
+            if extracted_text
+        ]
     
-    def _enhance_page_contents(self, page_contents: list[PageContent]) -> list[PageContent]:
+    def _enhance_page_contents(self, page_contents: list[PageContent], llm_concurrency: int = 4, llm_max_retries: int = 5) -> list[PageContent]:
+        """Enhance the pages with LLM, sending at most llm_concurrency pages at a time."""
         llm_config = LLMConfig(model="gpt-4.1-mini", temperature=0.01)
         
-        for i in range(len(page_contents)):
-            page_content = page_contents[i]
+        def enhance_page(page_content: PageContent) -> None:
             if not page_content.content.strip():
-                continue
+                return
             
             system_message = Message(
                 role="system",
@@ -98,29 +190,42 @@ class PdfFileReadingServiceImpl(PdfFileReadingService):
                 content=f"Given the text extracted from a PDF file, which might have some errors, please enhance the text by checking spelling and grammar.\n\nText: {page_content.content}.\n\nPlease return the enhanced text in markdown format in markdown code block (```markdown```)"
             )
             
-            response = self.llm_service.chat(
+            response = self._chat_with_retry(
                 llm_config=llm_config,
-                messages=[system_message, user_message]
+                messages=[system_message, user_message],
+                max_retries=llm_max_retries
             )
             
             if response and isinstance(response, LLMCompletion):
                 page_content.content = extract_markdown_text(response.text)
 
+        with ThreadPoolExecutor(max_workers=llm_concurrency) as executor:
+            # Consume the results to propagate errors
+            list(executor.map(enhance_page, page_contents))
+
         return page_contents
 
-    def _convert_to_markdown(self, path: str, force_ocr: bool = False, use_llm_extract: bool = False, use_llm_enhance: bool = False) -> Union[list[PageContent], None]:
+    def _convert_to_markdown(self, path: str, force_ocr: bool = False, use_llm_extract: bool = False, use_llm_enhance: bool = False, num_workers: Optional[int] = None, pages_per_shard: int = 20, llm_concurrency: int = 4, llm_max_retries: int = 5,
+                             image_format: str = "jpeg", image_quality: int = 80, image_width: int = 1000) -> Union[list[PageContent], None]:
         if force_ocr:
             page_contents = self._convert_to_markdown_marker(path)
         elif use_llm_extract:
-            page_contents = self._convert_to_markdown_llm(path)
+            page_contents = self._convert_to_markdown_llm(
+                path,
+                llm_concurrency=llm_concurrency,
+                llm_max_retries=llm_max_retries,
+                image_format=image_format,
+                image_quality=image_quality,
+                image_width=image_width
+            )
         else:
-            page_contents = self._convert_to_markdown_pymupdf(path)
+            page_contents = self._convert_to_markdown_pymupdf(path, num_workers=num_workers, pages_per_shard=pages_per_shard)
             if not page_contents:
                 page_contents = self._convert_to_markdown_marker(path)
         if not page_contents:
             raise ValueError("Failed to convert PDF to markdown using available methods.")
         if use_llm_enhance:
-            page_contents = self._enhance_page_contents(page_contents)
+            page_contents = self._enhance_page_contents(page_contents, llm_concurrency=llm_concurrency, llm_max_retries=llm_max_retries)
         return page_contents
 
     def read_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
@@ -129,7 +234,19 @@ class PdfFileReadingServiceImpl(PdfFileReadingService):
         use_llm_extract = getattr(read_file_config, "use_llm_extract", False)
         use_llm_enhance = getattr(read_file_config, "use_llm_enhance", False)
         print(f"force_ocr={force_ocr}, use_llm_extract={use_llm_extract}, use_llm_enhance={use_llm_enhance}")
-        page_contents = self._convert_to_markdown(input_file.local_file_path, force_ocr=force_ocr, use_llm_extract=use_llm_extract, use_llm_enhance=use_llm_enhance)
+        page_contents = self._convert_to_markdown(
+            input_file.local_file_path,
+            force_ocr=force_ocr,
+            use_llm_extract=use_llm_extract,
+            use_llm_enhance=use_llm_enhance,
+            num_workers=read_file_config.num_workers,
+            pages_per_shard=read_file_config.pages_per_shard,
+            llm_concurrency=read_file_config.llm_concurrency,
+            llm_max_retries=read_file_config.llm_max_retries,
+            image_format=read_file_config.image_format,
+            image_quality=read_file_config.image_quality,
+            image_width=read_file_config.image_width
+        )
         file_content = FileContent(
             file_name=input_file.file_name,
             file_path=input_file.local_file_path,
@@ -138,7 +255,37 @@ class PdfFileReadingServiceImpl(PdfFileReadingService):
         )
         return file_content
 
-    async def aread_file(self, input_file, read_file_config, **kwargs):
-        # TODO: Implement asynchronous reading of PDF files
-        pass
+    async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
+        """Asynchronously read the content of a PDF file without blocking the event loop."""
+        return await asyncio.to_thread(self.read_file, input_file, read_file_config, **kwargs)
+
+    def iter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> Iterator[PageContent]:
+        """
+        Yield the pages of a PDF file as they are converted.
+
+        Only the Pymupdf conversion streams, OCR and LLM conversions read the whole file first.
+        """
+        config = PdfReadFileConfig(**read_file_config) if read_file_config else PdfReadFileConfig()
+        if config.force_ocr or config.use_llm_extract or config.use_llm_enhance:
+            yield from super().iter_pages(input_file, read_file_config, **kwargs)
+            return
+        has_pages = False
+        try:
+            for page_content in self._iter_pages_pymupdf(input_file.local_file_path, num_workers=config.num_workers, pages_per_shard=config.pages_per_shard):
+                has_pages = True
+                yield page_content
+        except Exception as e:
+            # Pages already yielded cannot be taken back, so only fall back to Marker before the first one
+            if has_pages:
+                raise
+            logger.warning(f"Could not convert PDF to markdown by Pymupdf, falling back to Marker: {e}")
+        if not has_pages:
+            page_contents = self._convert_to_markdown_marker(input_file.local_file_path)
+            if not page_contents:
+                raise ValueError("Failed to convert PDF to markdown using available methods.")
+            yield from page_contents
 
+    async def aiter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> AsyncIterator[PageContent]:
+        """Asynchronously yield the pages of a PDF file as they are converted, without blocking the event loop."""
+        async for page_content in aiter_in_thread(self.iter_pages(input_file, read_file_config, **kwargs)):
+            yield page_content
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import unicodedata
@@ -39,6 +40,6 @@ class PptxFileReadingServiceImpl(PptxFileReadingService):
         s = re.sub(pattern, " ", s)
         return s
 
-    async def aread_file(self, input_file, read_file_config, **kwargs):
-        # TODO: Implement asynchronous reading of PPTX files
-        pass
+    async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
+        """Asynchronously read the content of a PPTX file without blocking the event loop."""
+        return await asyncio.to_thread(self.read_file, input_file, read_file_config, **kwargs)
@@ -1,3 +1,4 @@
+import asyncio
 import pandas as pd
 from core.ports.secondary.services import XlsxFileReadingService
 from core.entities import InputFile, FileContent, PageContent, XlsxReadFileConfig
@@ -23,6 +24,6 @@ class XlsxFileReadingServiceImpl(XlsxFileReadingService):
         )
         return file_content
 
-    async def aread_file(self, input_file, read_file_config, **kwargs):
-        # TODO: Implement asynchronous reading of XLSX files
-        pass
+    async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
+        """Asynchronously read the content of a XLSX file without blocking the event loop."""
+        return await asyncio.to_thread(self.read_file, input_file, read_file_config, **kwargs)
@@ -1,9 +1,15 @@
 
+import logging
+from typing import Callable, Optional
+
 from core.ports.secondary.services import GetRetrieveToolsService, EmbeddingService, RetrieveService
 
-from core.entities import Client, RagConfig, Tool, SearchQueryWithVector, Document
+from core.entities import Client, RagConfig, Tool, SearchQueryWithVector, SearchFilters, Document
+
+# File types the indexer reads, stored in the metadata of every chunk
+FILE_TYPES = ["pdf", "docx", "xlsx", "csv", "txt", "md", "pptx"]
+
 
-    
 class GetRetrieveToolsServiceImpl(GetRetrieveToolsService):
     """Service implementation for retrieving tools for a client."""
     def __init__(self):
@@ -11,46 +17,119 @@ class GetRetrieveToolsServiceImpl(GetRetrieveToolsService):
 
     def get_retrieve_tools(self, embedding_service: EmbeddingService, retrieve_service: RetrieveService, client: Client, rag_config: RagConfig) -> list[Tool]:
         """Retrieve tools for a client based on the provided RAG configuration."""
-        def search_local_knowledge_base(query: str) -> list[Document]:
-            """Search the local knowledge base to get the most relevant information to the query."""
+        query_vectors = {}
+
+        def embed_queries(arguments_list: list[dict]) -> None:
+            """Embed the queries of all search calls of a turn in one request."""
+            queries = self._get_new_queries(arguments_list, query_vectors)
+            if queries:
+                query_vectors.update(zip(queries, embedding_service.create_embeddings(queries)))
+
+        def search_local_knowledge_base(query: str, file_names: Optional[list[str]] = None, file_types: Optional[list[str]] = None,
+                                        page_from: Optional[int] = None, page_to: Optional[int] = None) -> list[Document]:
+            """Search the local knowledge base to get the most relevant information to the query, optionally narrowed to some files or pages."""
             try:
-                
-                vector = embedding_service.create_embedding(query)
+                vector = query_vectors.get(query) or embedding_service.create_embedding(query)
                 response = retrieve_service.retrieve(
                     search_query=SearchQueryWithVector(
                         vector=vector,
-                        text=query
+                        text=query,
+                        filters=self._build_search_filters(file_names, file_types, page_from, page_to)
                     ),
                     client=client,
-                    limit=rag_config.top_k
+                    limit=rag_config.top_k,
+                    rag_config=rag_config
                 )
                 return response
             except Exception as e:
-                import logging
                 logging.exception("Error retrieving documents from local knowledge base")
                 return f"Error retrieving documents: {e}"
-                
-        tool = Tool(
+
+        return [self._build_search_tool(search_local_knowledge_base, embed_queries)]
+
+
+    async def aget_retrieve_tools(self, embedding_service: EmbeddingService, retrieve_service: RetrieveService, client: Client, rag_config: RagConfig) -> list[Tool]:
+        """Asynchronously retrieve tools for a client based on the provided RAG configuration."""
+        query_vectors = {}
+
+        async def embed_queries(arguments_list: list[dict]) -> None:
+            """Embed the queries of all search calls of a turn in one request."""
+            queries = self._get_new_queries(arguments_list, query_vectors)
+            if queries:
+                query_vectors.update(zip(queries, await embedding_service.acreate_embeddings(queries)))
+
+        async def search_local_knowledge_base(query: str, file_names: Optional[list[str]] = None, file_types: Optional[list[str]] = None,
+                                              page_from: Optional[int] = None, page_to: Optional[int] = None) -> list[Document]:
+            """Search the local knowledge base to get the most relevant information to the query, optionally narrowed to some files or pages."""
+            try:
+                vector = query_vectors.get(query) or await embedding_service.acreate_embedding(query)
+                response = await retrieve_service.aretrieve(
+                    search_query=SearchQueryWithVector(
+                        vector=vector,
+                        text=query,
+                        filters=self._build_search_filters(file_names, file_types, page_from, page_to)
+                    ),
+                    client=client,
+                    limit=rag_config.top_k,
+                    rag_config=rag_config
+                )
+                return response
+            except Exception as e:
+                logging.exception("Error retrieving documents from local knowledge base")
+                return f"Error retrieving documents: {e}"
+
+        return [self._build_search_tool(search_local_knowledge_base, embed_queries)]
+
+    def _get_new_queries(self, arguments_list: list[dict], query_vectors: dict[str, list[float]]) -> list[str]:
+        """Return the distinct queries of the search calls which have not been embedded yet."""
+        queries = [arguments.get("query") for arguments in arguments_list]
+        return list(dict.fromkeys(query for query in queries if query and query not in query_vectors))
+
+    def _build_search_filters(self, file_names: Optional[list[str]], file_types: Optional[list[str]],
+                              page_from: Optional[int], page_to: Optional[int]) -> Optional[SearchFilters]:
+        """Build the filters of a search from the tool arguments, which the model sets to null when unused."""
+        filters = SearchFilters(file_names=file_names, file_types=file_types, page_from=page_from, page_to=page_to)
+        return None if filters.is_empty() else filters
+
+    def _build_search_tool(self, function: Callable, batch_prepare: Callable = None) -> Tool:
+        """Build the search_local_knowledge_base tool around a sync or async search function."""
+        return Tool(
             name="search_local_knowledge_base",
-            description="Search the local knowledge base to get the most relevant information to the query.",
+            description=(
+                "Search the local knowledge base to get the most relevant information to the query. "
+                "Set the filters to search only some files, file types or pages, e.g. a file cited by an earlier search; "
+                "leave them null to search everything."
+            ),
             arguments={
                 "type": "object",
                 "properties": {
                     "query": {
                         "type": "string",
                         "description": "The query to search for in the local knowledge base."
+                    },
+                    "file_names": {
+                        "type": ["array", "null"],
+                        "items": {"type": "string"},
+                        "description": "Exact names of the files to search in, or null for all files."
+                    },
+                    "file_types": {
+                        "type": ["array", "null"],
+                        "items": {"type": "string", "enum": FILE_TYPES},
+                        "description": "Types of the files to search in, or null for all types."
+                    },
+                    "page_from": {
+                        "type": ["integer", "null"],
+                        "description": "First page to search in, counting the first page of the file as 1, or null."
+                    },
+                    "page_to": {
+                        "type": ["integer", "null"],
+                        "description": "Last page to search in, counting the first page of the file as 1, or null."
                     }
                 },
-                "required": ["query"],
+                # Strict function calling requires every property, optional ones are nullable
+                "required": ["query", "file_names", "file_types", "page_from", "page_to"],
                 "additionalProperties": False
             },
-            function=search_local_knowledge_base
+            function=function,
+            batch_prepare=batch_prepare
         )
-        
-        return [tool]
-        
-
-    async def aget_retrieve_tools(self, embedding_service: EmbeddingService, retrieve_service: RetrieveService, client: Client, rag_config: RagConfig) -> list[Tool]:
-        """Asynchronously retrieve tools for a client based on the provided RAG configuration."""
-        # This is a placeholder implementation. Replace with actual asynchronous logic to retrieve tools.
-        return self.get_retrieve_tools(embedding_service, retrieve_service, client, rag_config)  # Simulating async behavior
\ No newline at end of file
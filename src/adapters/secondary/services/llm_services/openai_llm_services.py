@@ -1,16 +1,19 @@
 import json
-from typing import List
-from openai import OpenAI
+from typing import AsyncIterator, Iterator, List
+from openai import APIError, AsyncOpenAI, OpenAI
 
-from core.entities import LLMConfig, Message, Tool, ToolCall, LLMCompletion
+from core.entities import LLMConfig, Message, Tool, ToolCall, LLMCompletion, LLMCompletionChunk
 from core.ports.secondary.services.llm_service import LLMService
 
 class OpenAILLMServiceImpl(LLMService):
     """Implementation of the LLMService interface for OpenAI."""
 
-    def __init__(self, client: OpenAI = OpenAI(), llm_config_mapping: dict[str, LLMConfig] = {}):
-        self.client = client
+    def __init__(self, client: OpenAI = None, llm_config_mapping: dict[str, LLMConfig] = {}, async_client: AsyncOpenAI = None):
+        self.client = client if client else OpenAI()
+        self.async_client = async_client if async_client else AsyncOpenAI()
         self.llm_config_mapping = llm_config_mapping
+        # Async clients for LLM configs overriding the API key or base URL, keyed by (api_key, base_url)
+        self._async_clients: dict[tuple, AsyncOpenAI] = {}
 
 
     def chat(self, llm_config: LLMConfig, messages: List[Message], tools: List[Tool] = None) -> LLMCompletion:
@@ -25,9 +28,7 @@ class OpenAILLMServiceImpl(LLMService):
             LLMCompletion: The response from the LLM.
         """
         # Implementation for OpenAI's chat API call
-        if llm_config.api_key or llm_config.base_url:
-            self.client.api_key = llm_config.api_key
-            self.client.base_url = llm_config.base_url
+        self._configure_client(llm_config)
             
         openai_tools = self._build_tools(tools) if tools else []
         openai_messages = self.build_messages(messages)
@@ -38,25 +39,51 @@ class OpenAILLMServiceImpl(LLMService):
                 tools=openai_tools,
                 temperature=llm_config.temperature
             )
-            text = completion.choices[0].message.content
-            openai_tool_calls = completion.choices[0].message.tool_calls
-            openai_tool_calls = openai_tool_calls if openai_tool_calls else []
-            tool_calls = []
-            for openai_tool_call in openai_tool_calls:
-                arguments = json.loads(openai_tool_call.function.arguments)
-                tool_call = ToolCall(
-                    id=openai_tool_call.id,
-                    name=openai_tool_call.function.name,
-                    arguments=arguments
-                )
-                tool_calls.append(tool_call)
-            
-            return LLMCompletion(
-                text=text,
-                tool_calls=tool_calls
+            return self._parse_completion(completion)
+        except APIError:
+            raise  # Kept as is, so that callers can tell rate limits and transient errors apart
+        except Exception as e:
+            raise Exception(f"Error during OpenAI chat completion: {str(e)}") from e
+
+
+    def chat_stream(self, llm_config: LLMConfig, messages: List[Message], tools: List[Tool] = None) -> Iterator[LLMCompletionChunk]:
+        """
+        Perform a streaming chat operation using OpenAI's API.
+
+        Args:
+            messages (List[Message]): List of messages to send to the LLM.
+            tools (List[Tool], optional): List of tools to use during the chat. Defaults to None.
+
+        Yields:
+            LLMCompletionChunk: A chunk per text delta, then a chunk with the assembled completion.
+        """
+        self._configure_client(llm_config)
+        openai_tools = self._build_tools(tools) if tools else []
+        openai_messages = self.build_messages(messages)
+        try:
+            stream = self.client.chat.completions.create(
+                model=llm_config.model_path,
+                messages=openai_messages,
+                tools=openai_tools,
+                temperature=llm_config.temperature,
+                stream=True
             )
+            text_parts = []
+            partial_tool_calls = {}
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    text_parts.append(delta.content)
+                    yield LLMCompletionChunk(text=delta.content)
+                if delta.tool_calls:
+                    self._accumulate_tool_call_deltas(delta.tool_calls, partial_tool_calls)
+            yield LLMCompletionChunk(completion=self._build_streamed_completion(text_parts, partial_tool_calls))
+        except APIError:
+            raise  # Kept as is, so that callers can tell rate limits and transient errors apart
         except Exception as e:
-            raise Exception(f"Error during OpenAI chat completion: {str(e)}")
+            raise Exception(f"Error during OpenAI chat completion stream: {str(e)}") from e
    
    
     def get_llm_config_keys(self) -> List[str]:
@@ -88,8 +115,60 @@ class OpenAILLMServiceImpl(LLMService):
         Returns:
             LLMCompletion: The response from the LLM.
         """
-        # TODO: Implement asynchronous chat operation
-        raise NotImplementedError("Asynchronous chat operation is not implemented yet.")
+        async_client = self._get_async_client(llm_config)
+        openai_tools = self._build_tools(tools) if tools else []
+        openai_messages = self.build_messages(messages)
+        try:
+            completion = await async_client.chat.completions.create(
+                model=llm_config.model_path,
+                messages=openai_messages,
+                tools=openai_tools,
+                temperature=llm_config.temperature
+            )
+            return self._parse_completion(completion)
+        except APIError:
+            raise  # Kept as is, so that callers can tell rate limits and transient errors apart
+        except Exception as e:
+            raise Exception(f"Error during OpenAI chat completion: {str(e)}") from e
+    
+    async def achat_stream(self, llm_config: LLMConfig, messages: List[Message], tools: List[Tool] = None) -> AsyncIterator[LLMCompletionChunk]:
+        """
+        Asynchronously perform a streaming chat operation using OpenAI's API.
+
+        Args:
+            messages (List[Message]): List of messages to send to the LLM.
+            tools (List[Tool], optional): List of tools to use during the chat. Defaults to None.
+
+        Yields:
+            LLMCompletionChunk: A chunk per text delta, then a chunk with the assembled completion.
+        """
+        async_client = self._get_async_client(llm_config)
+        openai_tools = self._build_tools(tools) if tools else []
+        openai_messages = self.build_messages(messages)
+        try:
+            stream = await async_client.chat.completions.create(
+                model=llm_config.model_path,
+                messages=openai_messages,
+                tools=openai_tools,
+                temperature=llm_config.temperature,
+                stream=True
+            )
+            text_parts = []
+            partial_tool_calls = {}
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    text_parts.append(delta.content)
+                    yield LLMCompletionChunk(text=delta.content)
+                if delta.tool_calls:
+                    self._accumulate_tool_call_deltas(delta.tool_calls, partial_tool_calls)
+            yield LLMCompletionChunk(completion=self._build_streamed_completion(text_parts, partial_tool_calls))
+        except APIError:
+            raise  # Kept as is, so that callers can tell rate limits and transient errors apart
+        except Exception as e:
+            raise Exception(f"Error during OpenAI chat completion stream: {str(e)}") from e
     
     async def aget_llm_config_keys(self) -> List[str]:
         """Asynchronously retrieve a list of LLM configuration keys."""
@@ -110,6 +189,88 @@ class OpenAILLMServiceImpl(LLMService):
         # In a real implementation, this might involve an async database call or similar.
         self.add_llm_config(key, llm_config)
         
+    def _configure_client(self, llm_config: LLMConfig) -> None:
+        """Point the shared sync client at the API key and base URL of the LLM configuration, if any."""
+        if llm_config.api_key or llm_config.base_url:
+            self.client.api_key = llm_config.api_key
+            self.client.base_url = llm_config.base_url
+
+    def _get_async_client(self, llm_config: LLMConfig) -> AsyncOpenAI:
+        """
+        Get the async client for an LLM configuration.
+
+        Unlike the sync path, the shared client is never mutated since concurrent
+        requests may use different credentials.
+        """
+        if not (llm_config.api_key or llm_config.base_url):
+            return self.async_client
+        key = (llm_config.api_key, llm_config.base_url)
+        if key not in self._async_clients:
+            self._async_clients[key] = AsyncOpenAI(api_key=llm_config.api_key, base_url=llm_config.base_url)
+        return self._async_clients[key]
+
+    def _parse_completion(self, completion) -> LLMCompletion:
+        """
+        Parse an OpenAI chat completion into an LLMCompletion.
+
+        Args:
+            completion: The chat completion returned by the OpenAI API.
+
+        Returns:
+            LLMCompletion: The text and tool calls of the completion.
+        """
+        text = completion.choices[0].message.content
+        openai_tool_calls = completion.choices[0].message.tool_calls
+        openai_tool_calls = openai_tool_calls if openai_tool_calls else []
+        tool_calls = []
+        for openai_tool_call in openai_tool_calls:
+            arguments = json.loads(openai_tool_call.function.arguments)
+            tool_call = ToolCall(
+                id=openai_tool_call.id,
+                name=openai_tool_call.function.name,
+                arguments=arguments
+            )
+            tool_calls.append(tool_call)
+        
+        return LLMCompletion(
+            text=text,
+            tool_calls=tool_calls
+        )
+
+    def _accumulate_tool_call_deltas(self, tool_call_deltas: list, partial_tool_calls: dict[int, dict]) -> None:
+        """
+        Merge streamed tool call deltas into the partial tool calls, keyed by tool call index.
+
+        The id and name arrive in the first delta of a tool call while the JSON
+        arguments arrive in fragments which are concatenated.
+        """
+        for tool_call_delta in tool_call_deltas:
+            partial_tool_call = partial_tool_calls.setdefault(
+                tool_call_delta.index, {"id": None, "name": "", "arguments": ""}
+            )
+            if tool_call_delta.id:
+                partial_tool_call["id"] = tool_call_delta.id
+            if tool_call_delta.function:
+                if tool_call_delta.function.name:
+                    partial_tool_call["name"] += tool_call_delta.function.name
+                if tool_call_delta.function.arguments:
+                    partial_tool_call["arguments"] += tool_call_delta.function.arguments
+
+    def _build_streamed_completion(self, text_parts: list[str], partial_tool_calls: dict[int, dict]) -> LLMCompletion:
+        """Assemble the text deltas and partial tool calls of a stream into an LLMCompletion."""
+        tool_calls = [
+            ToolCall(
+                id=partial_tool_call["id"],
+                name=partial_tool_call["name"],
+                arguments=json.loads(partial_tool_call["arguments"] or "{}")
+            )
+            for _, partial_tool_call in sorted(partial_tool_calls.items())
+        ]
+        return LLMCompletion(
+            text="".join(text_parts) if text_parts else None,
+            tool_calls=tool_calls
+        )
+
     def build_messages(self, messages: List[Message]) -> List[dict]:
         """
         Build the messages for the OpenAI API.
@@ -0,0 +1,7 @@
+from .lexical_rerank_service import LexicalRerankServiceImpl
+from .onnx_rerank_service import OnnxCrossEncoderRerankServiceImpl
+
+__all__ = [
+    "LexicalRerankServiceImpl",
+    "OnnxCrossEncoderRerankServiceImpl"
+]
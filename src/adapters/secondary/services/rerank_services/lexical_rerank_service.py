@@ -0,0 +1,88 @@
+import math
+from collections import Counter
+from typing import Callable, List, Optional
+
+from core.ports.secondary.services import RerankService
+from core.ports.secondary.services.rerank_service import D
+
+from adapters.secondary.services.embedding_services.bm25_sparse_embedding_service import BM25SparseEmbeddingServiceImpl
+
+
+class LexicalRerankServiceImpl(RerankService):
+    """
+    Local reranker scoring the lexical match of each candidate with the query, without any model.
+
+    Term statistics come from the candidates themselves. A candidate scores on the BM25 weight of
+    the query terms it contains and on how much of the query it covers, pairs of adjacent query
+    terms counting as well so that phrases beat scattered words. The score is blended with the
+    retrieval rank, which carries the semantic match.
+    """
+
+    def __init__(self, tokenize: Optional[Callable[[str], List[str]]] = None, retrieval_weight: float = 0.3,
+                 k1: float = 1.2, b: float = 0.75):
+        self.tokenize = tokenize or BM25SparseEmbeddingServiceImpl().tokenize
+        self.retrieval_weight = retrieval_weight  # Share of the retrieval rank in the final score, between 0 and 1
+        self.k1 = k1
+        self.b = b
+
+    def rerank(self, query: str, documents: List[D], top_k: int) -> List[D]:
+        """Score the documents against the query and return the top_k best, best first."""
+        if len(documents) <= 1:
+            return documents[:top_k]
+        scores = self._score(query, documents)
+        # Python sorts are stable: equal scores keep the retrieval order
+        order = sorted(range(len(documents)), key=lambda i: scores[i], reverse=True)
+        return [documents[i] for i in order[:top_k]]
+
+    async def arerank(self, query: str, documents: List[D], top_k: int) -> List[D]:
+        """Asynchronously score the documents against the query and return the top_k best, best first."""
+        # Scoring a few dozen candidates takes well under a millisecond, not worth a thread
+        return self.rerank(query, documents, top_k)
+
+    def get_model_name(self) -> str:
+        """Return the name of the reranking model."""
+        return "lexical"
+
+    def _score(self, query: str, documents: List[D]) -> List[float]:
+        """Score each document, between 0 and 1."""
+        query_terms = self.tokenize(query)
+        document_terms = [self.tokenize(document.content) for document in documents]
+        query_features = self._get_features(query_terms)
+        document_features = [self._get_features(terms) for terms in document_terms]
+        if not query_features:
+            return [self._get_rank_prior(rank, len(documents)) for rank in range(len(documents))]
+
+        # Rarer features among the candidates tell them apart better
+        document_frequencies = Counter(feature for features in document_features for feature in set(features))
+        idf = {
+            feature: math.log(1 + (len(documents) - document_frequencies[feature] + 0.5) / (document_frequencies[feature] + 0.5))
+            for feature in query_features
+        }
+        total_idf = sum(idf.values())
+        avg_length = sum(len(terms) for terms in document_terms) / len(documents) or 1
+
+        bm25_scores, coverages = [], []
+        for terms, features in zip(document_terms, document_features):
+            length_norm = 1 - self.b + self.b * len(terms) / avg_length
+            matched = [feature for feature in query_features if feature in features]
+            bm25_scores.append(sum(
+                idf[feature] * features[feature] * (self.k1 + 1) / (features[feature] + self.k1 * length_norm)
+                for feature in matched
+            ))
+            coverages.append(sum(idf[feature] for feature in matched) / total_idf)
+        max_bm25 = max(bm25_scores) or 1
+        return [
+            (1 - self.retrieval_weight) * (0.5 * bm25 / max_bm25 + 0.5 * coverage)
+            + self.retrieval_weight * self._get_rank_prior(rank, len(documents))
+            for rank, (bm25, coverage) in enumerate(zip(bm25_scores, coverages))
+        ]
+
+    def _get_features(self, terms: List[str]) -> Counter:
+        """Count the terms and the pairs of adjacent terms of a text."""
+        features = Counter(terms)
+        features.update(f"{first} {second}" for first, second in zip(terms, terms[1:]))
+        return features
+
+    def _get_rank_prior(self, rank: int, count: int) -> float:
+        """Score the retrieval rank, from 1 for the first candidate down to 0 for the last."""
+        return 1 - rank / (count - 1) if count > 1 else 1.0
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from core.ports.secondary.services import RerankService
+from core.ports.secondary.services.rerank_service import D
+
+
+class OnnxCrossEncoderRerankServiceImpl(RerankService):
+    """
+    Local cross-encoder reranker running an ONNX model on CPU.
+
+    model_dir holds model.onnx and the tokenizer.json of a cross-encoder exported from Hugging Face,
+    e.g. cross-encoder/ms-marco-MiniLM-L-6-v2. onnxruntime and tokenizers are imported on first use,
+    both come with marker-pdf and markitdown.
+    """
+
+    def __init__(self, model_dir: str, max_length: int = 512, batch_size: int = 32, num_threads: Optional[int] = None):
+        self.model_dir = model_dir
+        self.max_length = max_length  # Tokens per (query, document) pair, documents are truncated
+        self.batch_size = batch_size  # Pairs per inference run, bounding memory on long candidate lists
+        self.num_threads = num_threads  # Intra-op threads of onnxruntime, None for its default
+        self._session = None
+        self._tokenizer = None
+        self._lock = threading.Lock()
+
+    def rerank(self, query: str, documents: List[D], top_k: int) -> List[D]:
+        """Score the (query, document) pairs with the cross-encoder and return the top_k best, best first."""
+        if len(documents) <= 1:
+            return documents[:top_k]
+        scores = self._score(query, [document.content for document in documents])
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [documents[i] for i in order]
+
+    async def arerank(self, query: str, documents: List[D], top_k: int) -> List[D]:
+        """Asynchronously rerank the documents, running the model in a thread not to block the event loop."""
+        return await asyncio.to_thread(self.rerank, query, documents, top_k)
+
+    def get_model_name(self) -> str:
+        """Return the name of the reranking model."""
+        return os.path.basename(os.path.normpath(self.model_dir))
+
+    def _load(self) -> None:
+        """Load the model and its tokenizer once."""
+        with self._lock:
+            if self._session is not None:
+                return
+            import onnxruntime
+            from tokenizers import Tokenizer
+
+            tokenizer = Tokenizer.from_file(os.path.join(self.model_dir, "tokenizer.json"))
+            tokenizer.enable_truncation(max_length=self.max_length, strategy="only_second")
+            tokenizer.enable_padding()
+            options = onnxruntime.SessionOptions()
+            if self.num_threads:
+                options.intra_op_num_threads = self.num_threads
+            self._tokenizer = tokenizer
+            self._session = onnxruntime.InferenceSession(
+                os.path.join(self.model_dir, "model.onnx"), options, providers=["CPUExecutionProvider"]
+            )
+
+    def _score(self, query: str, contents: List[str]) -> np.ndarray:
+        """Get the relevance logit of each content for the query."""
+        self._load()
+        input_names = {model_input.name for model_input in self._session.get_inputs()}
+        scores = []
+        for start in range(0, len(contents), self.batch_size):
+            encodings = self._tokenizer.encode_batch([(query, content) for content in contents[start:start + self.batch_size]])
+            inputs = {
+                "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+                "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+                "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+            }
+            logits = self._session.run(None, {name: value for name, value in inputs.items() if name in input_names})[0]
+            # Single logit models score relevance directly, two class models score it in their second column
+            scores.append(logits[:, -1] if logits.ndim == 2 else logits)
+        return np.concatenate(scores).astype(np.float32)
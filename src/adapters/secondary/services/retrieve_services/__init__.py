@@ -1,6 +1,10 @@
 
 from .semantic_retrieve_services import SemanticRetrieveServiceImpl
+from .hybrid_retrieve_services import HybridRetrieveServiceImpl
+from .reranking_retrieve_services import RerankingRetrieveServiceImpl
 
 __all__ = [
-    "SemanticRetrieveServiceImpl"
-    ]
\ No newline at end of file
+    "SemanticRetrieveServiceImpl",
+    "HybridRetrieveServiceImpl",
+    "RerankingRetrieveServiceImpl"
+    ]
@@ -0,0 +1,52 @@
+
+from typing import Optional, Union
+
+from core.ports.secondary.repositories import VectorDBRepository, CacheRepository
+from core.ports.secondary.services import SparseEmbeddingService, CollectionVersionService
+from core.entities import SearchQueryWithVector, Client, Document, DocumentWithVector, RagConfig
+
+from .semantic_retrieve_services import SemanticRetrieveServiceImpl
+
+
+class HybridRetrieveServiceImpl(SemanticRetrieveServiceImpl):
+    """Retrieve service fusing dense (semantic) and sparse (lexical) search, which catches exact terms such as part numbers or error codes."""
+
+    def __init__(self, vectordb_repository: VectorDBRepository, sparse_embedding_service: SparseEmbeddingService, cache_repository: Optional[CacheRepository] = None, collection_version_service: Optional[CollectionVersionService] = None, cache_ttl: Optional[int] = 3600):
+        super().__init__(vectordb_repository, cache_repository, collection_version_service, cache_ttl)
+        self.sparse_embedding_service = sparse_embedding_service
+
+    def _search(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Run the hybrid search, or the dense search only if rag_config asks for it."""
+        if rag_config and rag_config.retrieval_mode == "dense":
+            return super()._search(search_query, client, limit, rag_config, with_vectors)
+        search_query = search_query.model_copy(update={
+            "sparse_vector": self.sparse_embedding_service.create_query_sparse_embedding(search_query.text)
+        })
+        return self.vectordb_repository.retrieve_documents_hybrid(
+            client=client,
+            search_query=search_query,
+            limit=limit,
+            with_vectors=with_vectors,
+            **self._get_fusion_weights(rag_config)
+        )
+
+    async def _asearch(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Asynchronously run the hybrid search, or the dense search only if rag_config asks for it."""
+        if rag_config and rag_config.retrieval_mode == "dense":
+            return await super()._asearch(search_query, client, limit, rag_config, with_vectors)
+        search_query = search_query.model_copy(update={
+            "sparse_vector": await self.sparse_embedding_service.acreate_query_sparse_embedding(search_query.text)
+        })
+        return await self.vectordb_repository.aretrieve_documents_hybrid(
+            client=client,
+            search_query=search_query,
+            limit=limit,
+            with_vectors=with_vectors,
+            **self._get_fusion_weights(rag_config)
+        )
+
+    def _get_fusion_weights(self, rag_config: Optional[RagConfig]) -> dict[str, float]:
+        """Get the dense and sparse fusion weights of the request."""
+        if not rag_config:
+            return {"dense_weight": 1.0, "sparse_weight": 1.0}
+        return {"dense_weight": rag_config.dense_weight, "sparse_weight": rag_config.sparse_weight}
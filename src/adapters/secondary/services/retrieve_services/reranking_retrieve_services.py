@@ -0,0 +1,60 @@
+from typing import Optional, Union
+
+from core.ports.secondary.services import RetrieveService, RerankService
+from core.entities import SearchQueryWithVector, Client, Document, DocumentWithVector, RagConfig
+
+
+class RerankingRetrieveServiceImpl(RetrieveService):
+    """
+    Retrieve service decorator reranking the results of the wrapped service.
+
+    When rag_config asks for reranking, rerank_candidates documents are retrieved and scored against
+    the query in one batch, and only the best limit are returned, so that the model gets fewer but
+    better chunks.
+    """
+
+    def __init__(self, retrieve_service: RetrieveService, rerank_service: RerankService):
+        self.retrieve_service = retrieve_service
+        self.rerank_service = rerank_service
+
+    def retrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int = 10, rag_config: Optional[RagConfig] = None, with_vectors: bool = False) -> list[Union[Document, DocumentWithVector]]:
+        """
+        Retrieve documents with the wrapped service, over-fetching and reranking them if rag_config asks for it.
+
+        Args:
+            search_query (SearchQueryWithVector): The query object containing the vector and other parameters.
+            client (Client): The client object containing client-specific information.
+            limit (int): The maximum number of documents to retrieve.
+            rag_config (RagConfig, optional): The RAG configuration of the request, holding the reranking options.
+            with_vectors (bool): Whether to return the vectors of the documents, off by default to keep responses light.
+
+        Returns:
+            list[Union[Document, DocumentWithVector]]: The retrieved documents, best first.
+        """
+        if not rag_config or not rag_config.rerank:
+            return self.retrieve_service.retrieve(search_query, client, limit, rag_config, with_vectors)
+        candidates = self.retrieve_service.retrieve(search_query, client, self._get_candidate_count(limit, rag_config), rag_config, with_vectors)
+        return self.rerank_service.rerank(search_query.text, candidates, limit)
+
+    async def aretrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int = 10, rag_config: Optional[RagConfig] = None, with_vectors: bool = False) -> list[Union[Document, DocumentWithVector]]:
+        """
+        Asynchronously retrieve documents with the wrapped service, over-fetching and reranking them if rag_config asks for it.
+
+        Args:
+            search_query (SearchQueryWithVector): The query object containing the vector and other parameters.
+            client (Client): The client object containing client-specific information.
+            limit (int): The maximum number of documents to retrieve.
+            rag_config (RagConfig, optional): The RAG configuration of the request, holding the reranking options.
+            with_vectors (bool): Whether to return the vectors of the documents, off by default to keep responses light.
+
+        Returns:
+            list[Union[Document, DocumentWithVector]]: The retrieved documents, best first.
+        """
+        if not rag_config or not rag_config.rerank:
+            return await self.retrieve_service.aretrieve(search_query, client, limit, rag_config, with_vectors)
+        candidates = await self.retrieve_service.aretrieve(search_query, client, self._get_candidate_count(limit, rag_config), rag_config, with_vectors)
+        return await self.rerank_service.arerank(search_query.text, candidates, limit)
+
+    def _get_candidate_count(self, limit: int, rag_config: RagConfig) -> int:
+        """Get the number of candidates to rerank, never fewer than the documents returned."""
+        return max(limit, rag_config.rerank_candidates)
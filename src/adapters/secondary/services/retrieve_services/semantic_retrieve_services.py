@@ -1,38 +1,142 @@
+import hashlib
+import json
+import threading
 
+from core.ports.secondary.services import RetrieveService, CollectionVersionService
+from core.ports.secondary.repositories import VectorDBRepository, CacheRepository
+from typing import Any, Dict, Optional, Union
 
+from core.entities import SearchQueryWithVector, Client, DocumentWithVector, Document, RagConfig
+from infrastructure.utils.vector_utils import select_mmr
+
+# RAG configuration fields which change the retrieved documents
+RETRIEVAL_CONFIG_FIELDS = {"retrieval_mode", "dense_weight", "sparse_weight", "use_mmr", "mmr_lambda", "mmr_candidates"}
 
-from core.ports.secondary.services import RetrieveService
-from core.ports.secondary.repositories import VectorDBRepository
-from core.entities import SearchQueryWithVector, Client, DocumentWithVector, Document
 
 class SemanticRetrieveServiceImpl(RetrieveService):
-    def __init__(self, vectordb_repository: VectorDBRepository):
+    """
+    Retrieve service running a dense vector search.
+
+    With a cache_repository, the results are cached on the client, the version of its collection, the
+    query text, the limit, the filters and the retrieval configuration, so that repeated searches
+    do not hit the vector database until the documents of the client change.
+    """
+
+    def __init__(self, vectordb_repository: VectorDBRepository, cache_repository: Optional[CacheRepository] = None, collection_version_service: Optional[CollectionVersionService] = None, cache_ttl: Optional[int] = 3600):
         self.vectordb_repository = vectordb_repository
-        
-    def retrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int = 10) -> list[DocumentWithVector]:
+        self.cache_repository = cache_repository
+        self.collection_version_service = collection_version_service  # Without it, cached results only expire by cache_ttl
+        self.cache_ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def retrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int = 10, rag_config: Optional[RagConfig] = None, with_vectors: bool = False) -> list[Union[Document, DocumentWithVector]]:
         """
-        Retrieve documents based on a semantic query.
+        Retrieve documents based on a semantic query, selecting a diverse subset of more candidates if rag_config asks for MMR.
 
         Args:
             search_query (SearchQueryWithVector): The query object containing the vector and other parameters.
             client (Client): The client object containing client-specific information.
             limit (int): The maximum number of documents to retrieve.
+            rag_config (RagConfig, optional): The RAG configuration of the request.
+            with_vectors (bool): Whether to return the vectors of the documents, off by default to keep responses light.
 
         Returns:
-            list[DocumentWithVector]: The list of retrieved documents.
+            list[Union[Document, DocumentWithVector]]: The retrieved documents, with their vectors if with_vectors is set.
         """
-        return self.vectordb_repository.retrieve_documents(client=client, search_query=search_query, limit=limit)
+        if self.cache_repository is None or with_vectors:
+            return self._retrieve(search_query, client, limit, rag_config, with_vectors)
+        version = self.collection_version_service.get_version(client.id) if self.collection_version_service else ""
+        cache_key = self._build_cache_key(search_query, client, limit, rag_config, version)
+        cached_documents = self._decode_cached_documents(self.cache_repository.get(cache_key))
+        if cached_documents is not None:
+            return cached_documents
+        documents = self._retrieve(search_query, client, limit, rag_config, with_vectors)
+        self.cache_repository.set(cache_key, [document.model_dump(mode="json") for document in documents], self.cache_ttl)
+        return documents
 
-    async def aretrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int = 10) -> list[DocumentWithVector]:
+    async def aretrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int = 10, rag_config: Optional[RagConfig] = None, with_vectors: bool = False) -> list[Union[Document, DocumentWithVector]]:
         """
-        Asynchronously retrieve documents based on a semantic query.
+        Asynchronously retrieve documents based on a semantic query, selecting a diverse subset of more candidates if rag_config asks for MMR.
 
         Args:
             search_query (SearchQueryWithVector): The query object containing the vector and other parameters.
             client (Client): The client object containing client-specific information.
             limit (int): The maximum number of documents to retrieve.
+            rag_config (RagConfig, optional): The RAG configuration of the request.
+            with_vectors (bool): Whether to return the vectors of the documents, off by default to keep responses light.
 
         Returns:
-            list[DocumentWithVector]: The list of retrieved documents.
+            list[Union[Document, DocumentWithVector]]: The retrieved documents, with their vectors if with_vectors is set.
         """
-        return await self.vectordb_repository.aretrieve_documents(client=client, search_query=search_query, limit=limit)
\ No newline at end of file
+        if self.cache_repository is None or with_vectors:
+            return await self._aretrieve(search_query, client, limit, rag_config, with_vectors)
+        version = await self.collection_version_service.aget_version(client.id) if self.collection_version_service else ""
+        cache_key = self._build_cache_key(search_query, client, limit, rag_config, version)
+        cached_documents = self._decode_cached_documents(await self.cache_repository.aget(cache_key))
+        if cached_documents is not None:
+            return cached_documents
+        documents = await self._aretrieve(search_query, client, limit, rag_config, with_vectors)
+        await self.cache_repository.aset(cache_key, [document.model_dump(mode="json") for document in documents], self.cache_ttl)
+        return documents
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters of the retrieval cache and the stats of its backend."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "backend": self.cache_repository.get_stats() if self.cache_repository else None,
+        }
+
+    def _retrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Search the documents, selecting them by MMR among more candidates if rag_config asks for it."""
+        if not rag_config or not rag_config.use_mmr:
+            return self._search(search_query, client, limit, rag_config, with_vectors)
+        candidates = self._search(search_query, client, max(limit, rag_config.mmr_candidates), rag_config, with_vectors=True)
+        return self._select_mmr(search_query, candidates, limit, rag_config, with_vectors)
+
+    async def _aretrieve(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Asynchronously search the documents, selecting them by MMR among more candidates if rag_config asks for it."""
+        if not rag_config or not rag_config.use_mmr:
+            return await self._asearch(search_query, client, limit, rag_config, with_vectors)
+        candidates = await self._asearch(search_query, client, max(limit, rag_config.mmr_candidates), rag_config, with_vectors=True)
+        return self._select_mmr(search_query, candidates, limit, rag_config, with_vectors)
+
+    def _search(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Run the vector search."""
+        return self.vectordb_repository.retrieve_documents(client=client, search_query=search_query, limit=limit, with_vectors=with_vectors)
+
+    async def _asearch(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Asynchronously run the vector search."""
+        return await self.vectordb_repository.aretrieve_documents(client=client, search_query=search_query, limit=limit, with_vectors=with_vectors)
+
+    def _select_mmr(self, search_query: SearchQueryWithVector, candidates: list[DocumentWithVector], limit: int, rag_config: RagConfig, with_vectors: bool) -> list[Union[Document, DocumentWithVector]]:
+        """Select limit candidates by maximal marginal relevance, so that near duplicate chunks do not crowd out the others."""
+        selected = [candidates[i] for i in select_mmr(search_query.vector, [c.vector for c in candidates], limit, rag_config.mmr_lambda)]
+        if with_vectors:
+            return selected
+        return [Document(**document.model_dump(exclude={"vector", "sparse_vector"})) for document in selected]
+
+    def _build_cache_key(self, search_query: SearchQueryWithVector, client: Client, limit: int, rag_config: Optional[RagConfig], version: str) -> str:
+        """Build the cache key of a search from everything its results depend on."""
+        search = {
+            "text": search_query.text,
+            "limit": limit,
+            "filters": search_query.filters.model_dump(mode="json") if search_query.filters else None,
+            "rag_config": rag_config.model_dump(mode="json", include=RETRIEVAL_CONFIG_FIELDS) if rag_config else None,
+        }
+        search_hash = hashlib.sha256(json.dumps(search, sort_keys=True).encode("utf-8")).hexdigest()
+        return f"retrieval:{client.id}:{version}:{search_hash}"
+
+    def _decode_cached_documents(self, value: Optional[list]) -> Optional[list[Document]]:
+        """Count a cache lookup and decode the cached documents."""
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return [Document(**document) for document in value] if value is not None else None
@@ -1,45 +1,136 @@
 
-from typing import List
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, List
 
 from core.ports.secondary.services import ToolCallHandlingService
 from core.entities import ToolCall, ToolCallResponse, Tool
 
 class ToolCallHandlingServiceImpl(ToolCallHandlingService):
     """Service implementation for handling tool calls."""
-    
-    def __init__(self):
-        pass
+
+    def __init__(self, max_workers: int = 8, tool_call_timeout: float = 30.0):
+        self.max_workers = max_workers  # Maximum number of tool calls running in parallel
+        self.tool_call_timeout = tool_call_timeout  # Timeout in seconds for each tool call dispatched in parallel
 
     def handle_tool_calls(self, tool_calls: List[ToolCall], tools: List[Tool], parallel: bool = False) -> List[ToolCallResponse]:
-        """Handle multiple tool calls and return their responses."""
-        tool_call_responses = []
-        tool_mapping = {tool.name: tool.function for tool in tools}
-        for tool_call in tool_calls:
-            tool_name = tool_call.name
-            if tool_name in tool_mapping:
+        """
+        Handle multiple tool calls and return their responses in the order of the calls.
+
+        When parallel is set, the calls are dispatched to a thread pool and each call
+        is bounded by tool_call_timeout.
+        """
+        tool_mapping = {tool.name: tool for tool in tools}
+        tool_calls = [tool_call for tool_call in tool_calls if tool_call.name in tool_mapping]
+        self._prepare_tool_calls(tool_calls, tool_mapping)
+
+        if not parallel or len(tool_calls) <= 1:
+            tool_call_responses = []
+            for tool_call in tool_calls:
                 try:
-                    tool_response = tool_mapping[tool_name](**tool_call.arguments)
-
-                    tool_call_responses.append(
-                        ToolCallResponse(
-                            id=tool_call.id,
-                            name=tool_name,
-                            arguments=tool_call.arguments,
-                            tool_response=tool_response
-                        )
-                    )
+                    tool_response = tool_mapping[tool_call.name].function(**tool_call.arguments)
                 except Exception as e:
-                    tool_call_responses.append(
-                        ToolCallResponse(
-                            id=tool_call.id,
-                            name=tool_name,
-                            arguments=tool_call.arguments,
-                            tool_response=f"Error: {str(e)}"
-                        )
-                    )
-        return tool_call_responses
+                    tool_response = f"Error: {str(e)}"
+                tool_call_responses.append(self._build_tool_call_response(tool_call, tool_response))
+            return tool_call_responses
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(tool_calls)))
+        try:
+            # The arguments are unpacked in the worker, so malformed ones fail only their call
+            futures = [executor.submit(self._call_tool, tool_mapping[tool_call.name], tool_call) for tool_call in tool_calls]
+            deadline = time.monotonic() + self.tool_call_timeout
+            tool_call_responses = []
+            for tool_call, future in zip(tool_calls, futures):
+                try:
+                    tool_response = future.result(timeout=max(0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    tool_response = f"Error: tool call timed out after {self.tool_call_timeout} seconds"
+                except Exception as e:
+                    tool_response = f"Error: {str(e)}"
+                tool_call_responses.append(self._build_tool_call_response(tool_call, tool_response))
+            return tool_call_responses
+        finally:
+            # Do not wait for timed out calls to finish
+            executor.shutdown(wait=False, cancel_futures=True)
 
     async def ahandle_tool_calls(self, tool_calls: List[ToolCall], tools: List[Tool], parallel: bool = False) -> List[ToolCallResponse]:
-        """Asynchronously handle multiple tool calls and return their responses."""
-        # TODO: Implement actual asynchronous handling of tool calls.
-        return self.handle_tool_calls(tool_calls, tools, parallel)
\ No newline at end of file
+        """
+        Asynchronously handle multiple tool calls and return their responses in the order of the calls.
+
+        When parallel is set, the calls are gathered concurrently and each call is
+        bounded by tool_call_timeout.
+        """
+        tool_mapping = {tool.name: tool for tool in tools}
+        tool_calls = [tool_call for tool_call in tool_calls if tool_call.name in tool_mapping]
+        await self._aprepare_tool_calls(tool_calls, tool_mapping)
+
+        if parallel:
+            return list(await asyncio.gather(
+                *(self._acall_tool(tool_mapping[tool_call.name], tool_call, self.tool_call_timeout) for tool_call in tool_calls)
+            ))
+        tool_call_responses = []
+        for tool_call in tool_calls:
+            tool_call_responses.append(await self._acall_tool(tool_mapping[tool_call.name], tool_call))
+        return tool_call_responses
+
+    def _call_tool(self, tool: Tool, tool_call: ToolCall) -> Any:
+        """Call a tool with the arguments of a tool call."""
+        return tool.function(**tool_call.arguments)
+
+    async def _acall_tool(self, tool: Tool, tool_call: ToolCall, timeout: float = None) -> ToolCallResponse:
+        """Asynchronously call a sync or async tool, turning failures and timeouts into error responses."""
+        try:
+            if inspect.iscoroutinefunction(tool.function):
+                coroutine = tool.function(**tool_call.arguments)
+            else:
+                coroutine = asyncio.to_thread(tool.function, **tool_call.arguments)
+            tool_response = await asyncio.wait_for(coroutine, timeout=timeout)
+        except asyncio.TimeoutError:
+            tool_response = f"Error: tool call timed out after {timeout} seconds"
+        except Exception as e:
+            tool_response = f"Error: {str(e)}"
+        return self._build_tool_call_response(tool_call, tool_response)
+
+    def _prepare_tool_calls(self, tool_calls: List[ToolCall], tool_mapping: dict[str, Tool]) -> None:
+        """Call the batch_prepare hook of each tool once with the arguments of all its calls."""
+        for tool_name, arguments_list in self._group_arguments(tool_calls).items():
+            batch_prepare = tool_mapping[tool_name].batch_prepare
+            if not batch_prepare:
+                continue
+            try:
+                batch_prepare(arguments_list)
+            except Exception as e:
+                logging.warning(f"Failed to prepare calls of tool {tool_name}: {e}")
+
+    async def _aprepare_tool_calls(self, tool_calls: List[ToolCall], tool_mapping: dict[str, Tool]) -> None:
+        """Asynchronously call the batch_prepare hook of each tool once with the arguments of all its calls."""
+        for tool_name, arguments_list in self._group_arguments(tool_calls).items():
+            batch_prepare = tool_mapping[tool_name].batch_prepare
+            if not batch_prepare:
+                continue
+            try:
+                if inspect.iscoroutinefunction(batch_prepare):
+                    await batch_prepare(arguments_list)
+                else:
+                    await asyncio.to_thread(batch_prepare, arguments_list)
+            except Exception as e:
+                logging.warning(f"Failed to prepare calls of tool {tool_name}: {e}")
+
+    def _group_arguments(self, tool_calls: List[ToolCall]) -> dict[str, list[dict]]:
+        """Group the arguments of the tool calls by tool name."""
+        arguments_by_tool = {}
+        for tool_call in tool_calls:
+            arguments_by_tool.setdefault(tool_call.name, []).append(tool_call.arguments)
+        return arguments_by_tool
+
+    def _build_tool_call_response(self, tool_call: ToolCall, tool_response: Any) -> ToolCallResponse:
+        """Build the response of a tool call."""
+        return ToolCallResponse(
+            id=tool_call.id,
+            name=tool_call.name,
+            arguments=tool_call.arguments,
+            tool_response=tool_response
+        )
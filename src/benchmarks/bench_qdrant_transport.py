@@ -0,0 +1,105 @@
+"""
+Qdrant transport benchmark.
+
+Compares the REST and gRPC transports against a running Qdrant: throughput of batched upserts
+and latency and throughput of top-k queries run from several threads sharing one client, as the
+API and the Celery workers do.
+
+Usage (from the src directory, with Qdrant exposing 6333 and 6334):
+    python -m benchmarks.bench_qdrant_transport --url http://localhost:6333 --points 20000 --threads 8
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+
+
+def build_points(count: int, dimension: int) -> list[PointStruct]:
+    """Build random points with a payload shaped like indexed chunks."""
+    return [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=[random.uniform(-1, 1) for _ in range(dimension)],
+            payload={
+                "content": " ".join(random.choices(["lorem", "ipsum", "dolor", "sit", "amet"], k=120)),
+                "file_name": f"file_{i % 50}.pdf",
+                "file_path": f"/data/file_{i % 50}.pdf",
+                "page_number": i % 30 + 1,
+                "client_id": "bench",
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def bench_upserts(client: QdrantClient, collection: str, points: list[PointStruct], batch_size: int) -> float:
+    """Upsert the points in batches and return the throughput in points per second."""
+    start = time.perf_counter()
+    for i in range(0, len(points), batch_size):
+        client.upsert(collection_name=collection, points=points[i:i + batch_size], wait=True)
+    return len(points) / (time.perf_counter() - start)
+
+
+def bench_queries(client: QdrantClient, collection: str, queries: list[list[float]], top_k: int, threads: int) -> tuple[list[float], float]:
+    """Run the queries from a thread pool and return their latencies in milliseconds and the queries per second."""
+
+    def query(vector: list[float]) -> float:
+        start = time.perf_counter()
+        client.query_points(collection_name=collection, query=vector, limit=top_k, with_payload=True, with_vectors=False)
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = list(executor.map(query, queries))
+    return latencies, len(queries) / (time.perf_counter() - start)
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.environ.get("QDRANT_URL", "http://localhost:6333"), help="Qdrant REST URL")
+    parser.add_argument("--grpc-port", type=int, default=int(os.environ.get("QDRANT_GRPC_PORT") or 6334), help="Qdrant gRPC port")
+    parser.add_argument("--points", type=int, default=20000, help="Number of points upserted per transport")
+    parser.add_argument("--dimension", type=int, default=1536, help="Vector dimension")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per upsert request")
+    parser.add_argument("--queries", type=int, default=1000, help="Number of queries per transport")
+    parser.add_argument("--top-k", type=int, default=20, help="Number of results per query")
+    parser.add_argument("--threads", type=int, default=8, help="Threads sending queries concurrently")
+    args = parser.parse_args()
+
+    points = build_points(args.points, args.dimension)
+    queries = [[random.uniform(-1, 1) for _ in range(args.dimension)] for _ in range(args.queries)]
+
+    for transport, prefer_grpc in (("REST", False), ("gRPC", True)):
+        client = QdrantClient(url=args.url, grpc_port=args.grpc_port, prefer_grpc=prefer_grpc, pool_size=args.threads)
+        collection = f"bench_transport_{uuid.uuid4().hex[:8]}"
+        client.create_collection(collection, vectors_config=VectorParams(size=args.dimension, distance=Distance.COSINE))
+        try:
+            upserts_per_second = bench_upserts(client, collection, points, args.batch_size)
+            bench_queries(client, collection, queries[:20], args.top_k, args.threads)  # Warm up
+            latencies, queries_per_second = bench_queries(client, collection, queries, args.top_k, args.threads)
+            print(
+                f"{transport:5} upserts {upserts_per_second:9.0f} points/s  "
+                f"queries {queries_per_second:7.0f}/s  p50 {statistics.median(latencies):6.2f}ms  "
+                f"p95 {percentile(latencies, 0.95):6.2f}ms"
+            )
+        finally:
+            client.delete_collection(collection)
+            client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
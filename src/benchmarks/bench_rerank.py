@@ -0,0 +1,91 @@
+"""
+Reranking benchmark.
+
+Reranks the candidates of a fixture corpus, listed in the order a dense first stage returned them,
+and compares the retrieval order with each reranker: mean reciprocal rank, recall of the relevant
+passages in the top k kept for the model, and reranking latency per query.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_rerank --top-k 3
+    python -m benchmarks.bench_rerank --onnx-model-dir models/ms-marco-MiniLM-L-6-v2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from adapters.secondary.services.rerank_services import LexicalRerankServiceImpl, OnnxCrossEncoderRerankServiceImpl
+from core.entities import Document
+from core.ports.secondary.services import RerankService
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "rerank_corpus.json")
+
+
+def load_fixture(path: str) -> list[tuple[str, list[Document], set[str]]]:
+    """Load the queries of the fixture with their candidate documents, in retrieval order, and their relevant ids."""
+    with open(path, encoding="utf-8") as f:
+        fixture = json.load(f)
+    return [
+        (
+            query["query"],
+            [Document(id=passage_id, content=fixture["passages"][passage_id]) for passage_id in query["candidates"]],
+            set(query["relevant"]),
+        )
+        for query in fixture["queries"]
+    ]
+
+
+def evaluate(ranked: list[list[Document]], relevant: list[set[str]], top_k: int) -> tuple[float, float]:
+    """Return the mean reciprocal rank of the first relevant document and the mean recall in the top_k."""
+    reciprocal_ranks, recalls = [], []
+    for documents, relevant_ids in zip(ranked, relevant):
+        ids = [document.id for document in documents]
+        first = next((rank for rank, document_id in enumerate(ids, 1) if document_id in relevant_ids), None)
+        reciprocal_ranks.append(1 / first if first else 0.0)
+        recalls.append(len(relevant_ids & set(ids[:top_k])) / len(relevant_ids))
+    return statistics.mean(reciprocal_ranks), statistics.mean(recalls)
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def bench_reranker(name: str, rerank_service: RerankService, queries: list, top_k: int, repeats: int) -> None:
+    """Rerank every query repeats times and print the quality and latency of the reranker."""
+    ranked = [rerank_service.rerank(query, candidates, len(candidates)) for query, candidates, _ in queries]  # Also warms up
+    latencies = []
+    for _ in range(repeats):
+        for query, candidates, _ in queries:
+            start = time.perf_counter()
+            rerank_service.rerank(query, candidates, top_k)
+            latencies.append((time.perf_counter() - start) * 1000)
+    mrr, recall = evaluate(ranked, [relevant for _, _, relevant in queries], top_k)
+    print(
+        f"{name:10} MRR {mrr:.3f}  recall@{top_k} {recall:.3f}  "
+        f"latency p50 {statistics.median(latencies):7.3f}ms  p95 {percentile(latencies, 0.95):7.3f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", default=FIXTURE_PATH, help="Fixture corpus")
+    parser.add_argument("--top-k", type=int, default=3, help="Number of documents kept for the model")
+    parser.add_argument("--repeats", type=int, default=50, help="Number of timed passes over the queries")
+    parser.add_argument("--onnx-model-dir", help="Directory of an ONNX cross-encoder (model.onnx and tokenizer.json)")
+    args = parser.parse_args()
+
+    queries = load_fixture(args.fixture)
+    mrr, recall = evaluate([candidates for _, candidates, _ in queries], [relevant for _, _, relevant in queries], args.top_k)
+    print(f"{'retrieval':10} MRR {mrr:.3f}  recall@{args.top_k} {recall:.3f}")
+    bench_reranker("lexical", LexicalRerankServiceImpl(), queries, args.top_k, args.repeats)
+    if args.onnx_model_dir:
+        bench_reranker("onnx", OnnxCrossEncoderRerankServiceImpl(args.onnx_model_dir), queries, args.top_k, args.repeats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
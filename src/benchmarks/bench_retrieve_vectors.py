@@ -0,0 +1,105 @@
+"""
+Retrieval payload benchmark.
+
+Fills a temporary Qdrant collection with random points and compares top-k searches returning
+the vectors with searches returning the projected payload only, reporting the latency and the
+size of the returned points.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_retrieve_vectors --url http://localhost:6333 --points 5000 --top-k 20
+    python -m benchmarks.bench_retrieve_vectors --memory
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+
+PAYLOAD_FIELDS = ["content", "file_name", "file_path", "page_number"]
+
+
+def build_points(count: int, dimension: int) -> list[PointStruct]:
+    """Build random points with a payload shaped like indexed chunks."""
+    return [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=[random.uniform(-1, 1) for _ in range(dimension)],
+            payload={
+                "content": " ".join(random.choices(["lorem", "ipsum", "dolor", "sit", "amet"], k=120)),
+                "file_name": f"file_{i % 50}.pdf",
+                "file_path": f"/data/file_{i % 50}.pdf",
+                "page_number": i % 30 + 1,
+                "client_id": "bench",
+                "file_hash": uuid.uuid4().hex,
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def run_queries(client: QdrantClient, collection: str, queries: list[list[float]], top_k: int, with_vectors: bool) -> tuple[list[float], int]:
+    """Run the queries and return their latencies in milliseconds and the mean response size in bytes."""
+    latencies, sizes = [], []
+    for query in queries:
+        start = time.perf_counter()
+        response = client.query_points(
+            collection_name=collection,
+            query=query,
+            limit=top_k,
+            with_payload=True if with_vectors else PAYLOAD_FIELDS,
+            with_vectors=with_vectors,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        sizes.append(len(json.dumps([p.model_dump() for p in response.points])))
+    return latencies, int(statistics.mean(sizes))
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.environ.get("QDRANT_URL", "http://localhost:6333"), help="Qdrant URL")
+    parser.add_argument("--memory", action="store_true", help="Use an in-process Qdrant instead of a server")
+    parser.add_argument("--points", type=int, default=5000, help="Number of points in the collection")
+    parser.add_argument("--dimension", type=int, default=1536, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries per mode")
+    parser.add_argument("--top-k", type=int, default=20, help="Number of results per query")
+    args = parser.parse_args()
+
+    client = QdrantClient(":memory:") if args.memory else QdrantClient(url=args.url)
+    collection = f"bench_retrieve_vectors_{uuid.uuid4().hex[:8]}"
+    client.create_collection(collection, vectors_config=VectorParams(size=args.dimension, distance=Distance.COSINE))
+    try:
+        points = build_points(args.points, args.dimension)
+        for i in range(0, len(points), 256):
+            client.upsert(collection_name=collection, points=points[i:i + 256])
+        queries = [[random.uniform(-1, 1) for _ in range(args.dimension)] for _ in range(args.queries)]
+        run_queries(client, collection, queries[:10], args.top_k, with_vectors=False)  # Warm up
+
+        results = {}
+        for with_vectors in (True, False):
+            latencies, size = run_queries(client, collection, queries, args.top_k, with_vectors)
+            results[with_vectors] = size
+            label = "with vectors   " if with_vectors else "payload only   "
+            print(
+                f"{label} p50 {percentile(latencies, 0.5):7.2f}ms  p95 {percentile(latencies, 0.95):7.2f}ms  "
+                f"response {size / 1024:8.1f} KiB"
+            )
+        print(f"bandwidth saved: {1 - results[False] / results[True]:.1%} per query")
+    finally:
+        client.delete_collection(collection)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Startup time benchmark.
+
+Imports the API (main) and the Celery task module in fresh interpreters, reports the import
+time and fails if it exceeds a budget or if heavy libraries are imported at startup.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_startup --runs 5 --max-seconds 2.0
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Libraries which must only be imported when a request needs them
+HEAVY_MODULES = [
+    "torch",
+    "marker",
+    "markitdown",
+    "pandas",
+    "langchain_community",
+    "pymupdf4llm",
+    "qdrant_client",
+    "openai",
+]
+
+ENTRYPOINTS = [
+    "main",
+    "adapters.primary.rest.celery_tasks.index_document_task",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import a module in a fresh interpreter and return the import time and the heavy modules loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold imports per entrypoint")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if the median import time exceeds this budget")
+    args = parser.parse_args()
+
+    failed = False
+    for module in ENTRYPOINTS:
+        measurements = [measure(module) for _ in range(args.runs)]
+        seconds = [m["seconds"] for m in measurements]
+        heavy = sorted({name for m in measurements for name in m["heavy"]})
+        median = statistics.median(seconds)
+        print(f"{module}: median {median:.3f}s, min {min(seconds):.3f}s, max {max(seconds):.3f}s over {args.runs} runs")
+        if heavy:
+            print(f"  heavy modules imported at startup: {', '.join(heavy)}")
+            failed = True
+        if args.max_seconds is not None and median > args.max_seconds:
+            print(f"  median import time exceeds the budget of {args.max_seconds:.3f}s")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Tenancy layout benchmark.
+
+Indexes the same tenants in one collection per client and in one shared collection with the
+client_id tenant index, and compares the time to load them, the memory used by Qdrant and the
+latency of searches of random tenants. Memory is read from the Qdrant metrics endpoint, or
+from the Python heap with --memory. An in-process Qdrant has no HNSW graph nor payload index
+and scans the whole collection, so only a server gives meaningful search latencies.
+
+Usage (from the src directory):
+    python -m benchmarks.bench_tenancy --url http://localhost:6333 --tenants 1000 --points 50
+    python -m benchmarks.bench_tenancy --memory --tenants 100
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+
+import httpx
+from qdrant_client import QdrantClient
+
+from adapters.secondary.repositories.vectordb_repositories.qdrant_vectordb_repository import QdrantVectorDBRepositoryImpl
+from core.entities import Client, DocumentWithVector, SearchQueryWithVector
+
+
+class FixedDimensionEmbeddingService:
+    """Stand-in for the embedding service, which the repository only asks for the vector dimension."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    def get_embedding_dimension(self) -> int:
+        return self.dimension
+
+
+def build_documents(count: int, dimension: int) -> list[DocumentWithVector]:
+    """Build random documents shaped like indexed chunks."""
+    return [
+        DocumentWithVector(
+            id=str(uuid.uuid4()),
+            content=" ".join(random.choices(["lorem", "ipsum", "dolor", "sit", "amet"], k=120)),
+            file_name=f"file_{i % 5}.pdf",
+            file_path=f"/data/file_{i % 5}.pdf",
+            page_number=i % 30 + 1,
+            vector=[random.uniform(-1, 1) for _ in range(dimension)],
+        )
+        for i in range(count)
+    ]
+
+
+def get_memory_bytes(url: str, in_memory: bool) -> int:
+    """Get the resident memory of the Qdrant server, or the traced Python memory for an in-process Qdrant."""
+    if in_memory:
+        return tracemalloc.get_traced_memory()[0]
+    metrics = httpx.get(f"{url}/metrics", timeout=10).text
+    match = re.search(r"^memory_resident_bytes (\d+)", metrics, re.MULTILINE)
+    return int(match.group(1)) if match else 0
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def bench_layout(repository: QdrantVectorDBRepositoryImpl, tenants: list[Client], documents: list[DocumentWithVector],
+                 queries: int, top_k: int, url: str, in_memory: bool) -> None:
+    """Load the tenants in the layout of the repository, then search random tenants."""
+    layout = "shared    " if repository.shared_collection else "collection"
+    memory_before = get_memory_bytes(url, in_memory)
+    start = time.perf_counter()
+    for tenant in tenants:
+        repository.insert_documents(tenant, documents)
+    load_seconds = time.perf_counter() - start
+    memory_used = get_memory_bytes(url, in_memory) - memory_before
+
+    vectors = [document.vector for document in random.choices(documents, k=queries)]
+    for vector in vectors[:20]:  # Warm up
+        repository.retrieve_documents(random.choice(tenants), SearchQueryWithVector(vector=vector, text=""), top_k)
+    latencies = []
+    for vector in vectors:
+        start = time.perf_counter()
+        repository.retrieve_documents(random.choice(tenants), SearchQueryWithVector(vector=vector, text=""), top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{layout} load {load_seconds:7.1f}s  memory {memory_used / 2 ** 20:8.1f} MiB  "
+        f"search p50 {statistics.median(latencies):6.2f}ms  p95 {percentile(latencies, 0.95):6.2f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.environ.get("QDRANT_URL", "http://localhost:6333"), help="Qdrant URL")
+    parser.add_argument("--memory", action="store_true", help="Use an in-process Qdrant instead of a server")
+    parser.add_argument("--tenants", type=int, default=1000, help="Number of clients")
+    parser.add_argument("--points", type=int, default=50, help="Number of points per client")
+    parser.add_argument("--dimension", type=int, default=1536, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=500, help="Number of searches per layout")
+    parser.add_argument("--top-k", type=int, default=20, help="Number of results per search")
+    args = parser.parse_args()
+
+    if args.memory:
+        tracemalloc.start()
+    qdrant_client = QdrantClient(":memory:") if args.memory else QdrantClient(url=args.url)
+    collection_name = f"bench_tenancy_{uuid.uuid4().hex[:8]}"
+    tenants = [Client(id=f"tenant_{i}") for i in range(args.tenants)]
+    documents = build_documents(args.points, args.dimension)
+
+    for shared in (False, True):
+        repository = QdrantVectorDBRepositoryImpl(
+            embedding_service=FixedDimensionEmbeddingService(args.dimension),
+            qdrant_client=qdrant_client,
+            collection_name=collection_name,
+            shared_collection=shared,
+            # An in-process Qdrant does not support concurrent upserts
+            max_in_flight_upserts=1 if args.memory else 4,
+        )
+        try:
+            bench_layout(repository, tenants, documents, args.queries, args.top_k, args.url, args.memory)
+        finally:
+            for collection_id in {repository._get_collection_id(tenant.id) for tenant in tenants}:
+                qdrant_client.delete_collection(collection_id)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
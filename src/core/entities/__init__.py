@@ -1,26 +1,33 @@
 from .citation import Citation
 from .client import Client
 from .document import Document, DocumentWithVector
+from .sparse_vector import SparseVector
 from .file_content import FileContent, PageContent
-from .llm_completion import LLMCompletion
+from .llm_completion import LLMCompletion, LLMCompletionChunk
 from .llm_config import LLMConfig
 from .message import Message
 from .rag_config import RagConfig
 from .read_file_config import ReadFileConfig, PdfReadFileConfig, DocxReadFileConfig, XlsxReadFileConfig, CsvReadFileConfig, TxtReadFileConfig, MdReadFileConfig, PptxReadFileConfig
 from .input_file import InputFile, PdfInputFile, DocxInputFile, XlsxInputFile, CsvInputFile, TxtInputFile, MdInputFile, PptxInputFile
 from .tool import Tool, ToolCall, ToolCallResponse
+from .search_filters import SearchFilters
 from .search_query import SearchQuery, SearchQueryWithVector
 from .rag_response import RagResponse
+from .rag_stream_event import RagStreamEvent
 from .index_document_status import IndexDocumentStatus
+from .file_manifest import FileManifest
+from .upsert_report import UpsertReport, UpsertBatchError
 
 __all__ = [
     "Citation",
     "Client",
     "Document",
     "DocumentWithVector",
+    "SparseVector",
     "FileContent",
     "PageContent",
     "LLMCompletion",
+    "LLMCompletionChunk",
     "LLMConfig",
     "Message",
     "RagConfig",
@@ -43,8 +50,13 @@ __all__ = [
     "Tool",
     "ToolCall",
     "ToolCallResponse",
+    "SearchFilters",
     "SearchQuery",
     "SearchQueryWithVector",
     "RagResponse",
-    "IndexDocumentStatus"
+    "RagStreamEvent",
+    "IndexDocumentStatus",
+    "FileManifest",
+    "UpsertReport",
+    "UpsertBatchError"
 ]
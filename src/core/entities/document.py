@@ -2,6 +2,8 @@
 from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
+from .sparse_vector import SparseVector
+
 
 class Document(BaseModel):
     """Base document model for RAG system."""
@@ -13,6 +15,7 @@ class Document(BaseModel):
     file_name: str = Field(None, description="Name of the file associated with the document")
     file_path: str = Field(None, description="Path to the file associated with the document")
     page_number: int = Field(None, description="Page number of the document")
+    file_hash: Optional[str] = Field(None, description="Hash of the content of the file the document was chunked from")
     # source: Optional[str] = Field(None, description="Document source")
     created_at: Optional[int] = Field(None, description="Document creation timestamp")
     updated_at: Optional[int] = Field(None, description="Document last update timestamp")
@@ -20,4 +23,5 @@ class Document(BaseModel):
 class DocumentWithVector(Document):
     """Document model with vector representation."""
     vector: List[float] = Field(..., description="Vector representation of the document")
+    sparse_vector: Optional[SparseVector] = Field(None, description="Sparse (lexical) vector representation of the document")
     
\ No newline at end of file
@@ -0,0 +1,10 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class FileManifest(BaseModel):
+    """What is currently indexed for a file: its content hash and the ids of its chunks."""
+    file_path: str = Field(..., description="Path to the indexed file")
+    file_hash: Optional[str] = Field(None, description="Hash of the content of the file when it was indexed")
+    document_ids: List[str] = Field(default_factory=list, description="Ids of the indexed chunks of the file")
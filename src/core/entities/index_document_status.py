@@ -1,13 +1,20 @@
-from typing import Dict, Any, Optional, BinaryIO, Literal
+from typing import Dict, Any, List, Optional, BinaryIO, Literal
 
 from pydantic import BaseModel, Field
 import uuid
 import os
 
+from .upsert_report import UpsertBatchError
+
 class IndexDocumentStatus(BaseModel):
     """Status of the document indexing process."""
     file_path: str = Field(..., description="Path to the file being indexed")
     file_name: Optional[str] = Field(None, description="Name of the file being indexed")
     status: Literal["pending", "in_progress", "completed", "failed"] = Field(
         "in_progress", description="Current status of the indexing process"
-    )
\ No newline at end of file
+    )
+    added_chunks: int = Field(0, description="Number of new or changed chunks embedded and upserted")
+    unchanged_chunks: int = Field(0, description="Number of chunks already indexed and kept as is")
+    deleted_chunks: int = Field(0, description="Number of chunks which vanished from the file and were deleted")
+    failed_chunks: int = Field(0, description="Number of chunks of the batches which could not be upserted")
+    upsert_errors: List[UpsertBatchError] = Field(default_factory=list, description="Batches which could not be upserted")
@@ -37,6 +37,9 @@ class InputFile(BaseModel):
     read_file_config: dict = Field(
         ..., description="Configuration for reading the reference file"
     )
+    incremental: bool = Field(
+        True, description="Skip unchanged files and only embed and upsert new or changed chunks"
+    )
 
 
 class PdfInputFile(InputFile):
@@ -11,3 +11,11 @@ class LLMCompletion(BaseModel):
     tool_calls: Union[List[ToolCall], None] = Field(
         None, description="List of tool calls made during the completion"
     )
+
+
+class LLMCompletionChunk(BaseModel):
+    text: Union[str, None] = Field(
+        None, description="Text delta of a streamed LLM completion")
+    completion: Union[LLMCompletion, None] = Field(
+        None, description="The assembled completion, set on the last chunk of the stream"
+    )
@@ -1,9 +1,23 @@
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Union, Callable
+from typing import Dict, List, Literal, Optional, Union, Callable
 from .llm_config import LLMConfig
 
 class RagConfig(BaseModel):
     """RAG configuration model."""
 
     llm_config: LLMConfig = Field(..., description="LLM configuration for RAG")
-    top_k: Optional[int] = Field(5, description="Number of top documents to retrieve")
\ No newline at end of file
+    top_k: Optional[int] = Field(5, description="Number of top documents to retrieve")
+    retrieval_mode: Literal["dense", "hybrid"] = Field(
+        "hybrid", description="Dense vector search only, or dense and sparse (BM25) search fused with RRF"
+    )
+    dense_weight: float = Field(1.0, ge=0, description="Weight of the dense results in the hybrid fusion")
+    sparse_weight: float = Field(1.0, ge=0, description="Weight of the sparse (BM25) results in the hybrid fusion")
+    rerank: bool = Field(False, description="Rerank the retrieved candidates against the query and keep the top_k best")
+    rerank_candidates: int = Field(20, ge=1, description="Number of candidates retrieved for reranking")
+    use_mmr: bool = Field(False, description="Select a diverse top_k by maximal marginal relevance, skipping near duplicate chunks")
+    mmr_lambda: float = Field(0.5, ge=0, le=1, description="MMR trade-off, 1 for relevance only and 0 for diversity only")
+    mmr_candidates: int = Field(20, ge=1, description="Number of candidates retrieved for the MMR selection")
+    context_token_budget: Optional[int] = Field(
+        16000, ge=1, description="Maximum number of tokens of the messages sent to the LLM, retrieved documents are packed into what is left, None for no limit"
+    )
+    use_answer_cache: bool = Field(True, description="Answer from the cache when the same or a similar question was answered since the last indexing")
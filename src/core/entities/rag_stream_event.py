@@ -0,0 +1,12 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class RagStreamEvent(BaseModel):
+    """Event emitted while streaming a RAG response."""
+
+    event: Literal["searching", "token", "citations", "done", "error"] = Field(
+        ..., description="Type of the event"
+    )
+    data: Any = Field(None, description="JSON serializable payload of the event")
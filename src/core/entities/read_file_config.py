@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,40 @@ class PdfReadFileConfig(ReadFileConfig):
         default=False,
         description="Whether to use LLM for extracting information from PDF files",
     )
+    num_workers: Optional[int] = Field(
+        default=None,
+        description="Number of processes converting page ranges in parallel, defaults to the number of CPUs",
+    )
+    llm_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Number of page batches sent to the LLM concurrently when extracting or enhancing with LLM",
+    )
+    llm_max_retries: int = Field(
+        default=5,
+        ge=0,
+        description="Number of retries of an LLM request failing with a rate limit or transient error",
+    )
+    image_format: Literal["jpeg", "webp", "png"] = Field(
+        default="jpeg",
+        description="Format of the page images sent to the LLM when extracting with LLM",
+    )
+    image_quality: int = Field(
+        default=80,
+        ge=1,
+        le=100,
+        description="Quality of the JPEG and WebP page images",
+    )
+    image_width: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum width in pixels of the page images",
+    )
+    pages_per_shard: int = Field(
+        default=20,
+        ge=1,
+        description="Number of pages converted by each process at once, PDFs with fewer pages are converted in a single process",
+    )
 
 
 class DocxReadFileConfig(ReadFileConfig):
@@ -58,7 +92,11 @@ class CsvReadFileConfig(ReadFileConfig):
     Configuration for reading CSV files.
     """
 
-    pass
+    rows_per_page: int = Field(
+        default=1000,
+        ge=1,
+        description="Number of rows read at once, so that large files are indexed with constant memory",
+    )
 
 
 class TxtReadFileConfig(ReadFileConfig):
@@ -66,7 +104,11 @@ class TxtReadFileConfig(ReadFileConfig):
     Configuration for reading text files.
     """
 
-    pass
+    page_chars: int = Field(
+        default=65536,
+        ge=1,
+        description="Approximate number of characters read at once, cut at line boundaries, so that large files are indexed with constant memory",
+    )
 
 
 class MdReadFileConfig(ReadFileConfig):
@@ -74,7 +116,11 @@ class MdReadFileConfig(ReadFileConfig):
     Configuration for reading Markdown files.
     """
 
-    pass
+    page_chars: int = Field(
+        default=65536,
+        ge=1,
+        description="Approximate number of characters read at once, cut at line boundaries, so that large files are indexed with constant memory",
+    )
 
 
 class PptxReadFileConfig(ReadFileConfig):
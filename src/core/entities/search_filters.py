@@ -0,0 +1,15 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SearchFilters(BaseModel):
+    """Metadata conditions narrowing a search, all of them must match."""
+    file_names: Optional[List[str]] = Field(None, description="Names of the files to search in")
+    file_types: Optional[List[str]] = Field(None, description="Types of the files to search in (e.g. 'pdf', 'docx')")
+    page_from: Optional[int] = Field(None, description="First page to search in")
+    page_to: Optional[int] = Field(None, description="Last page to search in")
+
+    def is_empty(self) -> bool:
+        """Return whether no condition is set."""
+        return not (self.file_names or self.file_types or self.page_from is not None or self.page_to is not None)
@@ -1,6 +1,9 @@
 from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
+from .search_filters import SearchFilters
+from .sparse_vector import SparseVector
+
 
 class SearchQuery(BaseModel):
     """User query model."""
@@ -9,7 +12,9 @@ class SearchQuery(BaseModel):
     metadata: Optional[dict] = Field(
         None, description="Query metadata"
     )
+    filters: Optional[SearchFilters] = Field(None, description="Metadata conditions the retrieved documents must match")
 
 class SearchQueryWithVector(SearchQuery):
     """User query model with vector representation."""
-    vector: List[float] = Field(..., description="Vector representation of the query")
\ No newline at end of file
+    vector: List[float] = Field(..., description="Vector representation of the query")
+    sparse_vector: Optional[SparseVector] = Field(None, description="Sparse (lexical) vector representation of the query")
\ No newline at end of file
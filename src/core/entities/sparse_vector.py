@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class SparseVector(BaseModel):
+    """Sparse vector representation, e.g. BM25 term weights keyed by hashed term ids."""
+    indices: List[int] = Field(default_factory=list, description="Ids of the non-zero dimensions")
+    values: List[float] = Field(default_factory=list, description="Values of the non-zero dimensions")
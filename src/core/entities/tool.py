@@ -14,6 +14,10 @@ class Tool(BaseModel):
     function: Callable = Field(
         ..., description="Function to be called when the tool is invoked"
     )
+    batch_prepare: Optional[Callable] = Field(
+        None,
+        description="Optional function called once with the arguments of all calls to the tool in a turn, before they are invoked",
+    )
 
 
 class ToolCall(BaseModel):
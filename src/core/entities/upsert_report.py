@@ -0,0 +1,18 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class UpsertBatchError(BaseModel):
+    """A batch of documents which could not be upserted."""
+    batch_index: int = Field(..., description="Position of the batch in the upsert, starting at 0")
+    document_ids: List[str] = Field(default_factory=list, description="Ids of the documents of the batch")
+    error: str = Field(..., description="Error raised by the last attempt to upsert the batch")
+
+
+class UpsertReport(BaseModel):
+    """Outcome of a batched upsert."""
+    upserted_documents: int = Field(0, description="Number of documents upserted")
+    failed_documents: int = Field(0, description="Number of documents of the failed batches")
+    batch_count: int = Field(0, description="Number of batches sent")
+    errors: List[UpsertBatchError] = Field(default_factory=list, description="Failed batches")
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
 
-from core.entities import Message, RagConfig, Client, RagResponse
+from core.entities import Message, RagConfig, Client, RagResponse, RagStreamEvent
 
 class GenerateResponsePort(ABC):
     """Use case for generating responses using LLMs."""
@@ -33,4 +33,34 @@ class GenerateResponsePort(ABC):
         Returns:
             RagResponse: The response object containing the generated output and status.
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def stream_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Iterator[RagStreamEvent]:
+        """
+        Generate a response based on the input messages, streaming progress events and answer tokens.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Returns:
+            Iterator[RagStreamEvent]: The searching, token, citations and done events of the response.
+        """
+        pass
+    
+    @abstractmethod
+    def astream_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> AsyncIterator[RagStreamEvent]:
+        """
+        Asynchronously generate a response based on the input messages, streaming progress events and answer tokens.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Returns:
+            AsyncIterator[RagStreamEvent]: The searching, token, citations and done events of the response.
+        """
+        pass
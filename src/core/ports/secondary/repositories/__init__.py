@@ -1,6 +1,8 @@
 
 from .vectordb_repository import VectorDBRepository
+from .cache_repository import CacheRepository
 
 __all__ = [
     "VectorDBRepository",
-]
\ No newline at end of file
+    "CacheRepository",
+]
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class CacheRepository(ABC):
+    """Repository interface for key-value caches. Values must be JSON serializable."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get the value stored under a key, or None if it is missing or expired."""
+        pass
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get the values stored under several keys, with None for missing keys."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value under a key, expiring after ttl seconds if given."""
+        pass
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values, expiring after ttl seconds if given."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the value stored under a key."""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and size information of the cache."""
+        pass
+
+    @abstractmethod
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously get the value stored under a key."""
+        pass
+
+    @abstractmethod
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Asynchronously get the values stored under several keys."""
+        pass
+
+    @abstractmethod
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Asynchronously store a value under a key."""
+        pass
+
+    @abstractmethod
+    async def aset_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Asynchronously store several values."""
+        pass
+
+    @abstractmethod
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete the value stored under a key."""
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterable, Iterable, List, Optional, Union
 
-from core.entities import DocumentWithVector, Client, SearchQueryWithVector
+from core.entities import Document, DocumentWithVector, Client, SearchQueryWithVector, FileManifest, UpsertReport
 
 
 class VectorDBRepository(ABC):
@@ -20,14 +20,57 @@ class VectorDBRepository(ABC):
     ) -> List[DocumentWithVector]:
         """Insert multiple documents into the vector database."""
         pass
+
+    @abstractmethod
+    def upsert_documents(
+        self, client: Client, documents: Iterable[DocumentWithVector]
+    ) -> UpsertReport:
+        """Upsert a stream of documents in batches, reporting the batches which failed instead of raising."""
+        pass
     
     @abstractmethod
     def retrieve_documents(
-        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20
-    ) -> List[DocumentWithVector]:
-        """Retrieve documents based on a search query."""
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Retrieve documents based on a search query, with their vectors only if with_vectors is set."""
         pass
     
+    @abstractmethod
+    def retrieve_documents_hybrid(
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20,
+        dense_weight: float = 1.0, sparse_weight: float = 1.0, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Retrieve documents with dense and sparse search fused by weighted reciprocal rank fusion."""
+        pass
+
+    @abstractmethod
+    def get_file_manifest(
+        self, client: Client, file_path: str
+    ) -> Optional[FileManifest]:
+        """Get the hash and chunk ids indexed for a file, or None if the file is not indexed."""
+        pass
+
+    @abstractmethod
+    def delete_documents(
+        self, client: Client, document_ids: List[str]
+    ) -> bool:
+        """Delete documents by their ids."""
+        pass
+
+    @abstractmethod
+    def update_documents_payload(
+        self, client: Client, documents: List[Document]
+    ) -> bool:
+        """Update the payload of already indexed documents without touching their vectors."""
+        pass
+
+    @abstractmethod
+    def reset_file_hash(
+        self, client: Client, file_path: str
+    ) -> bool:
+        """Clear the file hash of the indexed chunks of a file, so that its next incremental indexing does not skip it."""
+        pass
+
     @abstractmethod
     def create_collection(
         self, client: Client
@@ -56,13 +99,56 @@ class VectorDBRepository(ABC):
         """Asynchronously insert multiple documents into the vector database."""
         pass
 
+    @abstractmethod
+    async def aupsert_documents(
+        self, client: Client, documents: Union[Iterable[DocumentWithVector], AsyncIterable[DocumentWithVector]]
+    ) -> UpsertReport:
+        """Asynchronously upsert a stream of documents in batches, reporting the batches which failed instead of raising."""
+        pass
+
     @abstractmethod
     async def aretrieve_documents(
-        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20
-    ) -> List[DocumentWithVector]:
-        """Asynchronously retrieve documents based on a search query."""
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Asynchronously retrieve documents based on a search query, with their vectors only if with_vectors is set."""
         pass
     
+    @abstractmethod
+    async def aretrieve_documents_hybrid(
+        self, client: Client, search_query: SearchQueryWithVector, limit: int = 20,
+        dense_weight: float = 1.0, sparse_weight: float = 1.0, with_vectors: bool = False
+    ) -> List[Union[Document, DocumentWithVector]]:
+        """Asynchronously retrieve documents with dense and sparse search fused by weighted reciprocal rank fusion."""
+        pass
+
+    @abstractmethod
+    async def aget_file_manifest(
+        self, client: Client, file_path: str
+    ) -> Optional[FileManifest]:
+        """Asynchronously get the hash and chunk ids indexed for a file, or None if the file is not indexed."""
+        pass
+
+    @abstractmethod
+    async def adelete_documents(
+        self, client: Client, document_ids: List[str]
+    ) -> bool:
+        """Asynchronously delete documents by their ids."""
+        pass
+
+    @abstractmethod
+    async def aupdate_documents_payload(
+        self, client: Client, documents: List[Document]
+    ) -> bool:
+        """Asynchronously update the payload of already indexed documents without touching their vectors."""
+        pass
+
+    @abstractmethod
+    async def areset_file_hash(
+        self, client: Client, file_path: str
+    ) -> bool:
+        """Asynchronously clear the file hash of the indexed chunks of a file, so that its next incremental indexing does not skip it."""
+        pass
+
     @abstractmethod
     async def acreate_collection(
         self, client: Client
@@ -2,6 +2,7 @@
 from .chunking_service import ChunkingService, TextChunkingService, MarkdownChunkingService
 from .llm_service import LLMService
 from .embedding_service import EmbeddingService
+from .sparse_embedding_service import SparseEmbeddingService
 from .file_reading_service import (
     FileReadingService,
     TxtFileReadingService,
@@ -15,9 +16,13 @@ from .file_reading_service import (
 
 from .get_retrieve_tools_service import GetRetrieveToolsService
 from .retrieve_service import RetrieveService
+from .rerank_service import RerankService
+from .context_packing_service import ContextPackingService
 from .get_citations_service import GetCitationsService
 from .tool_call_handling_service import ToolCallHandlingService
 from .client_managing_service import ClientManagingService
+from .collection_version_service import CollectionVersionService
+from .answer_cache_service import AnswerCacheService
 
 __all__ = [
     "ChunkingService",
@@ -25,6 +30,7 @@ __all__ = [
     "MarkdownChunkingService",
     "LLMService",
     "EmbeddingService",
+    "SparseEmbeddingService",
     "FileReadingService",
     "TxtFileReadingService",
     "PdfFileReadingService",
@@ -35,7 +41,11 @@ __all__ = [
     "XlsxFileReadingService",
     "GetRetrieveToolsService",
     "RetrieveService",
+    "RerankService",
+    "ContextPackingService",
     "GetCitationsService",
     "ToolCallHandlingService",
-    "ClientManagingService"
+    "ClientManagingService",
+    "CollectionVersionService",
+    "AnswerCacheService"
 ]
\ No newline at end of file
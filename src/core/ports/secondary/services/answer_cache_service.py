@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from core.entities import Client, Message, RagConfig, RagResponse
+
+
+class AnswerCacheService(ABC):
+    """Service interface for caching the answers to repeated questions of each client."""
+
+    @abstractmethod
+    def get_answer(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Tuple[Optional[RagResponse], str]:
+        """Get the cached answer to the conversation, or None on a miss, and the collection version it was looked up in."""
+        pass
+
+    @abstractmethod
+    def set_answer(self, messages: list[Message], client: Client, rag_config: RagConfig, rag_response: RagResponse, version: str) -> None:
+        """Cache the answer generated for the conversation under the collection version returned by get_answer."""
+        pass
+
+    @abstractmethod
+    async def aget_answer(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Tuple[Optional[RagResponse], str]:
+        """Asynchronously get the cached answer to the conversation, or None on a miss, and the collection version it was looked up in."""
+        pass
+
+    @abstractmethod
+    async def aset_answer(self, messages: list[Message], client: Client, rag_config: RagConfig, rag_response: RagResponse, version: str) -> None:
+        """Asynchronously cache the answer generated for the conversation under the collection version returned by aget_answer."""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters of the answer cache and the stats of its backend."""
+        pass
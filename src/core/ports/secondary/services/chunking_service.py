@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
 
-from core.entities import FileContent, Document
+from core.entities import FileContent, Document, PageContent
 
 class ChunkingService(ABC):
     """Service interface for chunking documents into smaller parts."""
@@ -15,6 +15,23 @@ class ChunkingService(ABC):
     async def achunk(self, file_content: FileContent) -> List[Document]:
         """Asynchronously chunk the content of a file into smaller parts."""
         pass
+
+    def iter_chunks(self, file_content: FileContent, pages: Optional[Iterable[PageContent]] = None) -> Iterator[Document]:
+        """
+        Yield the chunks of a file as its pages come in.
+
+        file_content identifies the file, and its pages are used unless pages is given. Services
+        which cannot stream collect all pages first.
+        """
+        if pages is not None:
+            file_content = file_content.model_copy(update={"page_contents": list(pages)})
+        yield from self.chunk(file_content)
+
+    async def aiter_chunks(self, file_content: FileContent, pages: AsyncIterable[PageContent]) -> AsyncIterator[Document]:
+        """Asynchronously yield the chunks of a file as its pages come in."""
+        file_content = file_content.model_copy(update={"page_contents": [page async for page in pages]})
+        for document in await self.achunk(file_content):
+            yield document
     
 class TextChunkingService(ChunkingService):
     """Chunking service for text files."""
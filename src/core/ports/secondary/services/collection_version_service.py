@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+
+class CollectionVersionService(ABC):
+    """Service interface for the version of the indexed documents of each client, changed on every write."""
+
+    @abstractmethod
+    def get_version(self, client_id: str) -> str:
+        """Get the current version of the documents of a client."""
+        pass
+
+    @abstractmethod
+    def bump_version(self, client_id: str) -> str:
+        """Give the documents of a client a new version, invalidating what was cached for the previous one."""
+        pass
+
+    @abstractmethod
+    async def aget_version(self, client_id: str) -> str:
+        """Asynchronously get the current version of the documents of a client."""
+        pass
+
+    @abstractmethod
+    async def abump_version(self, client_id: str) -> str:
+        """Asynchronously give the documents of a client a new version."""
+        pass
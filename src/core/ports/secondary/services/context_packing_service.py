@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Set, Tuple
+
+from core.entities import Document, Message
+
+
+class ContextPackingService(ABC):
+    """Service interface for fitting retrieved documents into the token budget of a prompt."""
+
+    @abstractmethod
+    def count_message_tokens(self, messages: list[Message], model_name: str) -> int:
+        """Count the tokens of a message history as sent to the LLM."""
+        pass
+
+    @abstractmethod
+    def pack(
+        self, results: list[list[Document]], sent_ids: Set[str], token_budget: int, model_name: str
+    ) -> Tuple[list[str], list[Document]]:
+        """
+        Render the documents retrieved by each tool call of a turn into one context per call, within token_budget tokens.
+
+        Documents whose id is in sent_ids were sent in an earlier turn and are skipped, the ids of
+        the packed documents are added to sent_ids. Returns the contexts and the packed documents.
+        """
+        pass
@@ -15,6 +15,16 @@ class EmbeddingService(ABC):
         """Asynchronously create an embedding vector from text."""
         pass
     
+    @abstractmethod
+    def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Create embedding vectors for a list of texts, preserving input order."""
+        pass
+    
+    @abstractmethod
+    async def acreate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously create embedding vectors for a list of texts, preserving input order."""
+        pass
+    
     @abstractmethod 
     def get_model_name(self) -> str:
         """Return the name of the embedding model."""
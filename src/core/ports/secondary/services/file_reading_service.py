@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from core.entities import InputFile, FileContent, ReadFileConfig, PdfReadFileConfig, DocxReadFileConfig, PptxReadFileConfig, CsvReadFileConfig, XlsxReadFileConfig, MdReadFileConfig, TxtReadFileConfig
+from core.entities import InputFile, FileContent, PageContent, ReadFileConfig, PdfReadFileConfig, DocxReadFileConfig, PptxReadFileConfig, CsvReadFileConfig, XlsxReadFileConfig, MdReadFileConfig, TxtReadFileConfig
 
 class FileReadingService(ABC):
     """Service interface for reading files."""
 
+    content_format: str = "markdown"  # Format of the pages read, which selects the chunking service
+
     @abstractmethod
     def read_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
         """Read the content of a file."""
@@ -15,6 +17,16 @@ class FileReadingService(ABC):
     async def aread_file(self, input_file: InputFile, read_file_config: dict, **kwargs) -> FileContent:
         """Asynchronously read the content of a file."""
         pass
+
+    def iter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> Iterator[PageContent]:
+        """Yield the pages of a file as they are read. Services which cannot stream read the whole file first."""
+        yield from self.read_file(input_file, read_file_config, **kwargs).page_contents
+
+    async def aiter_pages(self, input_file: InputFile, read_file_config: dict, **kwargs) -> AsyncIterator[PageContent]:
+        """Asynchronously yield the pages of a file as they are read. Services which cannot stream read the whole file first."""
+        file_content = await self.aread_file(input_file, read_file_config, **kwargs)
+        for page_content in file_content.page_contents:
+            yield page_content
     
 class TxtFileReadingService(FileReadingService):
     @abstractmethod
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Union
+from typing import AsyncIterator, Iterator, List, Dict, Any, Union
 
-from core.entities import LLMConfig, Message, Tool, LLMCompletion
+from core.entities import LLMConfig, Message, Tool, LLMCompletion, LLMCompletionChunk
 
 class LLMService(ABC):
     """Service interface for LLM operations."""
@@ -11,6 +11,11 @@ class LLMService(ABC):
         """Perform a chat operation."""
         pass
     
+    @abstractmethod
+    def chat_stream(self, llm_config: LLMConfig, messages: List[Message], tools: List[Tool] = None) -> Iterator[LLMCompletionChunk]:
+        """Perform a chat operation, yielding text deltas and finally the assembled completion."""
+        pass
+    
     @abstractmethod
     def get_llm_config_keys(self) -> List[str]:
         """Get the keys of all LLM configurations."""
@@ -32,6 +37,11 @@ class LLMService(ABC):
         """Asynchronously perform a chat operation."""
         pass
     
+    @abstractmethod
+    def achat_stream(self, llm_config: LLMConfig, messages: List[Message], tools: List[Tool] = None) -> AsyncIterator[LLMCompletionChunk]:
+        """Asynchronously perform a chat operation, yielding text deltas and finally the assembled completion."""
+        pass
+    
     @abstractmethod
     async def aget_llm_config_keys(self) -> List[str]:
         """Asynchronously retrieve a list of LLM configuration keys."""
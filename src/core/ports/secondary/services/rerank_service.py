@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List, TypeVar
+
+from core.entities import Document
+
+D = TypeVar("D", bound=Document)
+
+
+class RerankService(ABC):
+    """Service interface for reranking retrieved documents against the query."""
+
+    @abstractmethod
+    def rerank(self, query: str, documents: List[D], top_k: int) -> List[D]:
+        """Score the documents against the query in one batch and return the top_k best, best first."""
+        pass
+
+    @abstractmethod
+    async def arerank(self, query: str, documents: List[D], top_k: int) -> List[D]:
+        """Asynchronously score the documents against the query in one batch and return the top_k best, best first."""
+        pass
+
+    @abstractmethod
+    def get_model_name(self) -> str:
+        """Return the name of the reranking model."""
+        pass
@@ -1,22 +1,22 @@
 
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Optional, Union
 
-from core.entities import Client, SearchQueryWithVector, DocumentWithVector, Document
+from core.entities import Client, SearchQueryWithVector, DocumentWithVector, Document, RagConfig
 
 class RetrieveService(ABC):
     """Service interface for retrieving documents."""
 
     @abstractmethod
     def retrieve(
-        self, search_query: SearchQueryWithVector, client: Client, limit: int = 10
+        self, search_query: SearchQueryWithVector, client: Client, limit: int = 10, rag_config: Optional[RagConfig] = None, with_vectors: bool = False
     ) -> list[Union[DocumentWithVector, Document]]:
-        """Find documents by their vector representation."""
+        """Find documents by their vector representation, following the retrieval options of rag_config if given. Vectors are only returned if with_vectors is set."""
         pass
     
     @abstractmethod
     async def aretrieve(
-        self, search_query: SearchQueryWithVector, client: Client, limit: int = 10
+        self, search_query: SearchQueryWithVector, client: Client, limit: int = 10, rag_config: Optional[RagConfig] = None, with_vectors: bool = False
     ) -> list[Union[DocumentWithVector, Document]]:
-        """Find documents by their vector representation."""
+        """Find documents by their vector representation, following the retrieval options of rag_config if given. Vectors are only returned if with_vectors is set."""
         pass
\ No newline at end of file
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from core.entities import SparseVector
+
+
+class SparseEmbeddingService(ABC):
+    """Service interface for generating sparse (lexical) embeddings."""
+
+    @abstractmethod
+    def create_sparse_embeddings(self, texts: List[str]) -> List[SparseVector]:
+        """Create sparse vectors for a list of documents, preserving input order."""
+        pass
+
+    @abstractmethod
+    def create_query_sparse_embedding(self, text: str) -> SparseVector:
+        """Create the sparse vector of a search query."""
+        pass
+
+    @abstractmethod
+    async def acreate_sparse_embeddings(self, texts: List[str]) -> List[SparseVector]:
+        """Asynchronously create sparse vectors for a list of documents, preserving input order."""
+        pass
+
+    @abstractmethod
+    async def acreate_query_sparse_embedding(self, text: str) -> SparseVector:
+        """Asynchronously create the sparse vector of a search query."""
+        pass
+
+    @abstractmethod
+    def get_model_name(self) -> str:
+        """Return the name of the sparse embedding model."""
+        pass
@@ -10,4 +10,9 @@ class ToolCallHandlingService(ABC):
     @abstractmethod
     def handle_tool_calls(self, tool_calls: List[ToolCall], tools: List[Tool], parallel: bool = False) -> List[ToolCallResponse]:   
         """Handle multiple tool calls and return their responses."""
+        pass
+    
+    @abstractmethod
+    async def ahandle_tool_calls(self, tool_calls: List[ToolCall], tools: List[Tool], parallel: bool = False) -> List[ToolCallResponse]:
+        """Asynchronously handle multiple tool calls and return their responses."""
         pass
\ No newline at end of file
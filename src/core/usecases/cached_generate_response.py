@@ -0,0 +1,143 @@
+from typing import AsyncIterator, Iterator, Optional
+
+from core.ports.primary.generate_response import GenerateResponsePort
+from core.entities import Message, RagConfig, Client, RagResponse, RagStreamEvent, Citation
+
+from core.ports.secondary.services import AnswerCacheService
+
+
+class CachedGenerateResponseUseCaseImpl(GenerateResponsePort):
+    """
+    Response generation use case decorator answering repeated questions from the answer cache.
+
+    On a miss the wrapped use case runs its retrieval and LLM loop, and its successful answer is
+    cached under the collection version read by the lookup. Requests with rag_config.use_answer_cache off go straight to the wrapped use case.
+    """
+
+    def __init__(self, generate_response_port: GenerateResponsePort, answer_cache_service: AnswerCacheService):
+        self.generate_response_port = generate_response_port
+        self.answer_cache_service = answer_cache_service
+
+    def generate_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> RagResponse:
+        """
+        Generate a response based on the input messages, or return the cached one.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Returns:
+            RagResponse: The response object containing the generated output and status.
+        """
+        if not rag_config.use_answer_cache:
+            return self.generate_response_port.generate_response(messages, client, rag_config)
+        cached_response, version = self.answer_cache_service.get_answer(messages, client, rag_config)
+        if cached_response is not None:
+            return cached_response
+        question = list(messages)  # The wrapped use case appends its tool calls to messages
+        rag_response = self.generate_response_port.generate_response(messages, client, rag_config)
+        self.answer_cache_service.set_answer(question, client, rag_config, rag_response, version)
+        return rag_response
+
+    async def agenerate_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> RagResponse:
+        """
+        Asynchronously generate a response based on the input messages, or return the cached one.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Returns:
+            RagResponse: The response object containing the generated output and status.
+        """
+        if not rag_config.use_answer_cache:
+            return await self.generate_response_port.agenerate_response(messages, client, rag_config)
+        cached_response, version = await self.answer_cache_service.aget_answer(messages, client, rag_config)
+        if cached_response is not None:
+            return cached_response
+        question = list(messages)
+        rag_response = await self.generate_response_port.agenerate_response(messages, client, rag_config)
+        await self.answer_cache_service.aset_answer(question, client, rag_config, rag_response, version)
+        return rag_response
+
+    def stream_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Iterator[RagStreamEvent]:
+        """
+        Generate a response based on the input messages, streaming it as events, or stream the cached one.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Yields:
+            RagStreamEvent: The events of the wrapped use case, or a single token event with the
+            cached answer followed by its citations and done events.
+        """
+        if not rag_config.use_answer_cache:
+            yield from self.generate_response_port.stream_response(messages, client, rag_config)
+            return
+        cached_response, version = self.answer_cache_service.get_answer(messages, client, rag_config)
+        if cached_response is not None:
+            yield from self._build_cached_events(cached_response)
+            return
+        question = list(messages)
+        events = []
+        for event in self.generate_response_port.stream_response(messages, client, rag_config):
+            if event.event != "token":
+                events.append(event)
+            yield event
+        rag_response = self._build_streamed_response(events)
+        if rag_response is not None:
+            self.answer_cache_service.set_answer(question, client, rag_config, rag_response, version)
+
+    async def astream_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> AsyncIterator[RagStreamEvent]:
+        """
+        Asynchronously generate a response based on the input messages, streaming it as events, or stream the cached one.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Yields:
+            RagStreamEvent: The events of the wrapped use case, or a single token event with the
+            cached answer followed by its citations and done events.
+        """
+        if not rag_config.use_answer_cache:
+            async for event in self.generate_response_port.astream_response(messages, client, rag_config):
+                yield event
+            return
+        cached_response, version = await self.answer_cache_service.aget_answer(messages, client, rag_config)
+        if cached_response is not None:
+            for event in self._build_cached_events(cached_response):
+                yield event
+            return
+        question = list(messages)
+        events = []
+        async for event in self.generate_response_port.astream_response(messages, client, rag_config):
+            if event.event != "token":
+                events.append(event)
+            yield event
+        rag_response = self._build_streamed_response(events)
+        if rag_response is not None:
+            await self.answer_cache_service.aset_answer(question, client, rag_config, rag_response, version)
+
+    def _build_cached_events(self, rag_response: RagResponse) -> list[RagStreamEvent]:
+        """Build the events streaming a cached answer."""
+        return [
+            RagStreamEvent(event="token", data=rag_response.answer),
+            RagStreamEvent(event="citations", data=[citation.model_dump() for citation in rag_response.citations or []]),
+            RagStreamEvent(event="done", data={"answer": rag_response.answer}),
+        ]
+
+    def _build_streamed_response(self, events: list[RagStreamEvent]) -> Optional[RagResponse]:
+        """Rebuild the response from the citations and done events of a stream, or None if it did not complete."""
+        if any(event.event == "error" for event in events) or not events or events[-1].event != "done":
+            return None
+        citations = next((event.data for event in events if event.event == "citations"), [])
+        return RagResponse(
+            answer=events[-1].data["answer"] or "",
+            citations=[Citation(**citation) for citation in citations],
+        )
@@ -1,17 +1,18 @@
 import asyncio
 import requests
-from typing import Union, List
+from typing import Optional, Union, List
 
 from core.ports.primary.client_manage import ClientManagePort
 from core.entities import Message, RagConfig, Client, RagResponse, ToolCall, Tool, ToolCallResponse, Document, DocumentWithVector, Citation
 
-from core.ports.secondary.services import ClientManagingService
+from core.ports.secondary.services import ClientManagingService, CollectionVersionService
 
 class ClientManageUseCaseImpl(ClientManagePort):
     """Use case for managing clients."""
 
-    def __init__(self, client_managing_service: ClientManagingService):
+    def __init__(self, client_managing_service: ClientManagingService, collection_version_service: Optional[CollectionVersionService] = None):
         self.client_managing_service = client_managing_service
+        self.collection_version_service = collection_version_service  # Invalidates what was cached for a deleted client, if set
 
     def create_client(self, client: Client) -> Client:
         """Create a new client."""
@@ -20,6 +21,8 @@ class ClientManageUseCaseImpl(ClientManagePort):
     def delete_client(self, client_id: str) -> None:
         """Delete a client by its ID."""
         self.client_managing_service.delete_client(client_id)
+        if self.collection_version_service is not None:
+            self.collection_version_service.bump_version(client_id)
 
     async def acreate_client(self, client: Client) -> Client:
         """Asynchronously create a new client."""
@@ -28,3 +31,5 @@ class ClientManageUseCaseImpl(ClientManagePort):
     async def adelete_client(self, client_id: str) -> None:
         """Asynchronously delete a client by its ID."""
         await self.client_managing_service.adelete_client(client_id)
+        if self.collection_version_service is not None:
+            await self.collection_version_service.abump_version(client_id)
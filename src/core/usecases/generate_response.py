@@ -1,16 +1,17 @@
 import asyncio
+import sys
 import requests
-from typing import Union, List
+from typing import AsyncIterator, Iterator, Union, List
 
 from core.ports.primary.generate_response import GenerateResponsePort
-from core.entities import Message, RagConfig, Client, RagResponse, ToolCall, Tool, ToolCallResponse, Document, DocumentWithVector, Citation
+from core.entities import Message, RagConfig, Client, RagResponse, RagStreamEvent, ToolCall, Tool, ToolCallResponse, Document, DocumentWithVector, Citation
 
-from core.ports.secondary.services import LLMService, EmbeddingService, GetRetrieveToolsService, GetCitationsService, ToolCallHandlingService, RetrieveService
+from core.ports.secondary.services import LLMService, EmbeddingService, GetRetrieveToolsService, GetCitationsService, ToolCallHandlingService, RetrieveService, ContextPackingService
 
 class GenerateResponseUseCaseImpl(GenerateResponsePort):
     """Implementation of the use case for generating responses using LLMs."""
 
-    def __init__(self, llm_service: LLMService, embedding_service: EmbeddingService, retrieval_service: RetrieveService, get_retrieve_tools_service: GetRetrieveToolsService, get_citations_service: GetCitationsService, tool_call_handling_service: ToolCallHandlingService):
+    def __init__(self, llm_service: LLMService, embedding_service: EmbeddingService, retrieval_service: RetrieveService, get_retrieve_tools_service: GetRetrieveToolsService, get_citations_service: GetCitationsService, tool_call_handling_service: ToolCallHandlingService, context_packing_service: ContextPackingService):
         """ Initialize the GenerateResponseUseCaseImpl with necessary services."""
         self.llm_service = llm_service
         self.embedding_service = embedding_service
@@ -18,7 +19,9 @@ class GenerateResponseUseCaseImpl(GenerateResponsePort):
         self.get_retrieve_tools_service = get_retrieve_tools_service
         self.get_citations_service = get_citations_service
         self.tool_call_handling_service = tool_call_handling_service
+        self.context_packing_service = context_packing_service
         self.max_iterations = 3  # Maximum number of iterations for the RAG process
+        self.parallel_tool_calls = True  # Dispatch the tool calls of one LLM turn in parallel
         
         
     def generate_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> RagResponse:
@@ -35,15 +38,16 @@ class GenerateResponseUseCaseImpl(GenerateResponsePort):
         """
         retrieve_tools = self.get_retrieve_tools_service.get_retrieve_tools(self.embedding_service, self.retrieval_service, client, rag_config)
         retrieved_documents = []
+        sent_ids = set()  # Documents already in the messages, not sent again
         for i in range(self.max_iterations):
             llm_completion = self.llm_service.chat(llm_config=rag_config.llm_config, messages=messages, tools=retrieve_tools)
             tool_calls = llm_completion.tool_calls
             text = llm_completion.text
             if not tool_calls:
                 break  # Exit if no tool calls are made
-            tool_call_responses, documents = self._handle_retrieve_tool_calls(tool_calls, retrieve_tools)
-            retrieved_documents.extend(documents)
+            tool_call_responses = self._handle_retrieve_tool_calls(tool_calls, retrieve_tools)
             messages.append(Message(role='assistant', content=text, tool_calls=tool_calls))
+            retrieved_documents.extend(self._pack_retrieved_documents(tool_call_responses, messages, sent_ids, rag_config))
             for tool_call_response in tool_call_responses:
                 messages.append(Message(role='tool', content=tool_call_response))
         citations = self.get_citations_service.get_citations(retrieved_documents)
@@ -66,10 +70,112 @@ class GenerateResponseUseCaseImpl(GenerateResponsePort):
         Returns:
             RagResponse: The response object containing the generated output and status.
         """
-        # Simulate an asynchronous call to an external service
-        pass
+        retrieve_tools = await self.get_retrieve_tools_service.aget_retrieve_tools(self.embedding_service, self.retrieval_service, client, rag_config)
+        retrieved_documents = []
+        sent_ids = set()  # Documents already in the messages, not sent again
+        for i in range(self.max_iterations):
+            llm_completion = await self.llm_service.achat(llm_config=rag_config.llm_config, messages=messages, tools=retrieve_tools)
+            tool_calls = llm_completion.tool_calls
+            text = llm_completion.text
+            if not tool_calls:
+                break  # Exit if no tool calls are made
+            tool_call_responses = await self._ahandle_retrieve_tool_calls(tool_calls, retrieve_tools)
+            messages.append(Message(role='assistant', content=text, tool_calls=tool_calls))
+            retrieved_documents.extend(self._pack_retrieved_documents(tool_call_responses, messages, sent_ids, rag_config))
+            for tool_call_response in tool_call_responses:
+                messages.append(Message(role='tool', content=tool_call_response))
+        citations = await self.get_citations_service.aget_citations(retrieved_documents)
+
+        rag_response = RagResponse(
+            answer=text,
+            citations=citations,
+        )
+        return rag_response
+
+    def stream_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> Iterator[RagStreamEvent]:
+        """
+        Generate a response based on the input messages, streaming it as events.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
+
+        Yields:
+            RagStreamEvent: A searching event per tool-calling turn, token events as the LLM
+            produces text, then the citations and a done event carrying the full answer.
+        """
+        retrieve_tools = self.get_retrieve_tools_service.get_retrieve_tools(self.embedding_service, self.retrieval_service, client, rag_config)
+        retrieved_documents = []
+        sent_ids = set()  # Documents already in the messages, not sent again
+        for i in range(self.max_iterations):
+            llm_completion = None
+            for chunk in self.llm_service.chat_stream(llm_config=rag_config.llm_config, messages=messages, tools=retrieve_tools):
+                if chunk.text:
+                    yield RagStreamEvent(event="token", data=chunk.text)
+                if chunk.completion:
+                    llm_completion = chunk.completion
+            tool_calls = llm_completion.tool_calls
+            text = llm_completion.text
+            if not tool_calls:
+                break  # Exit if no tool calls are made
+            yield self._build_searching_event(tool_calls)
+            tool_call_responses = self._handle_retrieve_tool_calls(tool_calls, retrieve_tools)
+            messages.append(Message(role='assistant', content=text, tool_calls=tool_calls))
+            retrieved_documents.extend(self._pack_retrieved_documents(tool_call_responses, messages, sent_ids, rag_config))
+            for tool_call_response in tool_call_responses:
+                messages.append(Message(role='tool', content=tool_call_response))
+        citations = self.get_citations_service.get_citations(retrieved_documents)
+
+        yield RagStreamEvent(event="citations", data=[citation.model_dump() for citation in citations])
+        yield RagStreamEvent(event="done", data={"answer": text})
+
+    async def astream_response(self, messages: list[Message], client: Client, rag_config: RagConfig) -> AsyncIterator[RagStreamEvent]:
+        """
+        Asynchronously generate a response based on the input messages, streaming it as events.
+
+        Args:
+            messages (list[Message]): The list of messages to process.
+            client (Client): The client object containing client-specific information.
+            rag_config (RagConfig): The configuration for the RAG system, including LLM configurations.
 
-    def _handle_retrieve_tool_calls(self, tool_calls: list[ToolCall], tools: list[Tool]) -> tuple[list[ToolCallResponse], list[Document]]:
+        Yields:
+            RagStreamEvent: A searching event per tool-calling turn, token events as the LLM
+            produces text, then the citations and a done event carrying the full answer.
+        """
+        retrieve_tools = await self.get_retrieve_tools_service.aget_retrieve_tools(self.embedding_service, self.retrieval_service, client, rag_config)
+        retrieved_documents = []
+        sent_ids = set()  # Documents already in the messages, not sent again
+        for i in range(self.max_iterations):
+            llm_completion = None
+            async for chunk in self.llm_service.achat_stream(llm_config=rag_config.llm_config, messages=messages, tools=retrieve_tools):
+                if chunk.text:
+                    yield RagStreamEvent(event="token", data=chunk.text)
+                if chunk.completion:
+                    llm_completion = chunk.completion
+            tool_calls = llm_completion.tool_calls
+            text = llm_completion.text
+            if not tool_calls:
+                break  # Exit if no tool calls are made
+            yield self._build_searching_event(tool_calls)
+            tool_call_responses = await self._ahandle_retrieve_tool_calls(tool_calls, retrieve_tools)
+            messages.append(Message(role='assistant', content=text, tool_calls=tool_calls))
+            retrieved_documents.extend(self._pack_retrieved_documents(tool_call_responses, messages, sent_ids, rag_config))
+            for tool_call_response in tool_call_responses:
+                messages.append(Message(role='tool', content=tool_call_response))
+        citations = await self.get_citations_service.aget_citations(retrieved_documents)
+
+        yield RagStreamEvent(event="citations", data=[citation.model_dump() for citation in citations])
+        yield RagStreamEvent(event="done", data={"answer": text})
+
+    def _build_searching_event(self, tool_calls: list[ToolCall]) -> RagStreamEvent:
+        """Build the event announcing the tool calls about to be executed."""
+        return RagStreamEvent(
+            event="searching",
+            data=[{"name": tool_call.name, "arguments": tool_call.arguments} for tool_call in tool_calls]
+        )
+
+    def _handle_retrieve_tool_calls(self, tool_calls: list[ToolCall], tools: list[Tool]) -> list[ToolCallResponse]:
         """
         Handle tool calls and return their responses.
 
@@ -79,13 +185,47 @@ class GenerateResponseUseCaseImpl(GenerateResponsePort):
         Returns:
             list[ToolCallResponse]: List of responses from the tool calls.
         """
-        tool_call_responses = self.tool_call_handling_service.handle_tool_calls(tool_calls, tools)
-        documents = []
-        for i in range(len(tool_call_responses)):
-            tool_response = tool_call_responses[i].tool_response
-            if isinstance(tool_response, list):
-                
-                documents.extend(tool_response)
-                relevant_docs = '\n\n'.join([doc.content for doc in tool_response if isinstance(doc, Document)])
-                tool_call_responses[i].tool_response = relevant_docs
-        return tool_call_responses, documents
\ No newline at end of file
+        return self.tool_call_handling_service.handle_tool_calls(tool_calls, tools, parallel=self.parallel_tool_calls)
+
+    async def _ahandle_retrieve_tool_calls(self, tool_calls: list[ToolCall], tools: list[Tool]) -> list[ToolCallResponse]:
+        """
+        Asynchronously handle tool calls and return their responses.
+
+        Args:
+            tool_calls (list[ToolCall]): List of tool calls to be handled.
+
+        Returns:
+            list[ToolCallResponse]: List of responses from the tool calls.
+        """
+        return await self.tool_call_handling_service.ahandle_tool_calls(tool_calls, tools, parallel=self.parallel_tool_calls)
+
+    def _pack_retrieved_documents(self, tool_call_responses: list[ToolCallResponse], messages: list[Message], sent_ids: set[str], rag_config: RagConfig) -> list[Document]:
+        """
+        Replace each retrieval tool response with its documents packed into what is left of the context token budget.
+
+        Args:
+            tool_call_responses (list[ToolCallResponse]): The responses of the tool calls of the turn.
+            messages (list[Message]): The messages sent so far, whose tokens come off the budget.
+            sent_ids (set[str]): The ids of the documents already sent, updated with the packed ones.
+            rag_config (RagConfig): The RAG configuration of the request.
+
+        Returns:
+            list[Document]: The documents sent to the model, which are the ones to cite.
+        """
+        retrieval_responses = [response for response in tool_call_responses if isinstance(response.tool_response, list)]
+        if not retrieval_responses:
+            return []
+        model_name = rag_config.llm_config.model_path or "cl100k_base"
+        if rag_config.context_token_budget is None:
+            token_budget = sys.maxsize
+        else:
+            token_budget = max(0, rag_config.context_token_budget - self.context_packing_service.count_message_tokens(messages, model_name))
+        contexts, documents = self.context_packing_service.pack(
+            [[document for document in response.tool_response if isinstance(document, Document)] for response in retrieval_responses],
+            sent_ids,
+            token_budget,
+            model_name,
+        )
+        for response, context in zip(retrieval_responses, contexts):
+            response.tool_response = context
+        return documents
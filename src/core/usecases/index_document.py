@@ -1,44 +1,80 @@
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import List
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Set
 
-from core.entities import Document, DocumentWithVector, InputFile, Client, FileContent, IndexDocumentStatus
+from pydantic import BaseModel
+
+from core.entities import Document, DocumentWithVector, InputFile, Client, FileContent, IndexDocumentStatus, UpsertReport
 from core.ports.primary.index_document import IndexDocumentPort
 
 from core.ports.secondary.repositories import VectorDBRepository
-from core.ports.secondary.services import EmbeddingService, FileReadingService, ChunkingService
+from core.ports.secondary.services import EmbeddingService, SparseEmbeddingService, FileReadingService, ChunkingService, CollectionVersionService
 
 class IndexDocumentUseCaseImpl(IndexDocumentPort):
-    def __init__(self, vectordb: VectorDBRepository, embedding_service: EmbeddingService, file_reading_services_mapping: dict[str, FileReadingService] = {}, chunking_services_mapping: dict[str, ChunkingService] = {}):
+    def __init__(self, vectordb: VectorDBRepository, embedding_service: EmbeddingService, file_reading_services_mapping: dict[str, FileReadingService] = {}, chunking_services_mapping: dict[str, ChunkingService] = {}, embedding_batch_size: int = 512, max_concurrent_documents: int = 4, sparse_embedding_service: Optional[SparseEmbeddingService] = None, collection_version_service: Optional[CollectionVersionService] = None):
         self.vectordb = vectordb
         self.embedding_service = embedding_service
+        self.sparse_embedding_service = sparse_embedding_service  # Computes the sparse vectors used by hybrid search, if set
+        self.collection_version_service = collection_version_service  # Invalidates what was cached for the documents of a client, if set
+        self.embedding_batch_size = embedding_batch_size  # Number of chunks handed to the embedding service at once
+        self.max_concurrent_documents = max_concurrent_documents  # Number of files indexed concurrently by aindex_documents
         self.file_reading_services_mapping = file_reading_services_mapping
         self.chunking_services_mapping = chunking_services_mapping
 
     
     def index_document(self, client: Client, input_file: InputFile) -> IndexDocumentStatus:
-        """Index a document with its metadata."""
+        """
+        Index a document with its metadata.
+
+        Files already indexed with the same content and reading configuration are skipped, and for
+        changed files only the new or changed chunks are embedded while vanished chunks are deleted.
+        The file streams from the reader to the vector database, so memory does not grow with its size.
+        """
         try:
+            file_hash = self._get_file_hash(input_file)
+            manifest = self.vectordb.get_file_manifest(client, input_file.local_file_path)
+            if input_file.incremental and manifest and manifest.file_hash == file_hash:
+                return IndexDocumentStatus(
+                    file_path=input_file.local_file_path,
+                    status="completed",
+                    unchanged_chunks=len(manifest.document_ids)
+                )
+
             file_reading_service = self.get_file_reading_service(input_file)
-            # read_file_config = input_file.read_file_config
-            file_content = file_reading_service.read_file(input_file, input_file.read_file_config)
-            # print(input_file.read_file_config)
+            file_content = self._build_file_content(input_file, file_reading_service)
             chunking_service = self.get_chunking_service(file_content)
-            documents = chunking_service.chunk(file_content)
-            
-            indexed_documents = []
-            for document in documents:
-                vector = self.embedding_service.create_embedding(text=document.content)
-                document_dict = document.model_dump()
-                document_dict['vector'] = vector
-                document_with_vector = DocumentWithVector(**document_dict)
-                indexed_documents.append(document_with_vector)
-
-            self.vectordb.insert_documents(client, indexed_documents)
+            # Pages are read, chunked, embedded and upserted as they stream through, in bounded batches
+            pages = file_reading_service.iter_pages(input_file, input_file.read_file_config)
+            documents = chunking_service.iter_chunks(file_content, pages)
+            indexed_ids = set(manifest.document_ids) if manifest else set()
+            seen_ids = set()
+            new_documents = self._iter_new_documents(client, documents, file_hash, indexed_ids, seen_ids, input_file.incremental)
+            try:
+                upsert_report = self.vectordb.upsert_documents(client, self._iter_embedded_documents(new_documents))
+            except Exception:
+                self._reset_file_hash(client, input_file)
+                self._bump_collection_version(client)
+                raise
+            unchanged_chunks = len(seen_ids) if input_file.incremental else 0
+
+            if upsert_report.errors:
+                self._reset_file_hash(client, input_file)
+                self._bump_collection_version(client)
+                return self._build_failed_upsert_status(input_file, upsert_report, unchanged_chunks)
+            # Delete after inserting, so that a failure leaves stale chunks rather than missing ones
+            deleted_ids = [document_id for document_id in indexed_ids if document_id not in seen_ids]
+            self.vectordb.delete_documents(client, deleted_ids)
+            self._bump_collection_version(client)
             status = IndexDocumentStatus(
                 file_path=input_file.local_file_path,
                 status="completed",
-                documents=indexed_documents
+                added_chunks=upsert_report.upserted_documents,
+                unchanged_chunks=unchanged_chunks,
+                deleted_chunks=len(deleted_ids)
             )
         except Exception as e:
             logging.exception(f"Failed to index document {input_file.local_file_path}: {e}")
@@ -58,13 +94,202 @@ class IndexDocumentUseCaseImpl(IndexDocumentPort):
         return statuses
     
     async def aindex_document(self, client: Client, input_file: InputFile) -> IndexDocumentStatus:
-        # TODO: Implement asynchronous indexing of a single document
-        pass
+        """Asynchronously index a document with its metadata, skipping unchanged files and chunks like index_document."""
+        try:
+            file_hash = await asyncio.to_thread(self._get_file_hash, input_file)
+            manifest = await self.vectordb.aget_file_manifest(client, input_file.local_file_path)
+            if input_file.incremental and manifest and manifest.file_hash == file_hash:
+                return IndexDocumentStatus(
+                    file_path=input_file.local_file_path,
+                    status="completed",
+                    unchanged_chunks=len(manifest.document_ids)
+                )
+
+            file_reading_service = self.get_file_reading_service(input_file)
+            file_content = self._build_file_content(input_file, file_reading_service)
+            chunking_service = self.get_chunking_service(file_content)
+            # Pages are read, chunked, embedded and upserted as they stream through, in bounded batches
+            pages = file_reading_service.aiter_pages(input_file, input_file.read_file_config)
+            documents = chunking_service.aiter_chunks(file_content, pages)
+            indexed_ids = set(manifest.document_ids) if manifest else set()
+            seen_ids = set()
+            new_documents = self._aiter_new_documents(client, documents, file_hash, indexed_ids, seen_ids, input_file.incremental)
+            try:
+                upsert_report = await self.vectordb.aupsert_documents(client, self._aiter_embedded_documents(new_documents))
+            except Exception:
+                await self._areset_file_hash(client, input_file)
+                await self._abump_collection_version(client)
+                raise
+            unchanged_chunks = len(seen_ids) if input_file.incremental else 0
+
+            if upsert_report.errors:
+                await self._areset_file_hash(client, input_file)
+                await self._abump_collection_version(client)
+                return self._build_failed_upsert_status(input_file, upsert_report, unchanged_chunks)
+            # Delete after inserting, so that a failure leaves stale chunks rather than missing ones
+            deleted_ids = [document_id for document_id in indexed_ids if document_id not in seen_ids]
+            await self.vectordb.adelete_documents(client, deleted_ids)
+            await self._abump_collection_version(client)
+            status = IndexDocumentStatus(
+                file_path=input_file.local_file_path,
+                status="completed",
+                added_chunks=upsert_report.upserted_documents,
+                unchanged_chunks=unchanged_chunks,
+                deleted_chunks=len(deleted_ids)
+            )
+        except Exception as e:
+            logging.exception(f"Failed to index document {input_file.local_file_path}: {e}")
+            status = IndexDocumentStatus(
+                file_path=input_file.local_file_path,
+                status="failed"
+            )
+        return status
     
     async def aindex_documents(self, client: Client, input_files: List[InputFile]) -> List[IndexDocumentStatus]:
-        # TODO: Implement asynchronous indexing of multiple documents
-        pass
+        """Asynchronously index multiple documents, at most max_concurrent_documents at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_documents)
+
+        async def index_with_limit(input_file: InputFile) -> IndexDocumentStatus:
+            async with semaphore:
+                return await self.aindex_document(client, input_file)
+
+        return list(await asyncio.gather(*(index_with_limit(input_file) for input_file in input_files)))
     
+    def _get_file_hash(self, input_file: InputFile) -> str:
+        """Fingerprint a file from its content and the configuration it is read with."""
+        file_hash = hashlib.sha256()
+        with open(input_file.local_file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(block)
+        read_file_config = input_file.read_file_config
+        if isinstance(read_file_config, BaseModel):
+            read_file_config = read_file_config.model_dump()
+        file_hash.update(json.dumps(read_file_config, sort_keys=True, default=str).encode("utf-8"))
+        return file_hash.hexdigest()
+
+    def _build_file_content(self, input_file: InputFile, file_reading_service: FileReadingService) -> FileContent:
+        """Build the file content identifying a file whose pages are streamed separately."""
+        return FileContent(
+            file_name=input_file.file_name,
+            file_path=input_file.local_file_path,
+            content_format=file_reading_service.content_format,
+            # Stored with every chunk, so that searches can be narrowed to some file types
+            metadata={"file_type": input_file.file_type.lower()},
+        )
+
+    def _iter_new_documents(self, client: Client, documents: Iterable[Document], file_hash: str, indexed_ids: Set[str], seen_ids: Set[str], incremental: bool) -> Iterator[Document]:
+        """
+        Yield the chunks of a file which need embedding, refreshing in batches the payload of those already indexed.
+
+        The ids of the chunks already indexed are added to seen_ids, to find the vanished chunks once the stream is consumed.
+        """
+        unchanged_documents = []
+        for document in documents:
+            document.file_hash = file_hash
+            if document.id in indexed_ids:
+                seen_ids.add(document.id)
+            if not incremental or document.id not in indexed_ids:
+                yield document
+                continue
+            unchanged_documents.append(document)
+            if len(unchanged_documents) >= self.embedding_batch_size:
+                self.vectordb.update_documents_payload(client, unchanged_documents)
+                unchanged_documents = []
+        self.vectordb.update_documents_payload(client, unchanged_documents)
+
+    async def _aiter_new_documents(self, client: Client, documents: AsyncIterable[Document], file_hash: str, indexed_ids: Set[str], seen_ids: Set[str], incremental: bool) -> AsyncIterator[Document]:
+        """Asynchronously yield the chunks of a file which need embedding, like _iter_new_documents."""
+        unchanged_documents = []
+        async for document in documents:
+            document.file_hash = file_hash
+            if document.id in indexed_ids:
+                seen_ids.add(document.id)
+            if not incremental or document.id not in indexed_ids:
+                yield document
+                continue
+            unchanged_documents.append(document)
+            if len(unchanged_documents) >= self.embedding_batch_size:
+                await self.vectordb.aupdate_documents_payload(client, unchanged_documents)
+                unchanged_documents = []
+        await self.vectordb.aupdate_documents_payload(client, unchanged_documents)
+
+    def _reset_file_hash(self, client: Client, input_file: InputFile) -> None:
+        """Clear the hash of a partially indexed file, so that its next incremental indexing completes it instead of skipping it."""
+        try:
+            self.vectordb.reset_file_hash(client, input_file.local_file_path)
+        except Exception as e:
+            logging.exception(f"Failed to reset the file hash of {input_file.local_file_path}: {e}")
+
+    async def _areset_file_hash(self, client: Client, input_file: InputFile) -> None:
+        """Asynchronously clear the hash of a partially indexed file."""
+        try:
+            await self.vectordb.areset_file_hash(client, input_file.local_file_path)
+        except Exception as e:
+            logging.exception(f"Failed to reset the file hash of {input_file.local_file_path}: {e}")
+
+    def _bump_collection_version(self, client: Client) -> None:
+        """Give the documents of the client a new version once they changed, so that cached answers are not served for them."""
+        if self.collection_version_service is None:
+            return
+        try:
+            self.collection_version_service.bump_version(client.id)
+        except Exception as e:
+            logging.exception(f"Failed to bump the collection version of client {client.id}: {e}")
+
+    async def _abump_collection_version(self, client: Client) -> None:
+        """Asynchronously give the documents of the client a new version once they changed."""
+        if self.collection_version_service is None:
+            return
+        try:
+            await self.collection_version_service.abump_version(client.id)
+        except Exception as e:
+            logging.exception(f"Failed to bump the collection version of client {client.id}: {e}")
+
+    def _build_failed_upsert_status(self, input_file: InputFile, upsert_report: UpsertReport, unchanged_chunks: int) -> IndexDocumentStatus:
+        """Build the status of a file some chunks of which could not be upserted."""
+        logging.error(f"Failed to upsert {upsert_report.failed_documents} chunks of {input_file.local_file_path} in {len(upsert_report.errors)} batches")
+        return IndexDocumentStatus(
+            file_path=input_file.local_file_path,
+            status="failed",
+            added_chunks=upsert_report.upserted_documents,
+            unchanged_chunks=unchanged_chunks,
+            failed_chunks=upsert_report.failed_documents,
+            upsert_errors=upsert_report.errors
+        )
+
+    def _iter_embedded_documents(self, documents: Iterable[Document]) -> Iterator[DocumentWithVector]:
+        """Embed documents in batches and yield them with their vectors, so that only one batch of vectors is held at once."""
+        documents = iter(documents)
+        while batch := list(islice(documents, self.embedding_batch_size)):
+            texts = [document.content for document in batch]
+            vectors = self.embedding_service.create_embeddings(texts)
+            sparse_vectors = self.sparse_embedding_service.create_sparse_embeddings(texts) if self.sparse_embedding_service else [None] * len(batch)
+            for document, vector, sparse_vector in zip(batch, vectors, sparse_vectors):
+                yield DocumentWithVector(**document.model_dump(), vector=vector, sparse_vector=sparse_vector)
+
+    async def _aiter_embedded_documents(self, documents: AsyncIterable[Document]) -> AsyncIterator[DocumentWithVector]:
+        """Asynchronously embed documents in batches and yield them with their vectors."""
+        batch = []
+        async for document in documents:
+            batch.append(document)
+            if len(batch) >= self.embedding_batch_size:
+                for indexed_document in await self._aembed_batch(batch):
+                    yield indexed_document
+                batch = []
+        if batch:
+            for indexed_document in await self._aembed_batch(batch):
+                yield indexed_document
+
+    async def _aembed_batch(self, documents: List[Document]) -> List[DocumentWithVector]:
+        """Asynchronously embed a batch of documents and attach the vectors to them."""
+        texts = [document.content for document in documents]
+        vectors = await self.embedding_service.acreate_embeddings(texts)
+        sparse_vectors = await self.sparse_embedding_service.acreate_sparse_embeddings(texts) if self.sparse_embedding_service else [None] * len(documents)
+        return [
+            DocumentWithVector(**document.model_dump(), vector=vector, sparse_vector=sparse_vector)
+            for document, vector, sparse_vector in zip(documents, vectors, sparse_vectors)
+        ]
+
     def add_file_reading_service(self, key: str, service: FileReadingService):
         """Add a file reading service for a specific file type."""
         self.file_reading_services_mapping[key] = service
@@ -1,12 +1,12 @@
-# TODO: Refactor this file to use a dependency injection framework like `dependency_injector` or `injector`.
-# This will help manage dependencies more cleanly and make the code more maintainable.
-# For now, we will keep it simple and manually instantiate the services and use cases.
-# This is a temporary solution to get the application running.
+# Services and use cases are built lazily by providers on first use, so that importing this module
+# (from main.py or the Celery tasks) stays fast. Heavy libraries are imported inside the factories,
+# and file reading services are only imported and built when their file type is first requested.
+# Call a provider to get its instance, e.g. `index_document_port()`.
 
 import os
 
 from core.entities import (
-    LLMConfig,  
+    LLMConfig,
     ReadFileConfig,
     PdfReadFileConfig,
     TxtReadFileConfig,
@@ -17,215 +17,428 @@ from core.entities import (
     CsvReadFileConfig
 )
 
-from adapters.secondary.services.file_reading_services import (
-    CSVFileReadingServiceImpl,
-    DocxFileReadingServiceImpl,
-    PdfFileReadingServiceImpl,
-    TxtFileReadingServiceImpl,
-    XlsxFileReadingServiceImpl,
-    MdFileReadingServiceImpl,
-    PptxFileReadingServiceImpl
+from infrastructure.di.providers import LazyMapping, Singleton
+
+
+def _get_qdrant_client_kwargs() -> dict:
+    """Get the Qdrant connection settings shared by the sync and async clients."""
+    pool_size = os.environ.get("QDRANT_POOL_SIZE")
+    timeout = os.environ.get("QDRANT_TIMEOUT")
+    return dict(
+        url=os.environ.get("QDRANT_URL", "http://localhost:6333"),
+        api_key=os.environ.get("QDRANT_API_KEY") or None,
+        # gRPC is faster for upserts and searches, it goes through grpc_port on the same host
+        prefer_grpc=os.environ.get("QDRANT_PREFER_GRPC", "").lower() in ("1", "true"),
+        grpc_port=int(os.environ.get("QDRANT_GRPC_PORT") or 6334),
+        # Number of HTTP connections, or gRPC channels, shared by the threads using the client
+        pool_size=int(pool_size) if pool_size else None,
+        timeout=int(timeout) if timeout else None,
     )
 
-from adapters.secondary.services.chunking_services import (
-    MarkdownChunkingServiceImpl
-)
 
-from adapters.secondary.services.llm_services.openai_llm_services import OpenAILLMServiceImpl
-
-from adapters.secondary.services.embedding_services.openai_embedding_service import OpenAIEmbeddingServiceImpl
-from adapters.secondary.services.retrieve_services.semantic_retrieve_services import SemanticRetrieveServiceImpl
-from adapters.secondary.services.get_retrieve_tools_services.get_retrieve_tools_service import GetRetrieveToolsServiceImpl
-from adapters.secondary.services.get_citations_services.get_citations_service import GetCitationsServiceImpl
-from adapters.secondary.services.tool_call_handling_services.tool_call_handling_service import ToolCallHandlingServiceImpl
-from adapters.secondary.services.client_managing_services.client_managing_service import ClientManagingServiceImpl
-from adapters.secondary.repositories.vectordb_repositories.qdrant_vectordb_repository import QdrantVectorDBRepositoryImpl
-
-from core.usecases.generate_response import GenerateResponseUseCaseImpl
-from core.usecases.get_llm_configs import GetLLMConfigsUseCaseImpl
-from core.usecases.get_read_file_config import GetReadFileConfigUseCaseImpl
-from core.usecases.index_document import IndexDocumentUseCaseImpl
-from core.usecases.client_manage import ClientManageUseCaseImpl
-
-from qdrant_client import QdrantClient
-qdrant_client = QdrantClient(
-    url=os.environ.get("QDRANT_URL", "http://localhost:6333"),
-    # Uncomment if needed:
-    # prefer_grpc=self.prefer_grpc,
-    # api_key=self.qdrant_api_key,
-)
+def _build_qdrant_client():
+    from qdrant_client import QdrantClient
+    return QdrantClient(**_get_qdrant_client_kwargs())
+
+
+def _build_async_qdrant_client():
+    from qdrant_client import AsyncQdrantClient
+    return AsyncQdrantClient(**_get_qdrant_client_kwargs())
 
 
-openai_llm_service = OpenAILLMServiceImpl()
+qdrant_client = Singleton(_build_qdrant_client)
+async_qdrant_client = Singleton(_build_async_qdrant_client)
 
-openai_llm_service.add_llm_config(
-    key="GPT-4o-mini",
-    llm_config=LLMConfig(
-        model="gpt-4o-mini",
-        temperature=0.01,
+
+def _build_openai_llm_service():
+    from adapters.secondary.services.llm_services.openai_llm_services import OpenAILLMServiceImpl
+
+    openai_llm_service = OpenAILLMServiceImpl()
+
+    openai_llm_service.add_llm_config(
+        key="GPT-4o-mini",
+        llm_config=LLMConfig(
+            model="gpt-4o-mini",
+            temperature=0.01,
+        )
     )
-)
-openai_llm_service.add_llm_config(
-    key="GPT-4o",
-    llm_config=LLMConfig(
-        model="gpt-4o",
-        temperature=0.01,
+    openai_llm_service.add_llm_config(
+        key="GPT-4o",
+        llm_config=LLMConfig(
+            model="gpt-4o",
+            temperature=0.01,
+        )
     )
-)
 
-openai_llm_service.add_llm_config(  
-    key="GPT-4.1-nano",
-    llm_config=LLMConfig(
-        model="gpt-4.1-nano",
-        temperature=0.01,
+    openai_llm_service.add_llm_config(
+        key="GPT-4.1-nano",
+        llm_config=LLMConfig(
+            model="gpt-4.1-nano",
+            temperature=0.01,
+        )
     )
-)
 
-openai_llm_service.add_llm_config(
-    key="GPT-4.1-mini",
-    llm_config=LLMConfig(
-        model="gpt-4.1-mini",
-        temperature=0.01,   
+    openai_llm_service.add_llm_config(
+        key="GPT-4.1-mini",
+        llm_config=LLMConfig(
+            model="gpt-4.1-mini",
+            temperature=0.01,
+        )
     )
-)   
 
-openai_llm_service.add_llm_config(
-    key="GPT-4.1",
-    llm_config=LLMConfig(
-        model="gpt-4.1",    
-        temperature=0.01,
+    openai_llm_service.add_llm_config(
+        key="GPT-4.1",
+        llm_config=LLMConfig(
+            model="gpt-4.1",
+            temperature=0.01,
+        )
     )
-)
+    return openai_llm_service
 
-embedding_service = OpenAIEmbeddingServiceImpl()
 
+openai_llm_service = Singleton(_build_openai_llm_service)
 
-qdrant_vectordb_repository = QdrantVectorDBRepositoryImpl(
-    collection_name=os.environ.get("QDRANT_COLLECTION_NAME", "rag_collection"),
-    embedding_service=embedding_service,
-    qdrant_client=qdrant_client
-)
-semantic_retrieve_service = SemanticRetrieveServiceImpl(vectordb_repository=qdrant_vectordb_repository)
 
-get_retrieve_tools_service = GetRetrieveToolsServiceImpl()
-get_citations_service = GetCitationsServiceImpl()
-tool_call_handling_service = ToolCallHandlingServiceImpl()
+def _build_embedding_cache_repository():
+    from adapters.secondary.repositories.cache_repositories import (
+        InMemoryLRUCacheRepositoryImpl,
+        RedisCacheRepositoryImpl,
+        TieredCacheRepositoryImpl
+    )
 
+    # Embeddings are cached by content hash in process, and in Redis when REDIS_CACHE_URL is set
+    # so that the cache is shared between the API and the Celery workers.
+    embedding_cache_repository = InMemoryLRUCacheRepositoryImpl(
+        max_entries=int(os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES") or 10000)
+    )
+    if os.environ.get("REDIS_CACHE_URL"):
+        embedding_cache_repository = TieredCacheRepositoryImpl(tiers=[
+            embedding_cache_repository,
+            RedisCacheRepositoryImpl(redis_url=os.environ["REDIS_CACHE_URL"])
+        ])
+    return embedding_cache_repository
+
+
+def _build_embedding_service():
+    from adapters.secondary.services.embedding_services.openai_embedding_service import OpenAIEmbeddingServiceImpl
+    from adapters.secondary.services.embedding_services.cached_embedding_service import CachedEmbeddingServiceImpl
+
+    return CachedEmbeddingServiceImpl(
+        embedding_service=OpenAIEmbeddingServiceImpl(),
+        cache_repository=embedding_cache_repository(),
+        ttl=int(os.environ.get("EMBEDDING_CACHE_TTL") or 30 * 24 * 3600)
+    )
 
-generate_response_port = GenerateResponseUseCaseImpl(
-    llm_service=openai_llm_service,
-    embedding_service=embedding_service,
-    retrieval_service=semantic_retrieve_service,
-    get_retrieve_tools_service=get_retrieve_tools_service,
-    get_citations_service=get_citations_service,
-    tool_call_handling_service=tool_call_handling_service
-)
 
-get_llm_configs_port = GetLLMConfigsUseCaseImpl(
-    llm_service=openai_llm_service
-)
+def _build_sparse_embedding_service():
+    from adapters.secondary.services.embedding_services.bm25_sparse_embedding_service import BM25SparseEmbeddingServiceImpl
+    return BM25SparseEmbeddingServiceImpl()
 
-get_read_file_config_port = GetReadFileConfigUseCaseImpl()
 
-get_read_file_config_port.add_read_file_config(
-    key="pdf",
-    read_file_config=PdfReadFileConfig(),
-)
+embedding_cache_repository = Singleton(_build_embedding_cache_repository)
+embedding_service = Singleton(_build_embedding_service)
+sparse_embedding_service = Singleton(_build_sparse_embedding_service)
 
-get_read_file_config_port.add_read_file_config(
-    key="txt",
-    read_file_config=TxtReadFileConfig(),
-)
 
-get_read_file_config_port.add_read_file_config(
-    key="xlsx",
-    read_file_config=XlsxReadFileConfig(),
-)
+def _build_collection_version_service():
+    from adapters.secondary.repositories.cache_repositories import InMemoryLRUCacheRepositoryImpl, RedisCacheRepositoryImpl
+    from adapters.secondary.services.collection_version_services import CacheCollectionVersionServiceImpl
 
-get_read_file_config_port.add_read_file_config(
-    key="md",
-    read_file_config=MdReadFileConfig(),
-)
+    # Versions are bumped by the process indexing documents, often a Celery worker, and read by the API,
+    # so they are kept in Redis without an in-process tier. Without Redis they only hold within a process.
+    if os.environ.get("REDIS_CACHE_URL"):
+        cache_repository = RedisCacheRepositoryImpl(redis_url=os.environ["REDIS_CACHE_URL"])
+    else:
+        cache_repository = InMemoryLRUCacheRepositoryImpl(max_entries=100000)
+    return CacheCollectionVersionServiceImpl(cache_repository=cache_repository)
 
-get_read_file_config_port.add_read_file_config(
-    key="pptx",
-    read_file_config=PptxReadFileConfig(),
-)
 
-get_read_file_config_port.add_read_file_config(
-    key="docx",
-    read_file_config=DocxReadFileConfig(),
-)
+collection_version_service = Singleton(_build_collection_version_service)
 
-get_read_file_config_port.add_read_file_config(
-    key="csv",
-    read_file_config=CsvReadFileConfig(),
-)
 
+def _has_shared_collection_versions() -> bool:
+    """Whether collection versions bumped by the indexing workers are seen by the API, which caches must be invalidated by."""
+    return bool(os.environ.get("REDIS_CACHE_URL"))
 
-csv_file_reading_service = CSVFileReadingServiceImpl()
-docx_file_reading_service = DocxFileReadingServiceImpl()
-pdf_file_reading_service = PdfFileReadingServiceImpl(openai_llm_service)
-txt_file_reading_service = TxtFileReadingServiceImpl()
-xlsx_file_reading_service = XlsxFileReadingServiceImpl()
-md_file_reading_service = MdFileReadingServiceImpl()
-pptx_file_reading_service = PptxFileReadingServiceImpl()
 
-markdown_chunking_service = MarkdownChunkingServiceImpl()
+def _build_qdrant_vectordb_repository():
+    from adapters.secondary.repositories.vectordb_repositories.qdrant_vectordb_repository import QdrantVectorDBRepositoryImpl
+    return QdrantVectorDBRepositoryImpl(
+        collection_name=os.environ.get("QDRANT_COLLECTION_NAME", "rag_collection"),
+        # All clients in one collection, told apart by a tenant index, instead of one collection per client
+        shared_collection=os.environ.get("QDRANT_SHARED_COLLECTION", "").lower() in ("1", "true"),
+        embedding_service=embedding_service(),
+        qdrant_client=qdrant_client(),
+        async_qdrant_client=async_qdrant_client(),
+        search_timeout=int(os.environ.get("QDRANT_SEARCH_TIMEOUT") or 10),
+        write_timeout=int(os.environ.get("QDRANT_WRITE_TIMEOUT") or 60),
+        max_retries=int(os.environ.get("QDRANT_MAX_RETRIES") or 3),
+        upsert_batch_size=int(os.environ.get("QDRANT_UPSERT_BATCH_SIZE") or 256),
+        max_in_flight_upserts=int(os.environ.get("QDRANT_MAX_IN_FLIGHT_UPSERTS") or 4),
+    )
 
-index_document_port = IndexDocumentUseCaseImpl(
-    vectordb=qdrant_vectordb_repository,    
-    embedding_service=embedding_service,
-)
 
-index_document_port.add_file_reading_service(
-    key="csv",
-    service=csv_file_reading_service
-)
-index_document_port.add_file_reading_service(
-    key="docx",
-    service=docx_file_reading_service
-)
-index_document_port.add_file_reading_service(
-    key="pdf",
-    service=pdf_file_reading_service
-)
-index_document_port.add_file_reading_service(
-    key="txt",
-    service=txt_file_reading_service
-)
-index_document_port.add_file_reading_service(
-    key="xlsx",
-    service=xlsx_file_reading_service
-)
-index_document_port.add_file_reading_service(
-    key="md",
-    service=md_file_reading_service
-)
-index_document_port.add_file_reading_service(   
-    key="pptx",
-    service=pptx_file_reading_service
-)
-index_document_port.add_chunking_service(
-    key="csv",
-    service=csv_file_reading_service
-)
+def _build_hybrid_retrieve_service():
+    from adapters.secondary.repositories.cache_repositories import InMemoryLRUCacheRepositoryImpl
+    from adapters.secondary.services.retrieve_services.hybrid_retrieve_services import HybridRetrieveServiceImpl
+
+    # Search results are cached in process, bounded in entries, and invalidated by the collection versions,
+    # so only when the versions bumped by the indexing workers are shared with the API
+    cache_repository = None
+    if _has_shared_collection_versions():
+        cache_repository = InMemoryLRUCacheRepositoryImpl(
+            max_entries=int(os.environ.get("RETRIEVAL_CACHE_MAX_ENTRIES") or 1000)
+        )
+    return HybridRetrieveServiceImpl(
+        vectordb_repository=qdrant_vectordb_repository(),
+        sparse_embedding_service=sparse_embedding_service(),
+        cache_repository=cache_repository,
+        collection_version_service=collection_version_service(),
+        cache_ttl=int(os.environ.get("RETRIEVAL_CACHE_TTL") or 3600)
+    )
 
-index_document_port.add_chunking_service(
-    key='markdown',
-    service=markdown_chunking_service
-)
 
-index_document_port.add_chunking_service(
-    key='text',
-    service=markdown_chunking_service
-)
+def _build_rerank_service():
+    # A cross-encoder when an exported model is configured, else the model free lexical reranker
+    if os.environ.get("RERANK_ONNX_MODEL_DIR"):
+        from adapters.secondary.services.rerank_services.onnx_rerank_service import OnnxCrossEncoderRerankServiceImpl
+        return OnnxCrossEncoderRerankServiceImpl(
+            model_dir=os.environ["RERANK_ONNX_MODEL_DIR"],
+            max_length=int(os.environ.get("RERANK_MAX_LENGTH") or 512),
+        )
+    from adapters.secondary.services.rerank_services.lexical_rerank_service import LexicalRerankServiceImpl
+    return LexicalRerankServiceImpl()
 
-client_managing_service = ClientManagingServiceImpl(
-    vector_db_repository=qdrant_vectordb_repository
-)
 
-client_manage_port = ClientManageUseCaseImpl(
-    client_managing_service=client_managing_service
-)
-    
\ No newline at end of file
+def _build_retrieve_service():
+    from adapters.secondary.services.retrieve_services.reranking_retrieve_services import RerankingRetrieveServiceImpl
+    return RerankingRetrieveServiceImpl(
+        retrieve_service=hybrid_retrieve_service(),
+        rerank_service=rerank_service()
+    )
+
+
+def _build_get_retrieve_tools_service():
+    from adapters.secondary.services.get_retrieve_tools_services.get_retrieve_tools_service import GetRetrieveToolsServiceImpl
+    return GetRetrieveToolsServiceImpl()
+
+
+def _build_get_citations_service():
+    from adapters.secondary.services.get_citations_services.get_citations_service import GetCitationsServiceImpl
+    return GetCitationsServiceImpl()
+
+
+def _build_tool_call_handling_service():
+    from adapters.secondary.services.tool_call_handling_services.tool_call_handling_service import ToolCallHandlingServiceImpl
+    return ToolCallHandlingServiceImpl()
+
+
+def _build_context_packing_service():
+    from adapters.secondary.services.context_packing_services.token_budget_context_packing_service import TokenBudgetContextPackingServiceImpl
+    return TokenBudgetContextPackingServiceImpl()
+
+
+qdrant_vectordb_repository = Singleton(_build_qdrant_vectordb_repository)
+hybrid_retrieve_service = Singleton(_build_hybrid_retrieve_service)
+rerank_service = Singleton(_build_rerank_service)
+retrieve_service = Singleton(_build_retrieve_service)
+get_retrieve_tools_service = Singleton(_build_get_retrieve_tools_service)
+get_citations_service = Singleton(_build_get_citations_service)
+tool_call_handling_service = Singleton(_build_tool_call_handling_service)
+context_packing_service = Singleton(_build_context_packing_service)
+
+
+def _build_answer_cache_service():
+    from adapters.secondary.repositories.cache_repositories import InMemoryLRUCacheRepositoryImpl, RedisCacheRepositoryImpl
+    from adapters.secondary.services.answer_cache_services import SemanticAnswerCacheServiceImpl
+
+    # Answers are cached in Redis when REDIS_CACHE_URL is set, shared by the API workers, else in process
+    if os.environ.get("REDIS_CACHE_URL"):
+        cache_repository = RedisCacheRepositoryImpl(redis_url=os.environ["REDIS_CACHE_URL"])
+    else:
+        cache_repository = InMemoryLRUCacheRepositoryImpl(max_entries=int(os.environ.get("ANSWER_CACHE_MAX_ENTRIES") or 1000))
+    # Exact matches only by default: questions differing by a name or a number, e.g. the price of
+    # two plans, embed very closely. Setting a threshold of at most 1 also serves similar questions.
+    similarity_threshold = float(os.environ.get("ANSWER_CACHE_SIMILARITY_THRESHOLD") or 2)
+    return SemanticAnswerCacheServiceImpl(
+        cache_repository=cache_repository,
+        embedding_service=embedding_service(),
+        collection_version_service=collection_version_service(),
+        ttl=int(os.environ.get("ANSWER_CACHE_TTL") or 24 * 3600),
+        similarity_threshold=similarity_threshold if similarity_threshold <= 1 else None,
+    )
+
+
+answer_cache_service = Singleton(_build_answer_cache_service)
+
+
+def _build_generate_response_port():
+    from core.usecases.generate_response import GenerateResponseUseCaseImpl
+    from core.usecases.cached_generate_response import CachedGenerateResponseUseCaseImpl
+
+    generate_response_port = GenerateResponseUseCaseImpl(
+        llm_service=openai_llm_service(),
+        embedding_service=embedding_service(),
+        retrieval_service=retrieve_service(),
+        get_retrieve_tools_service=get_retrieve_tools_service(),
+        get_citations_service=get_citations_service(),
+        tool_call_handling_service=tool_call_handling_service(),
+        context_packing_service=context_packing_service()
+    )
+    # Without shared collection versions, answers cached by the API would outlive the indexing done by the workers
+    if not _has_shared_collection_versions() or os.environ.get("ANSWER_CACHE_ENABLED", "true").lower() not in ("1", "true"):
+        return generate_response_port
+    return CachedGenerateResponseUseCaseImpl(
+        generate_response_port=generate_response_port,
+        answer_cache_service=answer_cache_service()
+    )
+
+
+def _build_get_llm_configs_port():
+    from core.usecases.get_llm_configs import GetLLMConfigsUseCaseImpl
+    return GetLLMConfigsUseCaseImpl(
+        llm_service=openai_llm_service()
+    )
+
+
+def _build_get_read_file_config_port():
+    from core.usecases.get_read_file_config import GetReadFileConfigUseCaseImpl
+
+    get_read_file_config_port = GetReadFileConfigUseCaseImpl()
+
+    get_read_file_config_port.add_read_file_config(
+        key="pdf",
+        read_file_config=PdfReadFileConfig(),
+    )
+
+    get_read_file_config_port.add_read_file_config(
+        key="txt",
+        read_file_config=TxtReadFileConfig(),
+    )
+
+    get_read_file_config_port.add_read_file_config(
+        key="xlsx",
+        read_file_config=XlsxReadFileConfig(),
+    )
+
+    get_read_file_config_port.add_read_file_config(
+        key="md",
+        read_file_config=MdReadFileConfig(),
+    )
+
+    get_read_file_config_port.add_read_file_config(
+        key="pptx",
+        read_file_config=PptxReadFileConfig(),
+    )
+
+    get_read_file_config_port.add_read_file_config(
+        key="docx",
+        read_file_config=DocxReadFileConfig(),
+    )
+
+    get_read_file_config_port.add_read_file_config(
+        key="csv",
+        read_file_config=CsvReadFileConfig(),
+    )
+    return get_read_file_config_port
+
+
+generate_response_port = Singleton(_build_generate_response_port)
+get_llm_configs_port = Singleton(_build_get_llm_configs_port)
+get_read_file_config_port = Singleton(_build_get_read_file_config_port)
+
+
+def _build_csv_file_reading_service():
+    from adapters.secondary.services.file_reading_services.csv_file_reading_service import CSVFileReadingServiceImpl
+    return CSVFileReadingServiceImpl()
+
+
+def _build_docx_file_reading_service():
+    from adapters.secondary.services.file_reading_services.docx_file_reading_service import DocxFileReadingServiceImpl
+    return DocxFileReadingServiceImpl()
+
+
+def _build_pdf_file_reading_service():
+    from adapters.secondary.services.file_reading_services.pdf_file_reading_service import PdfFileReadingServiceImpl
+    return PdfFileReadingServiceImpl(openai_llm_service())
+
+
+def _build_txt_file_reading_service():
+    from adapters.secondary.services.file_reading_services.txt_file_reading_service import TxtFileReadingServiceImpl
+    return TxtFileReadingServiceImpl()
+
+
+def _build_xlsx_file_reading_service():
+    from adapters.secondary.services.file_reading_services.xlsx_file_reading_service import XlsxFileReadingServiceImpl
+    return XlsxFileReadingServiceImpl()
+
+
+def _build_md_file_reading_service():
+    from adapters.secondary.services.file_reading_services.md_file_reading_service import MdFileReadingServiceImpl
+    return MdFileReadingServiceImpl()
+
+
+def _build_pptx_file_reading_service():
+    from adapters.secondary.services.file_reading_services.pptx_file_reading_service import PptxFileReadingServiceImpl
+    return PptxFileReadingServiceImpl()
+
+
+def _build_markdown_chunking_service():
+    from adapters.secondary.services.chunking_services import MarkdownChunkingServiceImpl
+    return MarkdownChunkingServiceImpl()
+
+
+csv_file_reading_service = Singleton(_build_csv_file_reading_service)
+docx_file_reading_service = Singleton(_build_docx_file_reading_service)
+pdf_file_reading_service = Singleton(_build_pdf_file_reading_service)
+txt_file_reading_service = Singleton(_build_txt_file_reading_service)
+xlsx_file_reading_service = Singleton(_build_xlsx_file_reading_service)
+md_file_reading_service = Singleton(_build_md_file_reading_service)
+pptx_file_reading_service = Singleton(_build_pptx_file_reading_service)
+
+markdown_chunking_service = Singleton(_build_markdown_chunking_service)
+
+
+def _build_index_document_port():
+    from core.usecases.index_document import IndexDocumentUseCaseImpl
+    return IndexDocumentUseCaseImpl(
+        vectordb=qdrant_vectordb_repository(),
+        embedding_service=embedding_service(),
+        sparse_embedding_service=sparse_embedding_service(),
+        file_reading_services_mapping=LazyMapping({
+            "csv": csv_file_reading_service,
+            "docx": docx_file_reading_service,
+            "pdf": pdf_file_reading_service,
+            "txt": txt_file_reading_service,
+            "xlsx": xlsx_file_reading_service,
+            "md": md_file_reading_service,
+            "pptx": pptx_file_reading_service,
+        }),
+        chunking_services_mapping=LazyMapping({
+            "csv": csv_file_reading_service,
+            "markdown": markdown_chunking_service,
+            "text": markdown_chunking_service,
+        }),
+        max_concurrent_documents=int(os.environ.get("INDEX_MAX_CONCURRENT_DOCUMENTS", 4)),
+        collection_version_service=collection_version_service(),
+    )
+
+
+def _build_client_managing_service():
+    from adapters.secondary.services.client_managing_services.client_managing_service import ClientManagingServiceImpl
+    return ClientManagingServiceImpl(
+        vector_db_repository=qdrant_vectordb_repository()
+    )
+
+
+def _build_client_manage_port():
+    from core.usecases.client_manage import ClientManageUseCaseImpl
+    return ClientManageUseCaseImpl(
+        client_managing_service=client_managing_service(),
+        collection_version_service=collection_version_service()
+    )
+
+
+index_document_port = Singleton(_build_index_document_port)
+client_managing_service = Singleton(_build_client_managing_service)
+client_manage_port = Singleton(_build_client_manage_port)
@@ -0,0 +1,51 @@
+import threading
+from typing import Callable, Generic, Iterator, MutableMapping, TypeVar
+
+T = TypeVar("T")
+
+
+class Singleton(Generic[T]):
+    """Provider building its instance on first call and returning the same instance afterwards."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self.factory = factory
+        self._instance = None
+        self._lock = threading.RLock()
+
+    def __call__(self) -> T:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self.factory()
+        return self._instance
+
+    def is_built(self) -> bool:
+        """Return whether the instance has been built."""
+        return self._instance is not None
+
+    def reset(self) -> None:
+        """Drop the instance so that the next call builds a new one."""
+        with self._lock:
+            self._instance = None
+
+
+class LazyMapping(MutableMapping[str, T]):
+    """Mapping whose values are built by their provider on first access."""
+
+    def __init__(self, providers: dict[str, Callable[[], T]] = None):
+        self._providers = dict(providers or {})
+
+    def __getitem__(self, key: str) -> T:
+        return self._providers[key]()
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self._providers[key] = lambda: value
+
+    def __delitem__(self, key: str) -> None:
+        del self._providers[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._providers)
+
+    def __len__(self) -> int:
+        return len(self._providers)
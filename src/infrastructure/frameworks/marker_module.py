@@ -1,24 +1,127 @@
-from marker.converters.pdf import PdfConverter
-from marker.models import create_model_dict
-from marker.output import text_from_rendered
+import gc
+import logging
+import os
+import threading
+import time
+from typing import Optional
 
+logger = logging.getLogger(__name__)
 
-class MarkerModule:
-    def __init__(self):
-        self.converter = PdfConverter(
+
+class MarkerModelManager:
+    """
+    Loads the Marker models on first use and unloads them after an idle timeout.
+
+    One manager is shared by all MarkerModule instances of a process, so a worker holds
+    at most one copy of the models however many services use OCR.
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = None):
+        self.idle_timeout = idle_timeout  # Seconds without conversion before the models are unloaded, None to keep them
+        self._converter = None
+        self._lock = threading.Lock()
+        self._active_conversions = 0
+        self._last_used = 0.0
+        self._unload_timer: Optional[threading.Timer] = None
+
+    def acquire(self):
+        """Return the loaded converter, loading the models if needed. Must be paired with release()."""
+        with self._lock:
+            if self._converter is None:
+                self._converter = self._load_converter()
+            self._active_conversions += 1
+            return self._converter
+
+    def release(self) -> None:
+        """Mark the end of a conversion and schedule the models unloading."""
+        with self._lock:
+            self._active_conversions -= 1
+            self._last_used = time.monotonic()
+            if self.idle_timeout is not None and self._active_conversions == 0:
+                self._schedule_unload(self.idle_timeout)
+
+    def is_loaded(self) -> bool:
+        """Return whether the models are currently loaded."""
+        return self._converter is not None
+
+    def unload(self) -> None:
+        """Unload the models now unless a conversion is running."""
+        with self._lock:
+            if self._active_conversions:
+                return
+            self._unload()
+
+    def _load_converter(self):
+        """Load the Marker models. Imported here since importing Marker alone is slow."""
+        from marker.converters.pdf import PdfConverter
+        from marker.models import create_model_dict
+
+        logger.info("Loading Marker models")
+        start = time.monotonic()
+        converter = PdfConverter(
             artifact_dict=create_model_dict(),
         )
+        logger.info(f"Loaded Marker models in {time.monotonic() - start:.1f}s")
+        return converter
+
+    def _schedule_unload(self, delay: float) -> None:
+        """Start a timer unloading the models once idle. Must be called with the lock held."""
+        if self._unload_timer is not None:
+            self._unload_timer.cancel()
+        self._unload_timer = threading.Timer(delay, self._unload_if_idle)
+        self._unload_timer.daemon = True
+        self._unload_timer.start()
+
+    def _unload_if_idle(self) -> None:
+        """Unload the models if no conversion ran during the idle timeout."""
+        with self._lock:
+            if self._active_conversions or self._converter is None:
+                return
+            idle_time = time.monotonic() - self._last_used
+            if idle_time < self.idle_timeout:
+                self._schedule_unload(self.idle_timeout - idle_time)
+                return
+            self._unload()
+
+    def _unload(self) -> None:
+        """Drop the models and free their memory. Must be called with the lock held."""
+        if self._converter is None:
+            return
+        logger.info("Unloading Marker models")
+        self._converter = None
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+
+# Shared by all MarkerModule instances of the process
+marker_model_manager = MarkerModelManager(
+    idle_timeout=float(os.environ["MARKER_IDLE_TIMEOUT"]) if os.environ.get("MARKER_IDLE_TIMEOUT") else None
+)
+
+
+class MarkerModule:
+    def __init__(self, model_manager: Optional[MarkerModelManager] = None):
+        self.model_manager = model_manager or marker_model_manager
 
     def convert_to_markdown(self, file_path: str, **kwargs):
         """
         Process the image using OCR and return the extracted text.
         """
-        # Implement OCR processing logic here
-        # For example, using pytesseract or any other OCR library
+        from marker.output import text_from_rendered
+
         print(f"Converting PDF to markdown: {file_path}")
         if not file_path.endswith(".pdf"):
             raise ValueError("File path must end with .pdf")
 
-        rendered = self.converter(file_path)
+        converter = self.model_manager.acquire()
+        try:
+            rendered = converter(file_path)
+        finally:
+            self.model_manager.release()
         text, _, images = text_from_rendered(rendered)
         return text
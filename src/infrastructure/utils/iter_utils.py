@@ -0,0 +1,31 @@
+import asyncio
+from typing import AsyncIterator, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_EXHAUSTED = object()
+
+
+async def aiter_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Consume a blocking iterator item by item in a worker thread, without blocking the event loop."""
+    while True:
+        item = await asyncio.to_thread(next, iterator, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            return
+        yield item
+
+
+def iter_text_blocks(file_path: str, block_chars: int, encoding: str = "utf-8") -> Iterator[str]:
+    """Read a text file in blocks of whole lines of about block_chars characters."""
+    with open(file_path, "r", encoding=encoding) as file:
+        lines = []
+        size = 0
+        for line in file:
+            lines.append(line)
+            size += len(line)
+            if size >= block_chars:
+                yield "".join(lines)
+                lines = []
+                size = 0
+        if lines:
+            yield "".join(lines)
@@ -0,0 +1,40 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_token_encoding(model_name: str = "cl100k_base"):
+    """Return the tiktoken encoding for a model, or None if it cannot be loaded."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        pass
+    except Exception:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model_name: str = "cl100k_base") -> int:
+    """Count the tokens of a text, falling back to a conservative estimate without tiktoken."""
+    encoding = get_token_encoding(model_name)
+    if encoding is None:
+        return len(text.encode("utf-8")) // 2 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model_name: str = "cl100k_base") -> str:
+    """Truncate a text so that it fits into max_tokens tokens."""
+    encoding = get_token_encoding(model_name)
+    if encoding is None:
+        max_bytes = max(0, (max_tokens - 1) * 2)
+        return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
@@ -4,28 +4,52 @@ import json
 import os
 import re
 import subprocess
-from typing import List
+from typing import Iterator, List
 
 import fitz  # PyMuPDF
 from PIL import Image
 
+def iter_pdf_base64_images(pdf_path, max_pages=None, width=1000, image_format="jpeg", quality=80, max_dpi=150) -> Iterator[str]:
+    """
+    Render the pages of a PDF as base64 data URLs, one page at a time.
+
+    Pages are rendered directly at the target width (never above max_dpi), so that only
+    the current page is held in memory.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        max_pages (int, optional): Maximum number of pages to render.
+        width (int): Maximum width of the rendered images in pixels.
+        image_format (str): One of "jpeg", "webp" or "png".
+        quality (int): Quality of the JPEG and WebP images, from 1 to 100.
+        max_dpi (int): Maximum resolution of the rendered images.
+
+    Yields:
+        str: The data URL of each page image.
+    """
+    with fitz.open(pdf_path) as doc:
+        for i, page in enumerate(doc):
+            if max_pages and i >= max_pages:
+                break
+            scale = min(max_dpi / 72, width / page.rect.width)
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+            if image_format == "jpeg":
+                image_bytes = pix.tobytes("jpeg", jpg_quality=quality)
+            elif image_format == "webp":
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                buffer = io.BytesIO()
+                img.save(buffer, format="WEBP", quality=quality)
+                image_bytes = buffer.getvalue()
+            elif image_format == "png":
+                image_bytes = pix.tobytes("png")
+            else:
+                raise ValueError(f"Unsupported image format: {image_format}")
+            b64 = base64.b64encode(image_bytes).decode("utf-8")
+            yield f"data:image/{image_format};base64,{b64}"
+
+
 def pdf_to_base64_images(pdf_path, max_pages=None, resize_width=1000):
-    doc = fitz.open(pdf_path)
-    base64_images = []
-    for i, page in enumerate(doc):
-        if max_pages and i >= max_pages:
-            break
-        pix = page.get_pixmap(dpi=150)
-        img = Image.open(io.BytesIO(pix.tobytes("png")))
-        # Resize if too large
-        if img.width > resize_width:
-            ratio = resize_width / img.width
-            img = img.resize((resize_width, int(img.height * ratio)))
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-        base64_images.append(f"data:image/png;base64,{b64}")
-    return base64_images
+    return list(iter_pdf_base64_images(pdf_path, max_pages=max_pages, width=resize_width, image_format="png"))
 
 
 def extract_markdown_text(text: str):
@@ -0,0 +1,44 @@
+from typing import List, Sequence
+
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length, leaving zero rows as they are."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def select_mmr(query_vector: Sequence[float], vectors: Sequence[Sequence[float]], k: int, lambda_mult: float = 0.5) -> List[int]:
+    """
+    Select k vectors by maximal marginal relevance, trading relevance to the query for diversity.
+
+    Cosine similarities to the query and between candidates are computed once as matrix products,
+    each of the k greedy steps then updates the penalties of all candidates at once.
+
+    Args:
+        query_vector (Sequence[float]): The query vector.
+        vectors (Sequence[Sequence[float]]): The candidate vectors, best first.
+        k (int): The number of vectors to select.
+        lambda_mult (float): 1 ranks by relevance only, 0 by diversity only.
+
+    Returns:
+        List[int]: The indices of the selected vectors, in selection order.
+    """
+    if len(vectors) == 0 or k <= 0:
+        return []
+    candidates = normalize_rows(np.asarray(vectors, dtype=np.float32))
+    relevance = candidates @ normalize_rows(np.asarray(query_vector, dtype=np.float32))
+    similarities = candidates @ candidates.T
+    available = np.ones(len(candidates), dtype=bool)
+    selected = [int(np.argmax(relevance))]
+    available[selected[0]] = False
+    # Similarity of each candidate to the closest one selected so far
+    redundancy = similarities[selected[0]]
+    while len(selected) < min(k, len(candidates)):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        index = int(np.argmax(np.where(available, scores, -np.inf)))
+        selected.append(index)
+        available[index] = False
+        redundancy = np.maximum(redundancy, similarities[index])
+    return selected
@@ -11,6 +11,7 @@ from adapters.primary.rest.routers.get_read_file_config_router import router as
 from adapters.primary.rest.routers.get_llm_configs_router import router as get_llm_configs_router
 from adapters.primary.rest.routers.index_document_router import router as index_document_router
 from adapters.primary.rest.routers.client_manage_router import router as client_manage_router
+from adapters.primary.rest.routers.cache_stats_router import router as cache_stats_router
 
 app = FastAPI()
 
@@ -50,6 +51,10 @@ app.include_router(
     client_manage_router,
     prefix="/api/v1")
 
+app.include_router(
+    cache_stats_router,
+    prefix="/api/v1")
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8113, reload=False)
     
\ No newline at end of file
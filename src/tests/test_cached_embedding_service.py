@@ -0,0 +1,18 @@
+from unittest.mock import MagicMock
+
+from adapters.secondary.repositories.cache_repositories import InMemoryLRUCacheRepositoryImpl
+from adapters.secondary.services.embedding_services.cached_embedding_service import CachedEmbeddingServiceImpl
+
+
+def test_missed_and_cached_vectors_are_identical():
+    embedding_service = MagicMock()
+    embedding_service.get_model_name.return_value = "text-embedding-3-small"
+    embedding_service.create_embeddings.return_value = [[0.1, 0.2, 0.3]]
+    cached_embedding_service = CachedEmbeddingServiceImpl(embedding_service, InMemoryLRUCacheRepositoryImpl())
+
+    missed_vector = cached_embedding_service.create_embedding("How do I reset my password?")
+    cached_vector = cached_embedding_service.create_embedding("How do I reset my password?")
+
+    assert embedding_service.create_embeddings.call_count == 1
+    assert missed_vector == cached_vector
+    assert missed_vector != [0.1, 0.2, 0.3]  # Rounded to float32
@@ -0,0 +1,51 @@
+from adapters.secondary.services.chunking_services.markdown_chunking_service import MarkdownChunkingServiceImpl
+from core.entities import FileContent, PageContent
+
+
+def build_file_content(pages: list[str]) -> FileContent:
+    return FileContent(
+        file_name="manual.pdf",
+        file_path="/data/manual.pdf",
+        content_format="markdown",
+        page_contents=[PageContent(content=content, page_number=i) for i, content in enumerate(pages, 1)],
+    )
+
+
+def test_chunks_carry_the_number_of_their_page():
+    file_content = build_file_content([
+        "Introduction text before any heading.\n# Setup\nInstall the package.",
+        "Text continuing the setup section.\n# Usage\n" + "Run the command. " * 40,
+    ])
+
+    documents = MarkdownChunkingServiceImpl().chunk(file_content)
+
+    pages = {page.page_number: page.content for page in file_content.page_contents}
+    assert {document.page_number for document in documents} == {1, 2}
+    for document in documents:
+        first_line = document.content.splitlines()[-1].split(". ")[0]
+        assert first_line in pages[document.page_number]
+
+
+def test_leading_chunk_of_a_page_keeps_its_page_number():
+    file_content = build_file_content(["# Title\nFirst page.", "Second page without heading."])
+
+    documents = MarkdownChunkingServiceImpl().chunk(file_content)
+
+    assert [(document.content.splitlines()[-1], document.page_number) for document in documents] == [
+        ("First page.", 1),
+        ("Second page without heading.", 2),
+    ]
+
+
+def test_chunk_ids_are_stable_across_runs_and_follow_the_content():
+    file_content = build_file_content(["# Setup\nInstall the package.", "# Usage\nRun the command."])
+    edited_content = build_file_content(["# Setup\nInstall the package.", "# Usage\nRun the new command."])
+
+    ids = [document.id for document in MarkdownChunkingServiceImpl().chunk(file_content)]
+    same_ids = [document.id for document in MarkdownChunkingServiceImpl().chunk(file_content)]
+    edited_ids = [document.id for document in MarkdownChunkingServiceImpl().chunk(edited_content)]
+
+    assert ids == same_ids
+    assert len(set(ids)) == len(ids)
+    assert edited_ids[0] == ids[0]
+    assert edited_ids[1] != ids[1]
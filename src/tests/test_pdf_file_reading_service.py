@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import retry.api
+from openai import RateLimitError
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+
+from adapters.secondary.services.file_reading_services.pdf_file_reading_service import PdfFileReadingServiceImpl
+from adapters.secondary.services.llm_services.openai_llm_services import OpenAILLMServiceImpl
+from core.entities import LLMConfig, Message
+
+
+def build_rate_limit_error() -> RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return RateLimitError("Rate limit reached", response=httpx.Response(429, request=request), body=None)
+
+
+def build_completion(text: str) -> ChatCompletion:
+    return ChatCompletion(
+        id="completion",
+        created=0,
+        model="gpt-4.1-mini",
+        object="chat.completion",
+        choices=[Choice(index=0, finish_reason="stop", message=ChatCompletionMessage(role="assistant", content=text))],
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(retry.api.time, "sleep", lambda seconds: None)
+
+
+def test_chat_with_retry_retries_rate_limit_errors():
+    client = MagicMock()
+    client.chat.completions.create.side_effect = [build_rate_limit_error(), build_completion("# Page 1")]
+    service = PdfFileReadingServiceImpl(OpenAILLMServiceImpl(client=client, async_client=MagicMock()), marker=MagicMock())
+
+    completion = service._chat_with_retry(LLMConfig(), [Message(role="user", content="Convert")], max_retries=3)
+
+    assert completion.text == "# Page 1"
+    assert client.chat.completions.create.call_count == 2
+
+
+def test_chat_with_retry_gives_up_after_max_retries():
+    client = MagicMock()
+    client.chat.completions.create.side_effect = build_rate_limit_error()
+    service = PdfFileReadingServiceImpl(OpenAILLMServiceImpl(client=client, async_client=MagicMock()), marker=MagicMock())
+
+    with pytest.raises(RateLimitError):
+        service._chat_with_retry(LLMConfig(), [Message(role="user", content="Convert")], max_retries=2)
+
+    assert client.chat.completions.create.call_count == 3
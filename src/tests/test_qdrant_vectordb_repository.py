@@ -0,0 +1,34 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import QdrantClient
+
+from adapters.secondary.repositories.vectordb_repositories.qdrant_vectordb_repository import QdrantVectorDBRepositoryImpl
+from core.entities import Client, DocumentWithVector, SearchFilters, SearchQueryWithVector
+
+CLIENT = Client(id="client")
+
+
+def build_repository() -> QdrantVectorDBRepositoryImpl:
+    embedding_service = MagicMock()
+    embedding_service.get_embedding_dimension.return_value = 2
+    # The local mode of qdrant_client does not support concurrent writes
+    return QdrantVectorDBRepositoryImpl(embedding_service, QdrantClient(":memory:"), "documents", max_in_flight_upserts=1)
+
+
+@pytest.mark.filterwarnings("ignore:Payload indexes have no effect")
+def test_page_range_filter_keeps_the_pages_in_range():
+    repository = build_repository()
+    repository.upsert_documents(CLIENT, [
+        DocumentWithVector(
+            id=str(uuid.UUID(int=page_number)), content=f"page {page_number}", file_name="manual.pdf",
+            file_path="/data/manual.pdf", page_number=page_number, vector=[1.0, 0.1 * page_number],
+        )
+        for page_number in range(1, 6)
+    ])
+    search_query = SearchQueryWithVector(text="manual", vector=[1.0, 0.0], filters=SearchFilters(page_from=2, page_to=4))
+
+    documents = repository.retrieve_documents(CLIENT, search_query, limit=10)
+
+    assert sorted(document.page_number for document in documents) == [2, 3, 4]
@@ -0,0 +1,68 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from adapters.secondary.repositories.cache_repositories import InMemoryLRUCacheRepositoryImpl
+from adapters.secondary.services.answer_cache_services import SemanticAnswerCacheServiceImpl
+from adapters.secondary.services.collection_version_services import CacheCollectionVersionServiceImpl
+from core.entities import Client, LLMConfig, Message, RagConfig, RagResponse
+from core.usecases.cached_generate_response import CachedGenerateResponseUseCaseImpl
+
+CLIENT = Client(id="client")
+RAG_CONFIG = RagConfig(llm_config=LLMConfig())
+
+
+def build_answer_cache_service() -> SemanticAnswerCacheServiceImpl:
+    cache_repository = InMemoryLRUCacheRepositoryImpl()
+    return SemanticAnswerCacheServiceImpl(cache_repository, MagicMock(), CacheCollectionVersionServiceImpl(cache_repository))
+
+
+def build_messages() -> list[Message]:
+    return [Message(role="user", content="How do I reset my password?")]
+
+
+def test_answer_is_cached_under_the_version_it_was_looked_up_in():
+    answer_cache_service = build_answer_cache_service()
+    version_service = answer_cache_service.collection_version_service
+
+    cached_response, version = answer_cache_service.get_answer(build_messages(), CLIENT, RAG_CONFIG)
+    version_service.bump_version(CLIENT.id)  # Documents indexed while the answer is generated
+    answer_cache_service.set_answer(build_messages(), CLIENT, RAG_CONFIG, RagResponse(answer="Open the settings."), version)
+
+    assert cached_response is None
+    assert answer_cache_service.get_answer(build_messages(), CLIENT, RAG_CONFIG)[0] is None
+
+
+def test_use_case_does_not_cache_an_answer_generated_during_a_reindex():
+    answer_cache_service = build_answer_cache_service()
+    version_service = answer_cache_service.collection_version_service
+    generate_response_port = MagicMock()
+
+    def generate_response(messages, client, rag_config):
+        version_service.bump_version(client.id)
+        return RagResponse(answer="Open the settings.")
+
+    generate_response_port.generate_response.side_effect = generate_response
+    use_case = CachedGenerateResponseUseCaseImpl(generate_response_port, answer_cache_service)
+
+    use_case.generate_response(build_messages(), CLIENT, RAG_CONFIG)
+    use_case.generate_response(build_messages(), CLIENT, RAG_CONFIG)
+
+    assert generate_response_port.generate_response.call_count == 2
+
+
+def test_async_answer_is_cached_under_the_version_it_was_looked_up_in():
+    answer_cache_service = build_answer_cache_service()
+    version_service = answer_cache_service.collection_version_service
+
+    async def run():
+        _, version = await answer_cache_service.aget_answer(build_messages(), CLIENT, RAG_CONFIG)
+        await answer_cache_service.aset_answer(build_messages(), CLIENT, RAG_CONFIG, RagResponse(answer="Open the settings."), version)
+        cached_response, _ = await answer_cache_service.aget_answer(build_messages(), CLIENT, RAG_CONFIG)
+        await version_service.abump_version(CLIENT.id)
+        stale_response, _ = await answer_cache_service.aget_answer(build_messages(), CLIENT, RAG_CONFIG)
+        return cached_response, stale_response
+
+    cached_response, stale_response = asyncio.run(run())
+
+    assert cached_response.answer == "Open the settings."
+    assert stale_response is None
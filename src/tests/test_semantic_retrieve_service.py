@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+from adapters.secondary.repositories.cache_repositories import InMemoryLRUCacheRepositoryImpl
+from adapters.secondary.services.collection_version_services import CacheCollectionVersionServiceImpl
+from adapters.secondary.services.retrieve_services.semantic_retrieve_services import SemanticRetrieveServiceImpl
+from core.entities import Client, Document, SearchQueryWithVector
+
+CLIENT = Client(id="client")
+
+
+def build_retrieve_service() -> SemanticRetrieveServiceImpl:
+    vectordb_repository = MagicMock()
+    vectordb_repository.retrieve_documents.return_value = [Document(
+        id="1", content="Install the package.", file_name="manual.pdf", file_path="/data/manual.pdf", page_number=1
+    )]
+    cache_repository = InMemoryLRUCacheRepositoryImpl()
+    return SemanticRetrieveServiceImpl(vectordb_repository, cache_repository, CacheCollectionVersionServiceImpl(cache_repository))
+
+
+def test_repeated_search_is_answered_from_the_cache():
+    retrieve_service = build_retrieve_service()
+    search_query = SearchQueryWithVector(text="install", vector=[1.0, 0.0])
+
+    documents = retrieve_service.retrieve(search_query, CLIENT)
+    cached_documents = retrieve_service.retrieve(search_query, CLIENT)
+
+    assert cached_documents == documents
+    assert retrieve_service.vectordb_repository.retrieve_documents.call_count == 1
+
+
+def test_new_collection_version_invalidates_the_cached_results():
+    retrieve_service = build_retrieve_service()
+    search_query = SearchQueryWithVector(text="install", vector=[1.0, 0.0])
+
+    retrieve_service.retrieve(search_query, CLIENT)
+    retrieve_service.collection_version_service.bump_version(CLIENT.id)  # Documents indexed
+    retrieve_service.retrieve(search_query, CLIENT)
+
+    assert retrieve_service.vectordb_repository.retrieve_documents.call_count == 2
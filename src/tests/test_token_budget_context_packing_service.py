@@ -0,0 +1,53 @@
+from adapters.secondary.services.context_packing_services.token_budget_context_packing_service import (
+    ALREADY_SENT,
+    TokenBudgetContextPackingServiceImpl,
+)
+from core.entities import Document
+from infrastructure.utils.tokenizer import count_tokens
+
+MODEL_NAME = "gpt-4.1-mini"
+
+
+def build_document(id: str, content: str, page_number: int) -> Document:
+    return Document(id=id, content=content, file_name="manual.pdf", file_path="/data/manual.pdf", page_number=page_number)
+
+
+def test_chunks_of_a_page_are_merged_under_one_source_line():
+    documents = [
+        build_document("1", "# Setup\nInstall the package.", 1),
+        build_document("2", "# Setup\nConfigure the package.", 1),
+        build_document("3", "# Usage\nRun the command.", 2),
+    ]
+
+    contexts, packed = TokenBudgetContextPackingServiceImpl().pack([documents], set(), 1000, MODEL_NAME)
+
+    assert contexts == [
+        "[manual.pdf, page 1]\n# Setup\nInstall the package.\n\nConfigure the package.\n\n"
+        "[manual.pdf, page 2]\n# Usage\nRun the command."
+    ]
+    assert [document.id for document in packed] == ["1", "2", "3"]
+
+
+def test_packed_contexts_stay_within_the_token_budget():
+    content = " ".join(["word"] * 200)
+    documents = [build_document(str(i), content, i) for i in range(1, 4)]
+    token_budget = count_tokens(f"[manual.pdf, page 1]\n{content}", MODEL_NAME) + 100
+
+    contexts, packed = TokenBudgetContextPackingServiceImpl(min_block_tokens=16).pack([documents], set(), token_budget, MODEL_NAME)
+
+    first_block, second_block = contexts[0].split("\n\n")
+    assert count_tokens(first_block, MODEL_NAME) + count_tokens(second_block, MODEL_NAME) <= token_budget
+    assert second_block.startswith("[manual.pdf, page 2]") and len(second_block) < len(first_block)
+    assert [document.id for document in packed] == ["1", "2"]  # The second block is truncated, the third dropped
+
+
+def test_documents_already_sent_are_skipped():
+    documents = [build_document("1", "Install the package.", 1)]
+    sent_ids = set()
+    packing_service = TokenBudgetContextPackingServiceImpl()
+
+    packing_service.pack([documents], sent_ids, 1000, MODEL_NAME)
+    contexts, packed = packing_service.pack([documents], sent_ids, 1000, MODEL_NAME)
+
+    assert contexts == [ALREADY_SENT]
+    assert packed == []
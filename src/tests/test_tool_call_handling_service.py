@@ -0,0 +1,19 @@
+from adapters.secondary.services.tool_call_handling_services.tool_call_handling_service import ToolCallHandlingServiceImpl
+from core.entities import Tool, ToolCall
+
+
+def build_tool() -> Tool:
+    return Tool(name="search", description="Search the documents", function=lambda query: f"results for {query}")
+
+
+def test_malformed_tool_call_fails_only_its_call_in_parallel():
+    tool_calls = [
+        ToolCall(id="1", name="search", arguments={"query": "invoices"}),
+        ToolCall(id="2", name="search", arguments=None),
+    ]
+
+    responses = ToolCallHandlingServiceImpl().handle_tool_calls(tool_calls, [build_tool()], parallel=True)
+
+    assert [response.id for response in responses] == ["1", "2"]
+    assert responses[0].tool_response == "results for invoices"
+    assert responses[1].tool_response.startswith("Error: ")